@@ -1,734 +1,3209 @@
-from typing import List, Tuple, Dict, Optional
+from typing import Any, List, Tuple, Dict, Optional, Iterable, Iterator, NamedTuple, Set
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import MutableMapping
+from itertools import compress
+from operator import itemgetter
+import csv
+import json
+import mmap
+import struct
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 import math
+import os
+import random
+
+try:
+    import numpy as np  # Opcional: acelera a matriz densa e o Floyd-Warshall
+except ImportError:
+    np = None
+
+# Tolerância relativa para comparar custos somados em ordens diferentes
+COST_EPSILON = 1e-9
+
+
+def _normalize_name(name: str) -> str:
+    """Chave do índice de nomes: sem espaços nas pontas, sem acentos e sem caixa"""
+    text = str(name).strip()
+    if text.isascii():
+        return text.lower()  # Caminho rápido: nada a decompor
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def _same_cost(a: float, b: float) -> bool:
+    """Compara dois custos tolerando o erro de arredondamento das somas"""
+    if a == b:
+        return True
+    if math.isinf(a) or math.isinf(b):
+        return False
+    return abs(a - b) <= COST_EPSILON * max(1.0, abs(a), abs(b))
+
+
+# ========================================
+# TABELA COLUNAR DE VÉRTICES
+# ========================================
+
+_LIVE = 1  # Slot ocupado (0 = lápide de um vértice removido)
+_COLUMN_FLAGS = {'nome': 2, 'magnitude': 4, 'constelacao': 8, 'distancia_ua': 16, 'coordenadas': 32}
+_MISSING = object()
+_NAN = float('nan')
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class MagnitudeIndex:
+    """
+    Vértices em ordem crescente de magnitude (empates por índice), em dois
+    arrays paralelos mantidos com bisect a cada escrita na coluna de magnitudes:
+    mais brilhante e mais fraca em O(1), faixa [low, high] em O(log n + k) e os
+    k mais brilhantes em O(k). Inserir e remover custam a busca binária mais o
+    deslocamento contíguo do array (memmove).
+    """
+
+    def __init__(self, magnitude: array, live: Optional[array] = None):
+        order = [i for i, m in enumerate(magnitude) if m == m and (live is None or live[i] & _LIVE)]
+        order.sort(key=magnitude.__getitem__)  # sort estável: empates ficam por índice
+        self.magnitudes = array('d', [magnitude[i] for i in order])
+        self.vertices = array('q', order)
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+    def _position(self, magnitude: float, index: int) -> int:
+        lo = bisect_left(self.magnitudes, magnitude)
+        hi = bisect_right(self.magnitudes, magnitude, lo)
+        return bisect_left(self.vertices, index, lo, hi)
+
+    def add(self, index: int, magnitude: float) -> None:
+        position = self._position(magnitude, index)
+        self.magnitudes.insert(position, magnitude)
+        self.vertices.insert(position, index)
+
+    def discard(self, index: int, magnitude: float) -> None:
+        position = self._position(magnitude, index)
+        if position < len(self.vertices) and self.vertices[position] == index:
+            del self.magnitudes[position]
+            del self.vertices[position]
+
+    def brightest(self) -> Optional[Tuple[int, float]]:
+        """(vértice, magnitude) de menor magnitude, ou None"""
+        return (self.vertices[0], self.magnitudes[0]) if self.vertices else None
+
+    def faintest(self) -> Optional[Tuple[int, float]]:
+        """(vértice, magnitude) de maior magnitude (o de menor índice no empate), ou None"""
+        if not self.vertices:
+            return None
+        position = bisect_left(self.magnitudes, self.magnitudes[-1])
+        return self.vertices[position], self.magnitudes[position]
+
+    def between(self, low: float, high: float) -> List[int]:
+        """Vértices com low <= magnitude <= high, do mais brilhante ao mais fraco"""
+        lo = bisect_left(self.magnitudes, low)
+        hi = bisect_right(self.magnitudes, high, lo)
+        return self.vertices[lo:hi].tolist()
+
+    def top(self, k: int) -> List[int]:
+        """Os k vértices mais brilhantes, em ordem"""
+        return self.vertices[:max(k, 0)].tolist()
+
+
+class VertexView(MutableMapping):
+    """
+    Visão dict-like de um vértice da VertexTable: leitura e escrita vão direto
+    às colunas, então vertex['nome'], vertex.get(...) e vertex.update(...)
+    continuam funcionando. A visão aponta para o slot, não para uma cópia:
+    use dict(vertex) para guardar os dados além de uma remoção.
+    """
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'VertexTable', index: int):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key: str):
+        return self._table.attribute(self._index, key)
+
+    def get(self, key: str, default=None):
+        return self._table.attribute(self._index, key, default)
+
+    def __setitem__(self, key: str, value) -> None:
+        self._table.set_attribute(self._index, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._table.delete_attribute(self._index, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._table.attribute_keys(self._index)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class VertexTable:
+    """
+    Vértices em colunas em vez de um dict por vértice: nomes numa lista (já são
+    únicos pelo índice de nomes; só as constelações, que se repetem, são
+    internadas), magnitude e distância ao Sol em array('d') (NaN = ausente), constelação
+    codificada em dicionário (array('i') de códigos em groups, -1 = nenhuma) e
+    coordenadas em array('d') de 3 posições. As colunas de distância e de
+    coordenadas só são alocadas quando algum vértice as usa. Atributos fora
+    dessas colunas (ou valores que não cabem nelas) ficam num dicionário
+    esparso por vértice.
+    table[i] devolve uma VertexView, ou None para um slot removido.
+    """
+    COLUMNS = tuple(_COLUMN_FLAGS)
+
+    def __init__(self):
+        self.names: List[Optional[str]] = []
+        self.magnitude = array('d')
+        self.distance: Optional[array] = None
+        self.coords: Optional[array] = None
+        self.constellation = array('i')
+        self.groups: List[str] = []
+        self._group_codes: Dict[str, int] = {}
+        self.flags = array('B')  # _LIVE mais um bit por coluna preenchida
+        self.extras: Dict[int, dict] = {}
+        self._magnitude_index: Optional[MagnitudeIndex] = None  # Montado na primeira consulta
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def __getitem__(self, index: int) -> Optional[VertexView]:
+        if index < 0:
+            index += len(self.flags)
+        if not 0 <= index < len(self.flags):
+            raise IndexError("índice de vértice fora da tabela")
+        return VertexView(self, index) if self.flags[index] & _LIVE else None
+
+    def __iter__(self) -> Iterator[Optional[VertexView]]:
+        for i in range(len(self.flags)):
+            yield self[i]
+
+    def __eq__(self, other) -> bool:
+        """Compara slot a slot, como a antiga lista de dicts (aceita uma lista)"""
+        if not isinstance(other, (VertexTable, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __setitem__(self, index: int, data: Optional[dict]) -> None:
+        """Grava os dados de data no slot (None transforma o slot em lápide)"""
+        self._clear(index)
+        if data is not None:
+            self._write(index, data)
+
+    def append(self, data: Optional[dict]) -> None:
+        self.names.append(None)
+        self.magnitude.append(_NAN)
+        if self.distance is not None:
+            self.distance.append(_NAN)
+        if self.coords is not None:
+            self.coords.extend((_NAN, _NAN, _NAN))
+        self.constellation.append(-1)
+        self.flags.append(0)
+        if data is not None:
+            self._write(len(self.flags) - 1, data)
+
+    def append_record(self, name: str, magnitude: Optional[float], group: Optional[str],
+                      distance: Optional[float] = None,
+                      coords: Optional[Tuple[float, float, float]] = None) -> None:
+        """append() sem passar por um dict, com os valores já convertidos (importação em lote)"""
+        flags = _LIVE | _COLUMN_FLAGS['nome'] | _COLUMN_FLAGS['magnitude'] | _COLUMN_FLAGS['constelacao']
+        self.names.append(name)
+        self.magnitude.append(_NAN if magnitude is None else magnitude)
+        if magnitude is not None and self._magnitude_index is not None:
+            self._magnitude_index.add(len(self.flags), magnitude)
+        self.constellation.append(-1 if group is None else self.group_code(group))
+        if distance is not None or self.distance is not None:
+            self._column('distancia_ua').append(_NAN if distance is None else distance)
+            if distance is not None:
+                flags |= _COLUMN_FLAGS['distancia_ua']
+        if coords is not None or self.coords is not None:
+            self._column('coordenadas').extend((_NAN, _NAN, _NAN) if coords is None else coords)
+            if coords is not None:
+                flags |= _COLUMN_FLAGS['coordenadas']
+        self.flags.append(flags)
+
+    def is_live(self, index: int) -> bool:
+        return 0 <= index < len(self.flags) and bool(self.flags[index] & _LIVE)
+
+    def magnitude_index(self) -> MagnitudeIndex:
+        """Índice ordenado da coluna de magnitudes (montado uma vez, depois mantido)"""
+        if self._magnitude_index is None:
+            self._magnitude_index = MagnitudeIndex(self.magnitude, self.flags)
+        return self._magnitude_index
+
+    def _set_magnitude(self, index: int, value: float) -> None:
+        """Grava na coluna de magnitudes mantendo o índice ordenado, se já montado"""
+        old = self.magnitude[index]
+        self.magnitude[index] = value
+        if self._magnitude_index is not None and old != value:
+            if old == old:
+                self._magnitude_index.discard(index, old)
+            if value == value:
+                self._magnitude_index.add(index, value)
+
+    def _column(self, key: str) -> array:
+        """Coluna opcional de distância ou coordenadas, alocada (com NaN) no primeiro uso"""
+        if key == 'distancia_ua':
+            if self.distance is None:
+                self.distance = array('d', [_NAN]) * len(self.flags)
+            return self.distance
+        if self.coords is None:
+            self.coords = array('d', [_NAN]) * (3 * len(self.flags))
+        return self.coords
+
+    def group_code(self, group: str) -> int:
+        """Código da constelação no dicionário (cria um novo se preciso)"""
+        code = self._group_codes.get(group)
+        if code is None:
+            code = self._group_codes[group] = len(self.groups)
+            self.groups.append(sys.intern(group))
+        return code
+
+    def _write(self, index: int, data: dict) -> None:
+        self.flags[index] = _LIVE
+        for key, value in data.items():
+            self.set_attribute(index, key, value)
+
+    def _clear(self, index: int) -> None:
+        for key in self.COLUMNS:
+            self._reset(index, key)
+        self.flags[index] = 0
+        self.extras.pop(index, None)
+
+    def _reset(self, index: int, key: str) -> None:
+        """Volta a coluna key do slot para o valor de ausente"""
+        if key == 'nome':
+            self.names[index] = None
+        elif key == 'magnitude':
+            self._set_magnitude(index, _NAN)
+        elif key == 'distancia_ua':
+            if self.distance is not None:
+                self.distance[index] = _NAN
+        elif key == 'constelacao':
+            self.constellation[index] = -1
+        elif self.coords is not None:
+            self.coords[3 * index:3 * index + 3] = array('d', (_NAN, _NAN, _NAN))
+
+    def _store(self, index: int, key: str, value) -> bool:
+        """Grava value na coluna key; False se o valor não cabe na coluna"""
+        if key == 'nome':
+            if not isinstance(value, str):
+                return False
+            self.names[index] = value
+        elif key in ('magnitude', 'distancia_ua'):
+            if value is not None and not _is_number(value):
+                return False
+            value = _NAN if value is None else float(value)
+            if key == 'magnitude':
+                self._set_magnitude(index, value)
+            else:
+                self._column(key)[index] = value
+        elif key == 'constelacao':
+            if value is not None and not isinstance(value, str):
+                return False
+            self.constellation[index] = -1 if value is None else self.group_code(value)
+        else:
+            if value is None:
+                position = (_NAN, _NAN, _NAN)
+            elif isinstance(value, (tuple, list)) and len(value) == 3 and all(_is_number(c) for c in value):
+                position = value
+            else:
+                return False
+            self._column(key)[3 * index:3 * index + 3] = array('d', position)
+        return True
+
+    def set_attribute(self, index: int, key: str, value) -> None:
+        flag = _COLUMN_FLAGS.get(key)
+        if flag is not None and self._store(index, key, value):
+            self.flags[index] |= flag
+            extras = self.extras.get(index)
+            if extras is not None:
+                extras.pop(key, None)
+                if not extras:
+                    del self.extras[index]
+            return
+        if flag is not None and self.flags[index] & flag:
+            self._reset(index, key)
+            self.flags[index] &= ~flag
+        self.extras.setdefault(index, {})[key] = value
+
+    def attribute(self, index: int, key: str, default=_MISSING):
+        """Valor de key no vértice; sem default, um atributo ausente gera KeyError"""
+        flag = _COLUMN_FLAGS.get(key)
+        if flag is not None and self.flags[index] & flag:
+            if key == 'nome':
+                return self.names[index]
+            if key == 'magnitude' or key == 'distancia_ua':
+                value = (self.magnitude if key == 'magnitude' else self.distance)[index]
+                return None if value != value else value
+            if key == 'constelacao':
+                code = self.constellation[index]
+                return self.groups[code] if code >= 0 else None
+            position = tuple(self.coords[3 * index:3 * index + 3])
+            return None if position[0] != position[0] else position
+        extras = self.extras.get(index)
+        if extras is not None and key in extras:
+            return extras[key]
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def delete_attribute(self, index: int, key: str) -> None:
+        flag = _COLUMN_FLAGS.get(key)
+        if flag is not None and self.flags[index] & flag:
+            self._reset(index, key)
+            self.flags[index] &= ~flag
+            return
+        extras = self.extras.get(index)
+        if extras is None or key not in extras:
+            raise KeyError(key)
+        del extras[key]
+        if not extras:
+            del self.extras[index]
+
+    def attribute_keys(self, index: int) -> Iterator[str]:
+        flags = self.flags[index]
+        for key, flag in _COLUMN_FLAGS.items():
+            if flags & flag:
+                yield key
+        yield from self.extras.get(index, ())
+
+    def count_constellations(self, missing: str) -> Dict[str, int]:
+        """Vértices vivos por constelação, contados sobre os códigos (sem montar dicts)"""
+        by_code = [0] * (len(self.groups) + 1)  # Última posição: código -1 (nenhuma)
+        others = []
+        has_group = _COLUMN_FLAGS['constelacao']
+        for i, flags in enumerate(self.flags):
+            if flags & has_group:
+                by_code[self.constellation[i]] += 1
+            elif flags & _LIVE:
+                others.append(self.attribute(i, 'constelacao', missing))
+        counts: Dict[str, int] = {}
+        for code, count in enumerate(by_code):
+            if count:
+                group = self.groups[code] if code < len(self.groups) else missing
+                counts[group] = counts.get(group, 0) + count
+        for group in others:
+            counts[group] = counts.get(group, 0) + 1
+        return counts
+
+    def compact(self, keep: List[int]) -> None:
+        """Mantém apenas os slots de keep, nessa ordem (o dicionário de constelações é preservado)"""
+        self.names = [self.names[i] for i in keep]
+        self.magnitude = array('d', [self.magnitude[i] for i in keep])
+        if self.distance is not None:
+            self.distance = array('d', [self.distance[i] for i in keep])
+        if self.coords is not None:
+            self.coords = array('d', [c for i in keep for c in self.coords[3 * i:3 * i + 3]])
+        self.constellation = array('i', [self.constellation[i] for i in keep])
+        self.flags = array('B', [self.flags[i] for i in keep])
+        self.extras = {new: self.extras[old] for new, old in enumerate(keep) if old in self.extras}
+        self._magnitude_index = None  # Índices mudaram: remontado na próxima consulta
+
+
+# ========================================
+# BACKENDS DE ARMAZENAMENTO DAS ARESTAS
+# ========================================
+
+class DenseStorage:
+    """
+    Matriz de adjacência densa num único array('d') contíguo, O(V²) de memória.
+    A linha i ocupa data[i*capacity : i*capacity + size]; a capacidade dobra
+    quando enche, então add_vertex custa O(V) amortizado (sem realocar cada linha).
+    Fora do tamanho lógico o buffer fica sempre zerado.
+    """
+    kind = 'dense'
+
+    def __init__(self):
+        self.size = 0
+        self.capacity = 0
+        self.data = array('d')
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self, capacity: int) -> None:
+        """Realoca o buffer com a nova capacidade, copiando linha a linha"""
+        data = array('d', [0.0]) * (capacity * capacity)
+        old, n = self.capacity, self.size
+        for i in range(n):
+            data[i * capacity:i * capacity + n] = self.data[i * old:i * old + n]
+        self.data = data
+        self.capacity = capacity
+
+    def add_vertex(self) -> None:
+        """Acrescenta uma linha e uma coluna zeradas (dobra a capacidade se preciso)"""
+        if self.size == self.capacity:
+            self._grow(max(4, 2 * self.capacity))
+        self.size += 1
+
+    def clear_vertex(self, index: int) -> None:
+        """Zera a linha e a coluna do vértice (O(V), sem deslocar os demais)"""
+        n, cap = self.size, self.capacity
+        zeros = array('d', [0.0]) * n
+        self.data[index * cap:index * cap + n] = zeros
+        self.data[index:n * cap:cap] = zeros
+
+    def compact(self, keep: List[int], mapping: List[int]) -> None:
+        """Mantém apenas as linhas e colunas de keep, nessa ordem (capacidade justa)"""
+        m, cap = len(keep), self.capacity
+        data = array('d', [0.0]) * (m * m)
+        for new_i, i in enumerate(keep):
+            row = self.data[i * cap:i * cap + self.size]
+            data[new_i * m:(new_i + 1) * m] = array('d', [row[j] for j in keep])
+        self.data = data
+        self.size = self.capacity = m
+
+    def get(self, i: int, j: int) -> float:
+        return self.data[i * self.capacity + j]
+
+    def set(self, i: int, j: int, weight: float) -> None:
+        self.data[i * self.capacity + j] = weight
+
+    def delete(self, i: int, j: int) -> None:
+        self.data[i * self.capacity + j] = 0.0
+
+    def neighbors(self, i: int) -> Iterator[Tuple[int, float]]:
+        """Percorre a linha inteira devolvendo (vizinho, peso) das entradas não nulas"""
+        base = i * self.capacity
+        row = self.data[base:base + self.size]
+        return iter([(j, row[j]) for j in compress(range(self.size), row)])
+
+    def in_neighbors(self, j: int) -> Iterator[Tuple[int, float]]:
+        """Percorre a coluna j (fatia com passo capacity) devolvendo (origem, peso)"""
+        column = self.data[j:self.size * self.capacity:self.capacity]
+        return iter([(i, column[i]) for i in compress(range(self.size), column)])
+
+    def to_matrix(self) -> List[List[float]]:
+        """Cópia em lista de listas (apenas para exibição e conversões)"""
+        n, cap = self.size, self.capacity
+        return [self.data[i * cap:i * cap + n].tolist() for i in range(n)]
+
+
+class SparseStorage:
+    """Lista de adjacência esparsa (um dicionário por vértice), O(V + E) de memória"""
+    kind = 'sparse'
+
+    def __init__(self):
+        self.adj: List[Dict[int, float]] = []
+        self.radj: List[Dict[int, float]] = []  # arestas de entrada (adjacência reversa)
+
+    def __len__(self) -> int:
+        return len(self.adj)
+
+    def add_vertex(self) -> None:
+        self.adj.append({})
+        self.radj.append({})
+
+    def clear_vertex(self, index: int) -> None:
+        """Desliga o vértice dos vizinhos em O(grau) usando adj e radj"""
+        for j in self.adj[index]:
+            self.radj[j].pop(index, None)
+        for i in self.radj[index]:
+            self.adj[i].pop(index, None)
+        self.adj[index] = {}
+        self.radj[index] = {}
+
+    def compact(self, keep: List[int], mapping: List[int]) -> None:
+        """Renumera as listas pelo mapeamento antigo -> novo (vértices fora de keep já estão isolados)"""
+        self.adj = [{mapping[j]: w for j, w in self.adj[i].items()} for i in keep]
+        self.rebuild_reverse()
+
+    def rebuild_reverse(self) -> None:
+        """Recalcula a adjacência reversa a partir de adj"""
+        self.radj = [{} for _ in self.adj]
+        for i, row in enumerate(self.adj):
+            for j, weight in row.items():
+                self.radj[j][i] = weight
+
+    def get(self, i: int, j: int) -> float:
+        return self.adj[i].get(j, 0.0)
+
+    def set(self, i: int, j: int, weight: float) -> None:
+        if weight == 0:
+            self.delete(i, j)  # peso 0 equivale a "sem aresta", como na matriz
+        else:
+            self.adj[i][j] = weight
+            self.radj[j][i] = weight
+
+    def delete(self, i: int, j: int) -> None:
+        self.adj[i].pop(j, None)
+        self.radj[j].pop(i, None)
+
+    def neighbors(self, i: int) -> Iterator[Tuple[int, float]]:
+        return iter(self.adj[i].items())
+
+    def in_neighbors(self, j: int) -> Iterator[Tuple[int, float]]:
+        return iter(self.radj[j].items())
+
+    def to_matrix(self) -> List[List[float]]:
+        """Materializa uma cópia densa (apenas para exibição)"""
+        n = len(self.adj)
+        matrix = [[0.0] * n for _ in range(n)]
+        for i, row in enumerate(self.adj):
+            for j, weight in row.items():
+                matrix[i][j] = weight
+        return matrix
+
+
+class CSRStorage:
+    """
+    Snapshot imutável em formato CSR (compressed sparse row):
+    os vizinhos de i são indices[offsets[i]:offsets[i+1]], em ordem crescente,
+    com os pesos correspondentes em weights.
+    """
+    kind = 'csr'
+
+    def __init__(self, offsets: array, indices: array, weights: array):
+        self.offsets = offsets
+        self.indices = indices
+        self.weights = weights
+        self._transpose = None  # CSR das arestas de entrada, montado sob demanda
+
+    @classmethod
+    def from_storage(cls, storage) -> 'CSRStorage':
+        """Congela qualquer outro backend em arrays contíguos"""
+        offsets = array('q', [0])
+        indices = array('q')
+        weights = array('d')
+        for i in range(len(storage)):
+            for j, weight in sorted(storage.neighbors(i)):
+                indices.append(j)
+                weights.append(weight)
+            offsets.append(len(indices))
+        return cls(offsets, indices, weights)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def get(self, i: int, j: int) -> float:
+        """Busca binária dentro da linha i"""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        pos = bisect_left(self.indices, j, lo, hi)
+        if pos < hi and self.indices[pos] == j:
+            return self.weights[pos]
+        return 0.0
+
+    def neighbors(self, i: int) -> Iterator[Tuple[int, float]]:
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return zip(self.indices[lo:hi], self.weights[lo:hi])
+
+    def in_neighbors(self, j: int) -> Iterator[Tuple[int, float]]:
+        if self._transpose is None:
+            self._transpose = self._build_transpose()
+        return self._transpose.neighbors(j)
+
+    def _build_transpose(self) -> 'CSRStorage':
+        """Transpõe o snapshot com uma contagem por coluna (O(V + E))"""
+        n = len(self)
+        counts = array('q', [0]) * (n + 1)
+        for j in self.indices:
+            counts[j + 1] += 1
+        for j in range(n):
+            counts[j + 1] += counts[j]
+        
+        cursor = array('q', counts[:n])
+        indices = array('q', [0]) * len(self.indices)
+        weights = array('d', [0.0]) * len(self.weights)
+        for i in range(n):
+            for k in range(self.offsets[i], self.offsets[i + 1]):
+                j = self.indices[k]
+                indices[cursor[j]] = i
+                weights[cursor[j]] = self.weights[k]
+                cursor[j] += 1
+        return CSRStorage(counts, indices, weights)
+
+    def thaw(self, kind: str = 'sparse'):
+        """Converte de volta para um backend mutável (por padrão, lista de adjacência)"""
+        if kind == 'sparse':
+            storage = SparseStorage()
+            for i in range(len(self)):
+                storage.adj.append(dict(self.neighbors(i)))
+            storage.rebuild_reverse()
+            return storage
+        
+        storage = STORAGE_BACKENDS[kind]()
+        for _ in range(len(self)):
+            storage.add_vertex()
+        for i in range(len(self)):
+            for j, weight in self.neighbors(i):
+                storage.set(i, j, weight)
+        return storage
+
+    def to_matrix(self) -> List[List[float]]:
+        n = len(self)
+        matrix = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            for j, weight in self.neighbors(i):
+                matrix[i][j] = weight
+        return matrix
+
+
+class NumpyDenseStorage:
+    """
+    Matriz de adjacência densa em um único ndarray float64 (requer NumPy).
+    Como no DenseStorage, o buffer tem capacidade que dobra quando enche e
+    matrix é a visão size x size dele.
+    """
+    kind = 'numpy'
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("O backend 'numpy' requer o pacote NumPy instalado.")
+        self._buffer = np.zeros((0, 0))
+        self.matrix = self._buffer
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def add_vertex(self) -> None:
+        n = self.matrix.shape[0]
+        if n == self._buffer.shape[0]:
+            buffer = np.zeros((max(4, 2 * n),) * 2)
+            buffer[:n, :n] = self.matrix
+            self._buffer = buffer
+        self.matrix = self._buffer[:n + 1, :n + 1]
+
+    def clear_vertex(self, index: int) -> None:
+        self.matrix[index, :] = 0.0
+        self.matrix[:, index] = 0.0
+
+    def compact(self, keep: List[int], mapping: List[int]) -> None:
+        self._buffer = self.matrix[np.ix_(keep, keep)]
+        self.matrix = self._buffer
+
+    def get(self, i: int, j: int) -> float:
+        return float(self.matrix[i, j])
+
+    def set(self, i: int, j: int, weight: float) -> None:
+        self.matrix[i, j] = weight
+
+    def delete(self, i: int, j: int) -> None:
+        self.matrix[i, j] = 0.0
+
+    def neighbors(self, i: int) -> Iterator[Tuple[int, float]]:
+        row = self.matrix[i]
+        idx = np.flatnonzero(row)
+        return zip(idx.tolist(), row[idx].tolist())
+
+    def in_neighbors(self, j: int) -> Iterator[Tuple[int, float]]:
+        column = self.matrix[:, j]
+        idx = np.flatnonzero(column)
+        return zip(idx.tolist(), column[idx].tolist())
+
+    def to_matrix(self):
+        return self.matrix
+
+
+STORAGE_BACKENDS = {
+    'dense': DenseStorage,
+    'sparse': SparseStorage,
+    'numpy': NumpyDenseStorage,
+}
+
+
+class EdgeList:
+    """
+    Lista explícita de arcos (origem, destino, peso), mantida ao lado do backend.
+    A presença do arco é a chave do dicionário, não o valor do peso: arestas de
+    peso zero ou negativo existem aqui mesmo que a matriz as trate como ausentes.
+    """
+
+    def __init__(self, arcs: Optional[Iterator[Tuple[int, int, float]]] = None):
+        # arcs: iterável (origem, destino, peso) consumido só no primeiro acesso,
+        # para que um snapshot carregado não pague a montagem do dicionário à toa
+        self._weights: Optional[Dict[Tuple[int, int], float]] = {} if arcs is None else None
+        self._zero: Dict[int, Set[int]] = {}  # Arcos de peso 0 (invisíveis ao backend), por origem
+        self._pending = arcs
+
+    @property
+    def weights(self) -> Dict[Tuple[int, int], float]:
+        if self._weights is None:
+            self._weights = {(u, v): weight for u, v, weight in self._pending}
+            self._pending = None
+            for (u, v), weight in self._weights.items():
+                if weight == 0:
+                    self._zero.setdefault(u, set()).add(v)
+        return self._weights
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def __contains__(self, arc: Tuple[int, int]) -> bool:
+        return arc in self.weights
+
+    def __iter__(self) -> Iterator[Tuple[int, int, float]]:
+        for (u, v), weight in self.weights.items():
+            yield u, v, weight
+
+    def set(self, u: int, v: int, weight: float) -> None:
+        self.weights[(u, v)] = weight
+        if weight == 0:
+            self._zero.setdefault(u, set()).add(v)
+        else:
+            self._discard_zero(u, v)
+
+    def delete(self, u: int, v: int) -> None:
+        self.weights.pop((u, v), None)
+        self._discard_zero(u, v)
+
+    def _discard_zero(self, u: int, v: int) -> None:
+        targets = self._zero.get(u)
+        if targets is not None:
+            targets.discard(v)
+            if not targets:
+                del self._zero[u]
+
+    def zero_targets(self, u: int) -> Set[int]:
+        """Destinos dos arcos de peso 0 que saem de u (os únicos que o backend não representa)"""
+        self.weights  # Materializa um snapshot pendente
+        return self._zero.get(u, set())
+
+    def clear_vertex(self, index: int, neighbors: Iterable[int]) -> None:
+        """
+        Descarta os arcos de index sem renumerar nada. neighbors são os vizinhos
+        conhecidos pelo backend (entrada e saída); os arcos de peso 0 vêm de _zero.
+        """
+        weights = self.weights
+        for v in neighbors:
+            weights.pop((index, v), None)
+            weights.pop((v, index), None)
+        for v in self._zero.pop(index, ()):
+            weights.pop((index, v), None)
+        for u in [u for u, targets in self._zero.items() if index in targets]:
+            self.delete(u, index)
+
+    def compact(self, mapping: List[int]) -> None:
+        """Renumera os arcos pelo mapeamento antigo -> novo (arcos de vértices removidos já saíram)"""
+        self._weights = {(mapping[u], mapping[v]): weight for (u, v), weight in self.weights.items()}
+        self._zero = {mapping[u]: {mapping[v] for v in targets} for u, targets in self._zero.items()}
+
+    def adjacency(self, n: int) -> List[List[Tuple[int, float]]]:
+        """Listas de saída (destino, peso) por origem, montadas em O(E)"""
+        out: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        for (u, v), weight in self.weights.items():
+            out[u].append((v, weight))
+        return out
+
+
+# ========================================
+# MOTOR DE ENUMERAÇÃO DE CAMINHOS (PILHA EXPLÍCITA)
+# ========================================
+
+def _walk_paths(source: int, goal: int, expand, max_depth: Optional[int] = None,
+                prune=None) -> Iterator[Tuple[List[int], float]]:
+    """
+    Enumera, sem recursão, todos os caminhos simples de source até goal.
+    expand(v) devolve os pares (próximo, peso) que podem seguir v e prune(custo),
+    se informado, descarta o ramo. Gera (caminho, custo) reaproveitando um único
+    buffer: quem consome deve copiar o caminho se quiser guardá-lo.
+    """
+    path = [source]
+    if source == goal:
+        yield path, 0.0
+        return
+    
+    costs = [0.0]
+    on_path = {source}
+    stack = [iter(expand(source))]
+    
+    while stack:
+        step = next(stack[-1], None)
+        if step is None:
+            # Ramo esgotado: volta um nível (a raiz não tem vértice para desempilhar)
+            stack.pop()
+            if stack:
+                on_path.discard(path.pop())
+                costs.pop()
+            continue
+        
+        neighbor, weight = step
+        if neighbor in on_path:
+            continue
+        cost = costs[-1] + weight
+        if prune is not None and prune(cost):
+            continue
+        
+        if neighbor == goal:
+            path.append(neighbor)
+            yield path, cost
+            path.pop()
+            continue
+        
+        if max_depth is not None and len(path) >= max_depth:
+            continue
+        
+        path.append(neighbor)
+        costs.append(cost)
+        on_path.add(neighbor)
+        stack.append(iter(expand(neighbor)))
+
+
+# ========================================
+# RESULTADO PREGUIÇOSO DE CAMINHOS MÍNIMOS
+# ========================================
+
+class ShortestPathDAG:
+    """
+    Todos os caminhos ótimos de start até target, guardados apenas como o DAG de
+    predecessores ótimos. Os caminhos são contados, enumerados ou sorteados sob
+    demanda, sem materializar listas de caminhos durante a busca.
+    """
+
+    def __init__(self, start: int, target: int, cost: float, predecessors,
+                 path_counts: Optional[Dict[int, int]] = None):
+        self.start = start
+        self.target = target
+        self.cost = cost
+        self.predecessors = predecessors
+        self._counts = path_counts
+
+    def __bool__(self) -> bool:
+        return self.cost != float('inf')
+
+    def count(self) -> int:
+        """Número de caminhos ótimos distintos (sem enumerá-los)"""
+        if not self:
+            return 0
+        return self._path_counts()[self.target]
+
+    def _path_counts(self) -> Dict[int, int]:
+        """Caminhos ótimos de start até cada vértice do DAG (programação dinâmica iterativa)"""
+        if self._counts is not None and self.target in self._counts:
+            return self._counts
+        
+        counts = {self.start: 1}
+        stack = [self.target]
+        while stack:
+            vertex = stack[-1]
+            if vertex in counts:
+                stack.pop()
+                continue
+            pending = [p for p in self.predecessors[vertex] if p not in counts]
+            if pending:
+                stack.extend(pending)
+            else:
+                counts[vertex] = sum(counts[p] for p in self.predecessors[vertex])
+                stack.pop()
+        
+        self._counts = counts
+        return counts
+
+    def __iter__(self) -> Iterator[List[int]]:
+        """Gera cada caminho ótimo (start ... target) a partir do DAG"""
+        if not self:
+            return
+        predecessors = self.predecessors
+        
+        def expand(vertex: int):
+            return ((pred, 0.0) for pred in predecessors[vertex])
+        
+        # Caminha do destino até a origem pelos predecessores
+        for reversed_path, _ in _walk_paths(self.target, self.start, expand):
+            yield reversed_path[::-1]
+
+    def paths(self, limit: Optional[int] = None) -> List[List[int]]:
+        """Materializa até limit caminhos ótimos"""
+        result = []
+        for path in self:
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(path)
+        return result
+
+    def sample(self, rng: Optional[random.Random] = None) -> List[int]:
+        """Sorteia um caminho ótimo com probabilidade uniforme"""
+        if not self:
+            return []
+        rng = rng or random
+        counts = self._path_counts()
+        
+        reversed_path = [self.target]
+        vertex = self.target
+        while vertex != self.start:
+            preds = self.predecessors[vertex]
+            choice = rng.randrange(counts[vertex])
+            for pred in preds:
+                choice -= counts[pred]
+                if choice < 0:
+                    break
+            reversed_path.append(pred)
+            vertex = pred
+        return reversed_path[::-1]
+
+
+class RouteBatch:
+    """
+    Respostas de Graph.route_batch: custos alinhados aos pares consultados e uma
+    árvore de caminhos mínimos (distâncias, predecessores, contagens) por origem
+    distinta. Os caminhos de cada par são extraídos sob demanda.
+    """
+
+    def __init__(self, pairs: List[Tuple[int, int]], costs: array, trees: Dict[int, tuple]):
+        self.pairs = pairs
+        self.costs = costs
+        self.trees = trees
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    @property
+    def searches(self) -> int:
+        """Quantas buscas de origem única foram executadas"""
+        return len(self.trees)
+
+    def cost(self, i: int) -> float:
+        return self.costs[i]
+
+    def paths(self, i: int) -> ShortestPathDAG:
+        """Todos os caminhos ótimos do i-ésimo par, como DAG preguiçoso"""
+        start, target = self.pairs[i]
+        _, predecessors, path_counts = self.trees[start]
+        return ShortestPathDAG(start, target, self.costs[i], predecessors, path_counts)
+
+    def path(self, i: int) -> List[int]:
+        """Um caminho ótimo do i-ésimo par ([] se não existe)"""
+        return next(iter(self.paths(i)), [])
+
+
+# ========================================
+# ÍNDICE DE LANDMARKS (ALT: A*, LANDMARKS E DESIGUALDADE TRIANGULAR)
+# ========================================
+
+class LandmarkIndex:
+    """
+    Distâncias pré-calculadas de/para K vértices de referência (landmarks), uma
+    array('d') de V posições por landmark e sentido. Pela desigualdade triangular,
+        d(v, t) >= d(L, t) - d(L, v)   e   d(v, t) >= d(v, L) - d(t, L),
+    o que dá um limite inferior consistente para guiar o A*.
+    O índice vale apenas para a versão do grafo em que foi construído.
+    """
+
+    def __init__(self, version: int, landmarks: List[int], dist_from: List[array],
+                 dist_to: List[array]):
+        self.version = version
+        self.landmarks = landmarks
+        self.dist_from = dist_from  # dist_from[k][v] = d(landmark_k, v)
+        self.dist_to = dist_to      # dist_to[k][v]   = d(v, landmark_k) (mesmas arrays se não-direcionado)
+
+    def heuristic(self, target: int):
+        """Limite inferior h(v) <= d(v, target) usando todos os landmarks úteis para target"""
+        inf = float('inf')
+        forward = [(row, row[target]) for row in self.dist_from if row[target] != inf]
+        
+        if self.dist_to is self.dist_from:
+            # Não-direcionado: o limite de volta, d(L, v) - d(L, t), é o de ida com o
+            # sinal trocado, então os dois juntos dão |d(L, t) - d(L, v)|
+            def h(v: int) -> float:
+                bound = 0.0
+                for row, to_target in forward:
+                    d_v = row[v]
+                    if d_v != inf and abs(to_target - d_v) > bound:
+                        bound = abs(to_target - d_v)
+                return bound
+            return h
+        
+        backward = [(row, row[target]) for row in self.dist_to if row[target] != inf]
+        
+        def h(v: int) -> float:
+            bound = 0.0
+            for row, to_target in forward:
+                d_v = row[v]
+                if d_v != inf and to_target - d_v > bound:
+                    bound = to_target - d_v
+            for row, from_target in backward:
+                d_v = row[v]
+                if d_v != inf and d_v - from_target > bound:
+                    bound = d_v - from_target
+            return bound
+        return h
+
+
+# ========================================
+# DIJKSTRA SOBRE LISTAS DE ADJACÊNCIA (ALL-PAIRS ESPARSO)
+# ========================================
+
+def _dijkstra_from(source: int, adjacency: List[List[Tuple[int, float]]]) -> Tuple[List[float], List[int]]:
+    """
+    Dijkstra de uma origem sobre listas (destino, peso >= 0): (distâncias, primeiro
+    vértice de um caminho mínimo), no formato de uma linha de floyd_warshall_matrices.
+    """
+    n = len(adjacency)
+    dist = [float('inf')] * n
+    first_hop = [-1] * n
+    dist[source] = 0.0
+    first_hop[source] = source
+    
+    pq = Graph.IndexedMinHeap(n)
+    pq.push(source, 0.0)
+    while not pq.is_empty():
+        current_dist, current = pq.pop()
+        hop = first_hop[current]
+        for neighbor, weight in adjacency[current]:
+            candidate = current_dist + weight
+            if candidate < dist[neighbor]:
+                dist[neighbor] = candidate
+                first_hop[neighbor] = neighbor if current == source else hop
+                pq.push_or_decrease(neighbor, candidate)
+    return dist, first_hop
+
+
+def _bfs_from(source: int, adjacency: List[List[Tuple[int, float]]]) -> Tuple[List[float], List[int]]:
+    """BFS de uma origem: (número de saltos, primeiro vértice), no mesmo formato de _dijkstra_from"""
+    n = len(adjacency)
+    hops = [float('inf')] * n
+    first_hop = [-1] * n
+    hops[source] = 0.0
+    first_hop[source] = source
+    
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        hop = first_hop[current]
+        for neighbor, _ in adjacency[current]:
+            if hops[neighbor] == float('inf'):
+                hops[neighbor] = hops[current] + 1
+                first_hop[neighbor] = neighbor if current == source else hop
+                queue.append(neighbor)
+    return hops, first_hop
+
+
+# ========================================
+# EXECUÇÃO PARALELA (MEMÓRIA COMPARTILHADA)
+# ========================================
+
+SINGLE_SOURCE_SEARCHES = {
+    'dijkstra': _dijkstra_from,
+    'bfs': _bfs_from,
+}
+
+# Estado de cada processo trabalhador, preenchido uma única vez pelo inicializador
+_worker_state: Dict[str, object] = {}
+
+
+def _parallel_worker_init(names: Dict[str, str], n: int, algorithm: str) -> None:
+    """
+    Inicializador do trabalhador: lê o CSR compartilhado e monta as listas de
+    adjacência locais uma vez por processo (nada é serializado por tarefa além
+    da fatia de origens).
+    """
+    adjacency = []
+    blocks = [shared_memory.SharedMemory(name=names[key]) for key in ('offsets', 'indices', 'weights')]
+    offsets, indices, weights = (block.buf.cast(code) for block, code in zip(blocks, 'qqd'))
+    for u in range(n):
+        lo, hi = offsets[u], offsets[u + 1]
+        adjacency.append([(v, w) for v, w in zip(indices[lo:hi], weights[lo:hi]) if w > 0])
+    for view in (offsets, indices, weights):
+        view.release()
+    for block in blocks:
+        block.close()
+    
+    _worker_state.update(names=names, adjacency=adjacency, n=n, search=SINGLE_SOURCE_SEARCHES[algorithm])
+
+
+def _parallel_worker_run(task: Tuple[int, List[int]]) -> int:
+    """Resolve uma fatia de origens e grava as linhas direto nas tabelas compartilhadas"""
+    first_row, sources = task
+    n = _worker_state['n']
+    adjacency = _worker_state['adjacency']
+    search = _worker_state['search']
+    dist_block = shared_memory.SharedMemory(name=_worker_state['names']['dist'])
+    hop_block = shared_memory.SharedMemory(name=_worker_state['names']['next_hop'])
+    dist, next_hop = dist_block.buf.cast('d'), hop_block.buf.cast('q')
+    try:
+        for offset, source in enumerate(sources):
+            row, hops = search(source, adjacency)
+            base = (first_row + offset) * n
+            dist[base:base + n] = array('d', row)
+            next_hop[base:base + n] = array('q', hops)
+    finally:
+        dist.release()
+        next_hop.release()
+        dist_block.close()
+        hop_block.close()
+    return len(sources)
+
+
+def _shared_copy(data: array) -> shared_memory.SharedMemory:
+    """Copia um array tipado para um bloco novo de memória compartilhada"""
+    block = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+    block.buf[:len(data) * data.itemsize] = data.tobytes()
+    return block
+
+
+def parallel_shortest_paths(graph: 'Graph', sources: Optional[List[int]] = None,
+                            algorithm: str = 'dijkstra', workers: Optional[int] = None):
+    """
+    Distribui as origens entre um ProcessPoolExecutor e junta as buscas de origem
+    única (Dijkstra ou BFS) em uma tabela (dist, next_hop), uma linha por origem,
+    no formato de floyd_warshall_matrices. O grafo vai aos trabalhadores como CSR
+    em memória compartilhada e cada um escreve suas linhas direto na tabela de
+    saída compartilhada, então nem o grafo nem os resultados são serializados.
+    """
+    if algorithm not in SINGLE_SOURCE_SEARCHES:
+        raise ValueError(f"Algoritmo desconhecido: {algorithm}")
+    n = len(graph.vertices)
+    sources = list(range(n)) if sources is None else list(sources)
+    workers = workers or os.cpu_count() or 1
+    
+    csr = graph._storage if graph._storage.kind == 'csr' else CSRStorage.from_storage(graph._storage)
+    rows = len(sources)
+    blocks = {
+        'offsets': _shared_copy(csr.offsets),
+        'indices': _shared_copy(csr.indices),
+        'weights': _shared_copy(csr.weights),
+        'dist': shared_memory.SharedMemory(create=True, size=max(1, rows * n * 8)),
+        'next_hop': shared_memory.SharedMemory(create=True, size=max(1, rows * n * 8)),
+    }
+    names = {key: block.name for key, block in blocks.items()}
+    
+    try:
+        # Fatias menores que origens/trabalhadores equilibram a carga entre processos
+        chunk = max(1, rows // (workers * 4))
+        tasks = [(k, sources[k:k + chunk]) for k in range(0, rows, chunk)]
+        if workers == 1 or rows <= 1:
+            _parallel_worker_init(names, n, algorithm)
+            try:
+                for task in tasks:
+                    _parallel_worker_run(task)
+            finally:
+                _worker_state.clear()
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_parallel_worker_init,
+                                     initargs=(names, n, algorithm)) as pool:
+                for _ in pool.map(_parallel_worker_run, tasks):
+                    pass
+        
+        dist_view = blocks['dist'].buf.cast('d')
+        hop_view = blocks['next_hop'].buf.cast('q')
+        dist = [dist_view[k * n:(k + 1) * n].tolist() for k in range(rows)]
+        next_hop = [hop_view[k * n:(k + 1) * n].tolist() for k in range(rows)]
+        dist_view.release()
+        hop_view.release()
+        return dist, next_hop
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+
+# ========================================
+# CONTRACTION HIERARCHIES (CONSULTAS EM REDES ESTÁTICAS)
+# ========================================
+
+class ContractionHierarchy:
+    """
+    Pré-processamento de contraction hierarchies sobre as arestas de um Graph.
+    Os vértices são contraídos do menos para o mais importante (diferença de arestas
+    + vizinhos já contraídos, com atualização preguiçosa); ao contrair v, cada par
+    u->v->w sem caminho testemunha mais curto vira um atalho u->w que lembra v.
+    A consulta é um Dijkstra bidirecional que só sobe na hierarquia; os atalhos
+    são desempacotados ao final no mesmo formato List[int] dos outros algoritmos.
+    """
+
+    def __init__(self, graph: 'Graph', witness_settle_limit: int = 64):
+        self.version = graph._version
+        self.witness_settle_limit = witness_settle_limit
+        n = len(graph.vertices)
+        self.rank = [0] * n
+        self.up_out: List[List[Tuple[int, float]]] = [[] for _ in range(n)]  # arestas para cima
+        self.up_in: List[List[Tuple[int, float]]] = [[] for _ in range(n)]   # arestas que descem até v
+        self.middle: Dict[Tuple[int, int], int] = {}  # atalho (u, w) -> vértice contraído no meio
+        self._heap = Graph.IndexedMinHeap(n)
+        self._query_heaps = (Graph.IndexedMinHeap(n), Graph.IndexedMinHeap(n))
+        
+        out_edges: List[Dict[int, float]] = [{} for _ in range(n)]
+        in_edges: List[Dict[int, float]] = [{} for _ in range(n)]
+        for u in range(n):
+            for w, weight in graph._neighbors(u):
+                if weight > 0 and u != w:
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+        self._contract_all(out_edges, in_edges)
+
+    # ---------- pré-processamento ----------
+
+    def _contract_all(self, out_edges, in_edges) -> None:
+        n = len(self.rank)
+        contracted_neighbors = [0] * n
+        depth = [0] * n
+        order = Graph.IndexedMinHeap(n)
+        for v in range(n):
+            order.push(v, self._importance(v, out_edges, in_edges, contracted_neighbors, depth)[0])
+        
+        next_rank = 0
+        while not order.is_empty():
+            _, v = order.pop()
+            # Atualização preguiçosa: se a importância cresceu, devolve v à fila
+            importance, shortcuts = self._importance(v, out_edges, in_edges, contracted_neighbors, depth)
+            if not order.is_empty() and importance > order.peek_key():
+                order.push(v, importance)
+                continue
+            
+            self.rank[v] = next_rank
+            next_rank += 1
+            
+            # Todas as arestas restantes de v levam a vértices de rank maior
+            self.up_out[v] = list(out_edges[v].items())
+            self.up_in[v] = list(in_edges[v].items())
+            for w in out_edges[v]:
+                del in_edges[w][v]
+                contracted_neighbors[w] += 1
+                depth[w] = max(depth[w], depth[v] + 1)
+            for u in in_edges[v]:
+                del out_edges[u][v]
+                contracted_neighbors[u] += 1
+                depth[u] = max(depth[u], depth[v] + 1)
+            out_edges[v] = {}
+            in_edges[v] = {}
+            
+            for u, w, weight in shortcuts:
+                if weight < out_edges[u].get(w, float('inf')):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+                    self.middle[(u, w)] = v
+
+    def _importance(self, v: int, out_edges, in_edges, contracted_neighbors, depth):
+        """
+        (importância, atalhos) de v: diferença de arestas (atalhos criados - arestas
+        removidas) + vizinhos já contraídos + profundidade na hierarquia
+        """
+        shortcuts = self._shortcuts(v, out_edges, in_edges)
+        removed = len(out_edges[v]) + len(in_edges[v])
+        return len(shortcuts) - removed + contracted_neighbors[v] + depth[v], shortcuts
+
+    def _shortcuts(self, v: int, out_edges, in_edges) -> List[Tuple[int, int, float]]:
+        """Atalhos u->w necessários para contrair v (sem caminho testemunha tão curto quanto)"""
+        shortcuts = []
+        for u, w_uv in in_edges[v].items():
+            via = {w: w_uv + w_vw for w, w_vw in out_edges[v].items() if w != u}
+            if not via:
+                continue
+            reached = self._witness_search(u, v, max(via.values()), via, out_edges)
+            for w, cost in via.items():
+                witness = reached.get(w, float('inf'))
+                if witness > cost and not _same_cost(witness, cost):
+                    shortcuts.append((u, w, cost))
+        return shortcuts
+
+    def _witness_search(self, source: int, excluded: int, limit: float, targets, out_edges) -> Dict[int, float]:
+        """
+        Dijkstra local a partir de source, sem passar por excluded, limitado em custo
+        e em vértices fixados; para assim que todos os targets estão fixados.
+        """
+        heap = self._heap
+        dist = {source: 0.0}
+        heap.push(source, 0.0)
+        settled = 0
+        pending = len(targets)
+        while not heap.is_empty():
+            d, x = heap.pop()
+            if settled >= self.witness_settle_limit:
+                break
+            settled += 1
+            if x in targets:
+                pending -= 1
+                if pending == 0:
+                    break
+            for y, weight in out_edges[x].items():
+                if y == excluded:
+                    continue
+                candidate = d + weight
+                if candidate <= limit and candidate < dist.get(y, float('inf')):
+                    dist[y] = candidate
+                    heap.push_or_decrease(y, candidate)
+        heap.clear()
+        return dist
+
+    # ---------- consulta ----------
+
+    def query(self, start: int, target: int) -> Tuple[List[int], float]:
+        """Caminho mínimo (desempacotado) e custo; ([], inf) se não existe"""
+        if start == target:
+            return [start], 0.0
+        
+        inf = float('inf')
+        dist = ({start: 0.0}, {target: 0.0})
+        parent = ({start: -1}, {target: -1})
+        edges = (self.up_out, self.up_in)
+        heaps = self._query_heaps
+        heaps[0].push(start, 0.0)
+        heaps[1].push(target, 0.0)
+        
+        mu, meet = inf, -1
+        while True:
+            key_f = heaps[0].peek_key() if not heaps[0].is_empty() else inf
+            key_b = heaps[1].peek_key() if not heaps[1].is_empty() else inf
+            if min(key_f, key_b) >= mu:
+                break  # Nenhum lado consegue mais melhorar o encontro
+            side = 0 if key_f <= key_b else 1
+            d, x = heaps[side].pop()
+            
+            other = dist[1 - side].get(x)
+            if other is not None and d + other < mu:
+                mu, meet = d + other, x
+            
+            my_dist, my_parent = dist[side], parent[side]
+            for y, weight in edges[side][x]:
+                candidate = d + weight
+                if candidate < my_dist.get(y, inf):
+                    my_dist[y] = candidate
+                    my_parent[y] = x
+                    heaps[side].push_or_decrease(y, candidate)
+        heaps[0].clear()
+        heaps[1].clear()
+        
+        if meet == -1:
+            return [], inf
+        
+        # Sobe de meet até start e de meet até target pelas arestas da hierarquia
+        up_chain = [meet]
+        while parent[0][up_chain[-1]] != -1:
+            up_chain.append(parent[0][up_chain[-1]])
+        up_chain.reverse()
+        down_chain = [meet]
+        while parent[1][down_chain[-1]] != -1:
+            down_chain.append(parent[1][down_chain[-1]])
+        
+        chain = up_chain + down_chain[1:]
+        path = [start]
+        for u, w in zip(chain, chain[1:]):
+            self._unpack(u, w, path)
+        return path, mu
+
+    def _unpack(self, u: int, w: int, path: List[int]) -> None:
+        """Acrescenta a path os vértices da aresta u->w depois de u, expandindo atalhos"""
+        stack = [(u, w)]
+        while stack:
+            a, b = stack.pop()
+            m = self.middle.get((a, b))
+            if m is None:
+                path.append(b)
+            else:
+                stack.append((m, b))
+                stack.append((a, m))
+
+
+# ========================================
+# RESULTADOS TIPADOS E RELATÓRIOS NO CONSOLE
+# ========================================
+
+class PathSearchResult(NamedTuple):
+    """Retorno dos métodos *_all_paths: desempacota como (caminhos, custos)"""
+    paths: List[List[int]]
+    costs: List[float]
+
+    @property
+    def optimal_cost(self) -> float:
+        return min(self.costs, default=float('inf'))
+
+    @property
+    def optimal_indices(self) -> List[int]:
+        best = self.optimal_cost
+        return [i for i, cost in enumerate(self.costs) if _same_cost(cost, best)]
+
+
+class GraphInfo(NamedTuple):
+    """Retorno de list_graph_info"""
+    vertex_count: int
+    edge_count: int
+    is_directed: bool
+    is_weighted: bool
+    vertices: List[Tuple[int, str]]  # (índice, nome) de cada vértice vivo
+
+
+class ConsoleReporter:
+    """
+    Camada de apresentação: formata e imprime as mensagens e os caminhos que o
+    Graph lhe entrega. Só o main() instala um reporter; sem ele, o Graph não imprime.
+    """
+
+    def message(self, text: str) -> None:
+        print(text)
+
+    def paths(self, graph: 'Graph', algorithm_name: str, all_paths: List[List[int]],
+              all_costs: List[float], optimal_indices: List[int], start: int, target: int) -> None:
+        """Imprime todos os caminhos encontrados e indica o(s) ótimo(s)"""
+        vertices = graph.vertices
+        print(f"\n{'='*60}")
+        print(f"{algorithm_name}: {vertices[start]['nome']} → {vertices[target]['nome']}")
+        print(f"{'='*60}")
+        
+        print(f"Total de caminhos encontrados: {len(all_paths)}")
+        
+        if len(all_paths) == 1:
+            print(f"Caminho único:")
+        else:
+            print(f"Todos os caminhos:")
+        
+        optimal = set(optimal_indices)
+        for i, (path, cost) in enumerate(zip(all_paths, all_costs)):
+            path_names = [vertices[v]['nome'] for v in path]
+            status = " ★ ÓTIMO" if i in optimal else ""
+            
+            # Cálculos astronômicos
+            km_total = cost * 150_000_000  # 1 UA = 150 milhões de km
+            
+            # Formatação da distância
+            if km_total >= 1_000_000_000:  # Bilhões
+                km_formatado = f"{km_total/1_000_000_000:.1f} bilhões de km"
+            elif km_total >= 1_000_000:  # Milhões
+                km_formatado = f"{km_total/1_000_000:.0f} milhões de km"
+            else:
+                km_formatado = f"{km_total:,.0f} km"
+            
+            print(f"  [{i+1:2d}] {' → '.join(path_names)}")
+            print(f"       Custo total (Unidade Astronomica): {cost:.2f}")
+            print(f"       Distancia real: {cost:.2f} × 150 milhões km = {km_formatado}{status}")
+        
+        if len(optimal_indices) > 1:
+            print(f"\nCaminhos ótimos: {len(optimal_indices)} (mesmo custo mínimo)")
+        elif len(optimal_indices) == 1:
+            print(f"\nCaminho ótimo: #{optimal_indices[0]+1}")
+
+    def graph_info(self, info: GraphInfo) -> None:
+        """Imprime o resultado de Graph.list_graph_info"""
+        print(f"\n{'='*50}")
+        print(f"INFORMAÇÕES DO GRAFO")
+        print(f"{'='*50}")
+        print(f"Número de vértices: {info.vertex_count}")
+        print(f"Número de arestas: {info.edge_count}")
+        print(f"Tipo: {'Direcionado' if info.is_directed else 'Não-direcionado'}")
+        print(f"Ponderado: {'Sim' if info.is_weighted else 'Não'}")
+        
+        if info.vertices:
+            print(f"\nVértices:")
+            for i, name in info.vertices:
+                print(f"  [{i+1:2d}] {name}")
+
+    def constellation_counts(self, counts: Dict[str, int]) -> None:
+        """Imprime o resultado de Graph.count_by_constellation"""
+        if not counts:
+            print("Grafo vazio.")
+            return
+        print(f"\nContagem por constelação:")
+        for constellation, count in counts.items():
+            print(f"  {constellation}: {count} objeto(s)")
+
+    def star_list(self, stars: List[Tuple[int, Optional[str], Any, Any]]) -> None:
+        """Imprime o resultado de Graph.listar_todas_estrelas"""
+        if not stars:
+            print("Nenhum vértice encontrado no grafo.")
+            return
+        print(f"\n============================================================")
+        print(f"                    REDE ESTELAR DISPONIVEL")
+        print(f"============================================================")
+        
+        for i, nome, magnitude, constelacao in stars:
+            print(f"[{i+1:2d}] {'Sem nome' if nome is None else nome}")
+            print(f"     Magnitude: {'N/A' if magnitude is None else magnitude} | "
+                  f"Constelacao: {'N/A' if constelacao is None else constelacao}")
+        
+        print(f"============================================================")
+        print(f"Total: {len(stars)} objetos celestes disponíveis")
+        print(f"============================================================\n")
+
+    def most_connected(self, ranking: List[Tuple[int, int, str]], limit: int = 5) -> None:
+        """Imprime os primeiros de Graph.list_most_connected_stars"""
+        if not ranking:
+            print("Grafo vazio.")
+            return
+        print(f"\nEstrelas mais conectadas:")
+        for count, index, name in ranking[:limit]:
+            print(f"  [{index+1:2d}] {name}: {count} conexões")
+
 
 class Graph:
-    def __init__(self, is_directed: bool = False, is_weighted: bool = True):
-        self.vertices = []
-        self.adjacency_matrix = []
+    def __init__(self, is_directed: bool = False, is_weighted: bool = True, storage: str = 'dense',
+                 dynamic_all_pairs: bool = False, reporter: Optional[ConsoleReporter] = None):
+        """
+        storage: 'dense' (matriz de adjacência), 'numpy' (matriz em ndarray, requer NumPy)
+        ou 'sparse' (lista de adjacência).
+        Use freeze() para obter um snapshot CSR somente leitura.
+        dynamic_all_pairs: se True, a tabela all-pairs em cache é corrigida a cada
+        alteração de aresta em vez de ser descartada.
+        reporter: destino das mensagens e dos caminhos (ex.: ConsoleReporter());
+        com None o grafo não imprime nada e só retorna os resultados.
+        """
+        if storage not in STORAGE_BACKENDS:
+            raise ValueError(f"Backend de armazenamento desconhecido: {storage}")
+        self.vertices = VertexTable()  # Tabela de slots colunar: None marca um vértice removido
+        self._free: List[int] = []  # Slots removidos, reaproveitados por add_vertex
+        self._name_index: Dict[str, int] = {}  # Nome normalizado -> índice do vértice
+        self.storage_kind = storage
+        self._storage = STORAGE_BACKENDS[storage]()
+        self._edges = EdgeList()  # Presença explícita dos arcos (aceita pesos <= 0)
         self.is_directed = is_directed
         self.is_weighted = is_weighted
+        self.reporter = reporter
+        
+        # Versão do grafo: incrementada a cada alteração estrutural, invalida os caches
+        self._version = 0
+        self._apsp_cache = None  # (versão, dist, next_hop) da última tabela all-pairs
+        self.dynamic_all_pairs = dynamic_all_pairs
+        self._landmarks: Optional[LandmarkIndex] = None
+        self._hierarchy: Optional[ContractionHierarchy] = None
+        self._geometry = None  # (versão, {atributo de posição: fator de escala}) da heurística de A*
+        self._johnson = None  # (versão, (potenciais, adjacência reponderada) ou None se ciclo negativo)
+
+    @property
+    def adjacency_matrix(self) -> Tuple[Tuple[float, ...], ...]:
+        """
+        Snapshot somente leitura da matriz de adjacência (linhas em tuplas).
+        Alterações de peso passam por add_edge/update_edge/remove_edge.
+        """
+        return tuple(tuple(float(w) for w in row) for row in self._storage.to_matrix())
+
+    def freeze(self) -> None:
+        """Congela as arestas em um snapshot CSR para consultas intensivas"""
+        if self._storage.kind != 'csr':
+            self._storage = CSRStorage.from_storage(self._storage)
+
+    def thaw(self) -> None:
+        """Volta do snapshot CSR para o backend mutável escolhido na criação (storage_kind)"""
+        if self._storage.kind == 'csr':
+            self._storage = self._storage.thaw(self.storage_kind)
+
+    def _mutable_storage(self):
+        """Garante um backend mutável antes de qualquer alteração"""
+        self.thaw()
+        return self._storage
+
+    def _touch(self) -> None:
+        """Registra uma alteração no grafo (invalida as tabelas em cache)"""
+        self._version += 1
+
+    def _neighbors(self, vertex: int) -> Iterator[Tuple[int, float]]:
+        """(vizinho, peso) de cada aresta de saída de vertex"""
+        return self._storage.neighbors(vertex)
+
+    def _out_arcs(self, vertex: int) -> Iterator[Tuple[int, float]]:
+        """(vizinho, peso) de cada arco de saída, inclusive os de peso 0 que o backend não guarda"""
+        yield from self._storage.neighbors(vertex)
+        for v in self._edges.zero_targets(vertex):
+            yield v, 0.0
+    
+    def _in_neighbors(self, vertex: int) -> Iterator[Tuple[int, float]]:
+        """(origem, peso) de cada aresta que chega em vertex"""
+        if not self.is_directed:
+            return self._storage.neighbors(vertex)
+        return self._storage.in_neighbors(vertex)
+
+    def _write_edge(self, v1: int, v2: int, weight: Optional[float]) -> None:
+        """
+        Grava o peso de v1->v2 (e v2->v1 se não-direcionado); weight=None remove a aresta.
+        Arestas de peso 0 ficam apenas na lista explícita: o backend não as representa.
+        """
+        storage = self._mutable_storage()
+        arcs = [(v1, v2)]
+        if not self.is_directed and v1 != v2:
+            arcs.append((v2, v1))
+        
+        changes = []
+        for a, b in arcs:
+            stored = 0.0 if weight is None else weight
+            changes.append((a, b, storage.get(a, b), stored))
+            if stored == 0:
+                storage.delete(a, b)
+            else:
+                storage.set(a, b, stored)
+            if weight is None:
+                self._edges.delete(a, b)
+            else:
+                self._edges.set(a, b, weight)
+        self._edge_changed(changes)
+    
+    # ========================================
+    # MÉTODOS BÁSICOS DO GRAFO
+    # ========================================
+    
+    def add_vertex(self, vertex_data: dict) -> int:
+        """Adiciona um vértice ao grafo"""
+        # Verificar se já existe um vértice com o mesmo nome (índice de nomes, O(1))
+        nome_novo = vertex_data.get('nome', '').strip()
+        key = _normalize_name(nome_novo)
+        if key in self._name_index:
+            self._report(f"Erro: Já existe um objeto celeste com o nome '{nome_novo}'.")
+            return -1  # Retorna -1 para indicar erro
+        
+        if self._free:
+            # Reaproveita um slot removido: a linha/coluna dele já está zerada
+            index = self._free.pop()
+            self.vertices[index] = vertex_data
+        else:
+            index = len(self.vertices)
+            self.vertices.append(vertex_data)
+            self._mutable_storage().add_vertex()  # Expandir o armazenamento das arestas
+        self._name_index[key] = index
+        self._touch()
+        
+        return index  # Retorna o índice do vértice adicionado
+    
+    def add_edge(self, v1: int, v2: int, weight: float = 1.0) -> None:
+        """Adiciona uma aresta entre v1 e v2"""
+        if not self.is_live(v1) or not self.is_live(v2):
+            return  # Silencioso para não quebrar o carregamento
+        
+        val = weight if self.is_weighted else 1.0
+        self._write_edge(v1, v2, val)
+    
+    def remove_vertex(self, vertex_index: int) -> bool:
+        """
+        Remove um vértice do grafo em O(grau) no backend esparso (O(V) no denso).
+        O slot vira uma lápide: os demais vértices mantêm seus índices e o slot
+        volta para a lista livre. Use compact() para recuperar o espaço.
+        """
+        if not self.is_live(vertex_index):
+            self._report("Índice inválido.")
+            return False
+        
+        storage = self._mutable_storage()
+        neighbors = [j for j, _ in storage.neighbors(vertex_index)]
+        neighbors.extend(i for i, _ in self._in_neighbors(vertex_index))
+        storage.clear_vertex(vertex_index)
+        self._edges.clear_vertex(vertex_index, neighbors)
+        
+        removed_vertex = dict(self.vertices[vertex_index])  # A visão morre com o slot
+        self.vertices[vertex_index] = None
+        self._free.append(vertex_index)
+        key = _normalize_name(removed_vertex.get('nome', ''))
+        if self._name_index.get(key) == vertex_index:
+            del self._name_index[key]
+        self._touch()
+        
+        self._report(f"Vértice '{removed_vertex['nome']}' removido com sucesso.")
+        return True
+    
+    def remove_edge(self, v1: int, v2: int) -> bool:
+        """Remove uma aresta entre v1 e v2"""
+        if not self.is_live(v1) or not self.is_live(v2):
+            self._report("Índices inválidos.")
+            return False
+        
+        self._write_edge(v1, v2, None)
+        
+        v1_nome = self.vertices[v1]['nome']
+        v2_nome = self.vertices[v2]['nome']
+        self._report(f"Aresta entre '{v1_nome}' e '{v2_nome}' removida.")
+        return True
+    
+    def update_vertex(self, vertex_index: int, new_data: dict) -> bool:
+        """Atualiza as informações de um vértice"""
+        if not self.is_live(vertex_index):
+            self._report("Índice inválido.")
+            return False
+        
+        old_name = self.vertices[vertex_index]['nome']
+        if 'nome' in new_data:
+            key = _normalize_name(new_data['nome'])
+            owner = self._name_index.get(key, vertex_index)
+            if owner != vertex_index:
+                self._report(f"Erro: Já existe um objeto celeste com o nome '{new_data['nome'].strip()}'.")
+                return False
+            if self._name_index.get(_normalize_name(old_name)) == vertex_index:
+                del self._name_index[_normalize_name(old_name)]
+            self._name_index[key] = vertex_index
+        
+        self.vertices[vertex_index].update(new_data)
+        new_name = self.vertices[vertex_index]['nome']
+        if 'coordenadas' in new_data or 'distancia_ua' in new_data:
+            self._touch()  # A escala da heurística de A* depende das posições
+        
+        self._report(f"Vértice atualizado: '{old_name}' -> '{new_name}'")
+        return True
+    
+    def update_edge(self, v1: int, v2: int, new_weight: float) -> bool:
+        """Atualiza o peso de uma aresta"""
+        if not self.is_live(v1) or not self.is_live(v2):
+            self._report("Índices inválidos.")
+            return False
+        
+        if (v1, v2) not in self._edges:
+            self._report("Aresta não existe.")
+            return False
+        
+        self._write_edge(v1, v2, new_weight)
+        
+        v1_nome = self.vertices[v1]['nome']
+        v2_nome = self.vertices[v2]['nome']
+        self._report(f"Peso da aresta '{v1_nome}' -> '{v2_nome}' atualizado para {new_weight}")
+        return True
+    
+    def index_of(self, name: str) -> int:
+        """Índice do vértice com esse nome (sem diferenciar caixa e acentos), ou -1"""
+        return self._name_index.get(_normalize_name(name), -1)
+    
+    def _rebuild_name_index(self) -> None:
+        """Remonta o índice de nomes a partir da lista de vértices em O(V)"""
+        self._name_index = {}
+        for i, vertex in self.live_vertices():
+            self._name_index.setdefault(_normalize_name(vertex.get('nome', '')), i)
+    
+    def is_live(self, vertex: int) -> bool:
+        """True se vertex é um índice válido e não removido"""
+        return self.vertices.is_live(vertex)
+    
+    @property
+    def vertex_count(self) -> int:
+        """Número de vértices vivos (slots menos lápides)"""
+        return len(self.vertices) - len(self._free)
+    
+    def live_vertices(self) -> Iterator[Tuple[int, dict]]:
+        """(índice, dados) de cada vértice não removido, em ordem de índice"""
+        vertices = self.vertices
+        for i in range(len(vertices)):
+            if vertices.is_live(i):
+                yield i, vertices[i]
+    
+    def compact(self) -> List[int]:
+        """
+        Recupera os slots removidos numa única passada: renumera os vértices vivos
+        em ordem e remonta backend, lista de arcos e índice de nomes. Devolve o
+        mapeamento antigo -> novo (-1 para os removidos), para quem guarda índices.
+        """
+        mapping = [-1] * len(self.vertices)
+        keep = []
+        for i, _ in self.live_vertices():
+            mapping[i] = len(keep)
+            keep.append(i)
+        if len(keep) == len(self.vertices):
+            return mapping
+        
+        self._mutable_storage().compact(keep, mapping)
+        self._edges.compact(mapping)
+        self.vertices.compact(keep)
+        self._free = []
+        self._name_index = {key: mapping[i] for key, i in self._name_index.items()}
+        self._touch()
+        return mapping
+    
+    # ========================================
+    # MÉTODOS DE CONSULTA E INFORMAÇÃO
+    # ========================================
+    
+    def get_vertex_info(self, vertex_index: int) -> Optional[dict]:
+        """Consulta informações de um vértice"""
+        if not self.is_live(vertex_index):
+            self._report("Índice inválido.")
+            return None
+        
+        vertex = self.vertices[vertex_index]
+        self._report(f"\nInformações do vértice {vertex_index + 1}:")
+        for key, value in vertex.items():
+            self._report(f"  {key}: {value}")
+        
+        # Mostrar conexões
+        self._report(f"  Conexões:")
+        for i, weight in self._out_arcs(vertex_index):
+            target_name = self.vertices[i]['nome']
+            self._report(f"    -> {target_name} (peso: {weight})")
+        
+        return vertex
+    
+    def get_edge_info(self, v1: int, v2: int) -> Optional[float]:
+        """Consulta informações de uma aresta"""
+        if not self.is_live(v1) or not self.is_live(v2):
+            self._report("Índices inválidos.")
+            return None
+        
+        # Presença pela lista explícita: arestas de peso zero ou negativo existem
+        weight = self._edges.weights.get((v1, v2))
+        if weight is None:
+            self._report("Aresta não existe.")
+            return None
+        
+        v1_nome = self.vertices[v1]['nome']
+        v2_nome = self.vertices[v2]['nome']
+        self._report(f"Aresta '{v1_nome}' -> '{v2_nome}': peso {weight}")
+        return weight
+    
+    def list_graph_info(self) -> GraphInfo:
+        """Informações gerais do grafo (ConsoleReporter.graph_info as imprime)"""
+        # Contar arestas pela lista explícita (inclui pesos zero e negativos)
+        edge_count = len(self._edges)
+        if not self.is_directed:
+            loops = sum(1 for u, v, _ in self._edges if u == v)
+            edge_count = (edge_count + loops) // 2  # Cada aresta aparece nos dois sentidos
+        
+        vertices = [(i, vertex.get('nome')) for i, vertex in self.live_vertices()]
+        return GraphInfo(self.vertex_count, edge_count, self.is_directed, self.is_weighted, vertices)
+    
+    def find_brightest_star(self):
+        """Encontra a estrela mais brilhante (menor magnitude)"""
+        if not self.vertex_count:
+            self._report("Grafo vazio.")
+            return
+        
+        # O(1) pelo índice ordenado de magnitudes (montado na primeira consulta)
+        found = self.vertices.magnitude_index().brightest()
+        
+        if found is not None:
+            brightest, min_magnitude = found
+            self._report(f"\nEstrela mais brilhante:")
+            self._report(f"  [{brightest+1}] {self.vertices.attribute(brightest, 'nome', '')}")
+            self._report(f"  Magnitude: {min_magnitude}")
+        else:
+            self._report("Nenhuma estrela com magnitude definida encontrada.")
+        return found
+    
+    def brightest_stars(self, k: int) -> List[int]:
+        """Índices dos k objetos mais brilhantes (menor magnitude primeiro), em O(k)"""
+        return self.vertices.magnitude_index().top(k)
+    
+    def stars_in_magnitude_range(self, low: float, high: float) -> List[int]:
+        """Índices dos objetos com low <= magnitude <= high, em O(log n + k)"""
+        return self.vertices.magnitude_index().between(low, high)
+    
+    def count_by_constellation(self) -> Dict[str, int]:
+        """Número de objetos por constelação, em ordem alfabética ({} se o grafo está vazio)"""
+        counts = self.vertices.count_constellations('Não definido')
+        return dict(sorted(counts.items(), key=lambda item: str(item[0])))
+    
+    def listar_todas_estrelas(self) -> List[Tuple[int, Optional[str], Any, Any]]:
+        """
+        (índice, nome, magnitude, constelação) de cada estrela/planeta vivo, em ordem
+        de índice; atributos ausentes vêm como None (ConsoleReporter.star_list imprime)
+        """
+        return [(i, vertice.get('nome'), vertice.get('magnitude'), vertice.get('constelacao'))
+                for i, vertice in self.live_vertices()]
+    
+    def list_most_connected_stars(self) -> List[Tuple[int, int, str]]:
+        """(conexões, índice, nome) de cada vértice vivo, do mais para o menos conectado"""
+        connections = []
+        for i, vertex in self.live_vertices():
+            count = sum(1 for _ in self._out_arcs(i))
+            connections.append((count, i, vertex.get('nome')))
+        
+        connections.sort(reverse=True)
+        return connections
+
+    def exibir_matriz_adjacencia(self):
+        """
+        Exibe a matriz de adjacência verdadeira (apenas 0s e 1s)
+        """
+        if not self.vertex_count:
+            self._report("Grafo vazio.")
+            return
+        
+        live = [i for i, _ in self.live_vertices()]  # Lápides não aparecem na matriz
+        
+        self._report(f"\nMATRIZ DE ADJACENCIA (apenas conectividade)")
+        self._report("=" * 80)
+        
+        # Cabeçalho
+        header = "      "
+        for i in live:
+            nome = self.vertices[i]['nome']
+            if "Constelacao" in nome or "Constelação" in nome:
+                abbrev = nome.split()[-1][:3]
+            elif "estrela" in nome:
+                abbrev = nome.split()[0][:3]
+            else:
+                abbrev = nome[:3]
+            header += f"{abbrev:>4}"
+        
+        self._report(header)
+        
+        # Matriz só com 0 e 1
+        for i in live:
+            nome = self.vertices[i]['nome']
+            if "Constelacao" in nome or "Constelação" in nome:
+                linha_label = nome.split()[-1][:3]
+            elif "estrela" in nome:
+                linha_label = nome.split()[0][:3]
+            else:
+                linha_label = nome[:3]
+            
+            linha = f"{linha_label:>6}"
+            
+            for j in live:
+                # APENAS 0 ou 1 - SEM DECIMAIS
+                if self._storage.get(i, j) > 0:
+                    linha += "   1"
+                else:
+                    linha += "   0"
+            
+            self._report(linha)
+        
+        self._report("=" * 80)
+        self._report("1 = CONECTADO | 0 = NAO CONECTADO")
+
+    def carregar_rede_estelar_predefinida(self):
+        """
+        Carrega uma rede estelar predefinida com dados astronômicos reais
+        """
+        # Limpar grafo existente (um snapshot CSR é descartado junto)
+        self.vertices = VertexTable()
+        self._free = []
+        self._name_index = {}
+        self._storage = STORAGE_BACKENDS[self.storage_kind]()
+        self._edges = EdgeList()
+        self._touch()
+        
+        # Definir vértices com informações astronômicas detalhadas
+        # (distancia_ua = distância média ao Sol, usada como heurística pelo A*)
+        vertices_data = [
+            {"nome": "Constelação de Órion", "magnitude": None, "constelacao": "Área do céu"},
+            {"nome": "Betelgeuse (estrela em Órion)", "magnitude": 0.42, "constelacao": "Órion"},
+            {"nome": "Rigel (estrela em Órion)", "magnitude": 0.18, "constelacao": "Órion"},
+            {"nome": "Constelação do Escorpião", "magnitude": None, "constelacao": "Área do céu"},
+            {"nome": "Antares (estrela em Escorpião)", "magnitude": 1.06, "constelacao": "Escorpião"},
+            {"nome": "Shaula (estrela em Escorpião)", "magnitude": 1.62, "constelacao": "Escorpião"},
+            {"nome": "Constelação da Ursa Maior", "magnitude": None, "constelacao": "Área do céu"},
+            {"nome": "Dubhe (estrela na Ursa Maior)", "magnitude": 1.81, "constelacao": "Ursa Maior"},
+            {"nome": "Merak (estrela na Ursa Maior)", "magnitude": 2.34, "constelacao": "Ursa Maior"},
+            {"nome": "Constelação de Pégaso", "magnitude": None, "constelacao": "Área do céu"},
+            {"nome": "Markab (estrela em Pégaso)", "magnitude": 2.49, "constelacao": "Pégaso"},
+            {"nome": "Scheat (estrela em Pégaso)", "magnitude": 2.44, "constelacao": "Pégaso"},
+            {"nome": "Sol", "magnitude": -26.74, "constelacao": "Sistema Solar", "distancia_ua": 0.0},
+            {"nome": "Mercúrio", "magnitude": -1.9, "constelacao": "Sistema Solar", "distancia_ua": 0.39},
+            {"nome": "Vênus", "magnitude": -4.6, "constelacao": "Sistema Solar", "distancia_ua": 0.72},
+            {"nome": "Terra", "magnitude": None, "constelacao": "Sistema Solar", "distancia_ua": 1.0},
+            {"nome": "Marte", "magnitude": -2.94, "constelacao": "Sistema Solar", "distancia_ua": 1.52},
+            {"nome": "Júpiter", "magnitude": -2.7, "constelacao": "Sistema Solar", "distancia_ua": 5.2},
+            {"nome": "Saturno", "magnitude": 0.46, "constelacao": "Sistema Solar", "distancia_ua": 9.5},
+            {"nome": "Urano", "magnitude": 5.68, "constelacao": "Sistema Solar", "distancia_ua": 19.2},
+            {"nome": "Netuno", "magnitude": 7.8, "constelacao": "Sistema Solar", "distancia_ua": 30.0},
+            {"nome": "Plutão", "magnitude": 14.0, "constelacao": "Sistema Solar", "distancia_ua": 39.5}
+        ]
+        
+        # Adicionar todos os vértices
+        for vertex_data in vertices_data:
+            self.add_vertex(vertex_data)
+        
+        # Define as arestas (usando pesos variados para demonstrar algoritmos)
+        edges = [
+            # Constelações -> Estrelas (peso 1.0)
+            (0, 1, 1.0), (0, 2, 1.0),  # Órion -> Betelgeuse, Rigel
+            (3, 4, 1.0), (3, 5, 1.0),  # Escorpião -> Antares, Shaula
+            (6, 7, 1.0), (6, 8, 1.0),  # Ursa Maior -> Dubhe, Merak
+            (9, 10, 1.0), (9, 11, 1.0), # Pégaso -> Markab, Scheat
+            
+            # Sol <-> Planetas (pesos representando distâncias aproximadas em UA)
+            (12, 13, 0.39), (13, 12, 0.39),  # Sol <-> Mercúrio
+            (12, 14, 0.72), (14, 12, 0.72),  # Sol <-> Vênus
+            (12, 15, 1.0), (15, 12, 1.0),    # Sol <-> Terra
+            (12, 16, 1.52), (16, 12, 1.52),  # Sol <-> Marte
+            (12, 17, 5.2), (17, 12, 5.2),    # Sol <-> Júpiter
+            (12, 18, 9.5), (18, 12, 9.5),    # Sol <-> Saturno
+            (12, 19, 19.2), (19, 12, 19.2),  # Sol <-> Urano
+            (12, 20, 30.0), (20, 12, 30.0),  # Sol <-> Netuno
+            (12, 21, 39.5), (21, 12, 39.5),  # Sol <-> Plutão
+            
+            # Vizinhança orbital (pesos representando diferença de distância)
+            (13, 14, 0.33), # Mercúrio -> Vênus
+            (14, 15, 0.28), # Vênus -> Terra
+            (15, 16, 0.52), # Terra -> Marte
+            (16, 17, 3.68), # Marte -> Júpiter
+            (17, 18, 4.3),  # Júpiter -> Saturno
+            (18, 19, 9.7),  # Saturno -> Urano
+            (19, 20, 10.8), # Urano -> Netuno
+            (20, 21, 9.5),  # Netuno -> Plutão
+        ]
+        
+        # Adicionar todas as arestas (serão automaticamente bidirecionais)
+        for origem, destino, peso in edges:
+            if origem < len(self.vertices) and destino < len(self.vertices):
+                self.add_edge(origem, destino, peso)
     
     # ========================================
-    # MÉTODOS BÁSICOS DO GRAFO
+    # IMPLEMENTAÇÃO PRÓPRIA DE FILA DE PRIORIDADE (SEM BIBLIOTECAS)
+    # ========================================
+    class MinHeap:
+        """Implementação própria de min-heap para substituir heapq"""
+        def __init__(self):
+            self.heap = []
+        
+        def push(self, item):
+            """Insere item (custo, vertice) no heap"""
+            self.heap.append(item)
+            self._heapify_up(len(self.heap) - 1)
+        
+        def pop(self):
+            """Remove e retorna o item com menor custo"""
+            if not self.heap:
+                return None
+            
+            if len(self.heap) == 1:
+                return self.heap.pop()
+            
+            root = self.heap[0]
+            self.heap[0] = self.heap.pop()
+            self._heapify_down(0)
+            return root
+        
+        def is_empty(self):
+            return len(self.heap) == 0
+        
+        def _heapify_up(self, index):
+            if index == 0:
+                return
+            
+            parent_index = (index - 1) // 2
+            if self.heap[index][0] < self.heap[parent_index][0]:
+                self.heap[index], self.heap[parent_index] = self.heap[parent_index], self.heap[index]
+                self._heapify_up(parent_index)
+        
+        def _heapify_down(self, index):
+            left_child = 2 * index + 1
+            right_child = 2 * index + 2
+            smallest = index
+            
+            if (left_child < len(self.heap) and 
+                self.heap[left_child][0] < self.heap[smallest][0]):
+                smallest = left_child
+            
+            if (right_child < len(self.heap) and 
+                self.heap[right_child][0] < self.heap[smallest][0]):
+                smallest = right_child
+            
+            if smallest != index:
+                self.heap[index], self.heap[smallest] = self.heap[smallest], self.heap[index]
+                self._heapify_down(smallest)
+    
+    class IndexedMinHeap:
+        """
+        Min-heap binário indexado com decrease_key, para itens inteiros em [0, capacity).
+        Guarda tudo em vetores planos indexados por posição/item: heap (itens),
+        keys (prioridade por item) e position (posição de cada item no heap, -1 se
+        ausente), sem tuplas por entrada. Cada item aparece no máximo uma vez, então
+        o heap nunca passa de capacity entradas.
+        """
+        def __init__(self, capacity: int):
+            self.heap = []
+            self.keys = [0.0] * capacity
+            self.position = [-1] * capacity
+        
+        def __len__(self):
+            return len(self.heap)
+        
+        def __contains__(self, item: int) -> bool:
+            return self.position[item] != -1
+        
+        def is_empty(self):
+            return len(self.heap) == 0
+        
+        def peek_key(self) -> float:
+            """Menor prioridade presente (inf se vazio)"""
+            return self.keys[self.heap[0]] if self.heap else float('inf')
+        
+        def push(self, item: int, key: float) -> None:
+            """Insere item com a prioridade key"""
+            self.keys[item] = key
+            self.position[item] = len(self.heap)
+            self.heap.append(item)
+            self._sift_up(len(self.heap) - 1)
+        
+        def decrease_key(self, item: int, key: float) -> None:
+            """Reduz a prioridade de um item já presente"""
+            self.keys[item] = key
+            self._sift_up(self.position[item])
+        
+        def clear(self) -> None:
+            """Esvazia o heap em O(tamanho), sem realocar os vetores"""
+            for item in self.heap:
+                self.position[item] = -1
+            self.heap.clear()
+        
+        def push_or_decrease(self, item: int, key: float) -> None:
+            if self.position[item] == -1:
+                self.push(item, key)
+            elif key < self.keys[item]:
+                self.decrease_key(item, key)
+        
+        def pop(self) -> Tuple[float, int]:
+            """Remove e retorna (prioridade, item) de menor prioridade"""
+            heap = self.heap
+            root = heap[0]
+            last = heap.pop()
+            self.position[root] = -1
+            if heap:
+                heap[0] = last
+                self.position[last] = 0
+                self._sift_down(0)
+            return self.keys[root], root
+        
+        def _sift_up(self, index: int) -> None:
+            heap, keys, position = self.heap, self.keys, self.position
+            item = heap[index]
+            key = keys[item]
+            while index > 0:
+                parent_index = (index - 1) >> 1
+                parent = heap[parent_index]
+                if key >= keys[parent]:
+                    break
+                heap[index] = parent
+                position[parent] = index
+                index = parent_index
+            heap[index] = item
+            position[item] = index
+        
+        def _sift_down(self, index: int) -> None:
+            heap, keys, position = self.heap, self.keys, self.position
+            size = len(heap)
+            item = heap[index]
+            key = keys[item]
+            while True:
+                child = 2 * index + 1
+                if child >= size:
+                    break
+                right = child + 1
+                if right < size and keys[heap[right]] < keys[heap[child]]:
+                    child = right
+                if keys[heap[child]] >= key:
+                    break
+                heap[index] = heap[child]
+                position[heap[index]] = index
+                index = child
+            heap[index] = item
+            position[item] = index
+    
+    # ========================================
+    # ALGORITMOS DE BUSCA CORRIGIDOS (SEGUINDO TODAS AS REGRAS)
     # ========================================
     
-    def add_vertex(self, vertex_data: dict) -> int:
-        """Adiciona um vértice ao grafo"""
-        # Verificar se já existe um vértice com o mesmo nome
-        nome_novo = vertex_data.get('nome', '').strip()
-        for vertex in self.vertices:
-            if vertex.get('nome', '').strip().lower() == nome_novo.lower():
-                print(f"Erro: Já existe um objeto celeste com o nome '{nome_novo}'.")
-                return -1  # Retorna -1 para indicar erro
+    def dfs_all_paths(self, start: int, target: int) -> PathSearchResult:
+        """
+        DFS que encontra TODOS os caminhos possíveis
+        Retorna: (lista_de_caminhos, lista_de_custos)
+        """
+        if not self._validate_input(start, target):
+            return PathSearchResult([], [])
         
-        self.vertices.append(vertex_data)
+        if start == target:
+            return PathSearchResult([[start]], [0.0])
         
-        # Expandir a matriz de adjacência
-        n = len(self.vertices)
+        all_paths = []
+        all_costs = []
+        for path, cost in self.iter_dfs_paths(start, target):
+            all_paths.append(path)
+            all_costs.append(cost)
         
-        # Adicionar nova linha
-        self.adjacency_matrix.append([0.0] * n)
+        if not all_paths:
+            self._report(f"DFS: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
         
-        # Adicionar nova coluna a todas as linhas existentes
-        for i in range(n - 1):
-            self.adjacency_matrix[i].append(0.0)
+        # Encontrar caminho ótimo (menor custo)
+        min_cost = min(all_costs)
+        optimal_indices = [i for i, cost in enumerate(all_costs) if cost == min_cost]
         
-        return n - 1  # Retorna o índice do vértice adicionado
+        self._report_paths("DFS", all_paths, all_costs, optimal_indices, start, target)
+        return PathSearchResult(all_paths, all_costs)
     
-    def add_edge(self, v1: int, v2: int, weight: float = 1.0) -> None:
-        """Adiciona uma aresta entre v1 e v2"""
-        if not (0 <= v1 < len(self.vertices)) or not (0 <= v2 < len(self.vertices)):
-            return  # Silencioso para não quebrar o carregamento
+    def iter_dfs_paths(self, start: int, target: int, limit: Optional[int] = None,
+                       max_depth: Optional[int] = None, max_cost: Optional[float] = None,
+                       optimal_only: bool = False) -> Iterator[Tuple[List[int], float]]:
+        """
+        DFS em streaming: gera (caminho, custo) de cada caminho simples assim que é encontrado.
+        - limit: para depois de gerar esse número de caminhos
+        - max_depth: descarta caminhos com mais arestas que isso
+        - max_cost: poda ramos cujo custo parcial já passa desse valor
+        - optimal_only: poda ramos mais caros que o melhor caminho já encontrado; cada
+          caminho gerado empata ou melhora os anteriores, então o último é ótimo
+        """
+        if not self._validate_input(start, target):
+            return
         
-        val = weight if self.is_weighted else 1.0
-        self.adjacency_matrix[v1][v2] = val
+        if start == target:
+            yield [start], 0.0
+            return
         
-        if not self.is_directed:
-            self.adjacency_matrix[v2][v1] = val
+        if limit is not None and limit <= 0:
+            return
+        
+        best = float('inf')
+        
+        def expand(vertex: int):
+            return ((neighbor, weight) for neighbor, weight in self._neighbors(vertex) if weight > 0)
+        
+        def prune(cost: float) -> bool:
+            if max_cost is not None and cost > max_cost and not _same_cost(cost, max_cost):
+                return True
+            return optimal_only and cost > best and not _same_cost(cost, best)
+        
+        produced = 0
+        for path, cost in _walk_paths(start, target, expand, max_depth, prune):
+            best = min(best, cost)
+            produced += 1
+            yield list(path), cost
+            if limit is not None and produced >= limit:
+                return
     
-    def remove_vertex(self, vertex_index: int) -> bool:
-        """Remove um vértice do grafo"""
-        if not (0 <= vertex_index < len(self.vertices)):
-            print("Índice inválido.")
-            return False
+    def bfs_all_paths(self, start: int, target: int) -> PathSearchResult:
+        """
+        BFS que encontra TODOS os caminhos com menor número de arestas
+        """
+        if not self._validate_input(start, target):
+            return PathSearchResult([], [])
         
-        # Remove o vértice da lista
-        removed_vertex = self.vertices.pop(vertex_index)
+        if start == target:
+            return PathSearchResult([[start]], [0.0])
         
-        # Remove a linha correspondente da matriz
-        self.adjacency_matrix.pop(vertex_index)
+        result = self.bfs_shortest_paths(start, target)
         
-        # Remove a coluna correspondente de todas as linhas
-        for row in self.adjacency_matrix:
-            row.pop(vertex_index)
+        all_paths = result.paths()
+        all_costs = [self._path_cost(path) for path in all_paths]
         
-        print(f"Vértice '{removed_vertex['nome']}' removido com sucesso.")
-        return True
+        if not all_paths:
+            self._report(f"BFS: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
+        
+        # Para BFS, o ótimo é o de menor custo entre os de menor distância
+        min_cost = min(all_costs)
+        optimal_indices = [i for i, cost in enumerate(all_costs) if cost == min_cost]
+        
+        self._report_paths("BFS", all_paths, all_costs, optimal_indices, start, target)
+        return PathSearchResult(all_paths, all_costs)
     
-    def remove_edge(self, v1: int, v2: int) -> bool:
-        """Remove uma aresta entre v1 e v2"""
-        if not (0 <= v1 < len(self.vertices)) or not (0 <= v2 < len(self.vertices)):
-            print("Índices inválidos.")
-            return False
+    def bfs_shortest_paths(self, start: int, target: int) -> ShortestPathDAG:
+        """
+        BFS nível a nível com fila FIFO (deque) e múltiplos pais por vértice.
+        Constrói em O(V + E) o DAG de todos os caminhos com menor número de arestas;
+        os caminhos só são reconstruídos ao final, a partir do ShortestPathDAG.
+        """
+        level = {start: 0}
+        parents = {start: []}
+        frontier = deque([start])
+        
+        while frontier and target not in level:
+            # Expande exatamente um nível; os pais do destino ficam todos no nível anterior
+            for _ in range(len(frontier)):
+                current = frontier.popleft()
+                next_level = level[current] + 1
+                for neighbor, weight in self._neighbors(current):
+                    if weight <= 0:
+                        continue
+                    if neighbor not in level:
+                        level[neighbor] = next_level
+                        parents[neighbor] = [current]
+                        frontier.append(neighbor)
+                    elif level[neighbor] == next_level:
+                        parents[neighbor].append(current)
+        
+        hops = float(level[target]) if target in level else float('inf')
+        return ShortestPathDAG(start, target, hops, parents)
+    
+    def _path_cost(self, path: List[int]) -> float:
+        """Soma dos pesos das arestas de um caminho"""
+        return sum(self._storage.get(a, b) for a, b in zip(path, path[1:]))
+    
+    def dijkstra_all_paths(self, start: int, target: int) -> PathSearchResult:
+        """
+        Dijkstra que encontra TODOS os caminhos ótimos (mesmo custo mínimo)
+        SEM usar bibliotecas externas
+        """
+        if not self._validate_input(start, target):
+            return PathSearchResult([], [])
         
-        self.adjacency_matrix[v1][v2] = 0.0
-        if not self.is_directed:
-            self.adjacency_matrix[v2][v1] = 0.0
+        if start == target:
+            return PathSearchResult([[start]], [0.0])
         
-        v1_nome = self.vertices[v1]['nome']
-        v2_nome = self.vertices[v2]['nome']
-        print(f"Aresta entre '{v1_nome}' e '{v2_nome}' removida.")
-        return True
+        result = self.dijkstra_shortest_paths(start, target)
+        
+        if not result:
+            self._report(f"Dijkstra: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
+        
+        all_paths = result.paths()
+        all_costs = [result.cost] * len(all_paths)
+        
+        # Todos os caminhos já são ótimos (mesmo custo)
+        optimal_indices = list(range(len(all_paths)))
+        
+        self._report_paths("Dijkstra", all_paths, all_costs, optimal_indices, start, target)
+        return PathSearchResult(all_paths, all_costs)
     
-    def update_vertex(self, vertex_index: int, new_data: dict) -> bool:
-        """Atualiza as informações de um vértice"""
-        if not (0 <= vertex_index < len(self.vertices)):
-            print("Índice inválido.")
-            return False
+    def dijkstra_shortest_paths(self, start: int, target: int) -> ShortestPathDAG:
+        """
+        Dijkstra que guarda apenas os predecessores ótimos de cada vértice e a
+        contagem de caminhos. Para ao fixar o destino e retorna um ShortestPathDAG
+        que conta, enumera ou sorteia os caminhos ótimos sob demanda.
+        """
+        distances, predecessors, path_counts = self._dijkstra_tree(start, {target})
+        return ShortestPathDAG(start, target, distances[target], predecessors, path_counts)
+    
+    def _dijkstra_tree(self, start: int, targets: Optional[set] = None):
+        """
+        Árvore (DAG) de caminhos mínimos a partir de start: (distâncias, predecessores
+        ótimos, contagem de caminhos). Para assim que todos os targets forem fixados.
+        """
+        n = len(self.vertices)
+        pending = len(targets) if targets else -1
+        distances = [float('inf')] * n
+        distances[start] = 0.0
+        predecessors = [[] for _ in range(n)]
+        path_counts = {start: 1}
         
-        old_name = self.vertices[vertex_index]['nome']
-        self.vertices[vertex_index].update(new_data)
-        new_name = self.vertices[vertex_index]['nome']
+        # Heap indexado próprio: cada vértice entra uma única vez (decrease_key)
+        pq = self.IndexedMinHeap(n)
+        pq.push(start, 0.0)
+        visited = set()
         
-        print(f"Vértice atualizado: '{old_name}' -> '{new_name}'")
-        return True
+        while not pq.is_empty():
+            current_dist, current = pq.pop()
+            visited.add(current)
+            if targets and current in targets:
+                pending -= 1
+                if pending == 0:
+                    break  # Todos os predecessores dos destinos já foram fixados
+            
+            for neighbor, weight in self._neighbors(current):
+                if weight <= 0 or neighbor in visited:
+                    continue
+                distance = current_dist + weight
+                
+                if _same_cost(distance, distances[neighbor]):
+                    # Caminho alternativo com mesmo custo
+                    predecessors[neighbor].append(current)
+                    path_counts[neighbor] += path_counts[current]
+                elif distance < distances[neighbor]:
+                    # Encontrou caminho melhor
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = [current]
+                    path_counts[neighbor] = path_counts[current]
+                    pq.push_or_decrease(neighbor, distance)
+        
+        return distances, predecessors, path_counts
     
-    def update_edge(self, v1: int, v2: int, new_weight: float) -> bool:
-        """Atualiza o peso de uma aresta"""
-        if not (0 <= v1 < len(self.vertices)) or not (0 <= v2 < len(self.vertices)):
-            print("Índices inválidos.")
-            return False
+    def route_batch(self, pairs: List[Tuple[int, int]]) -> RouteBatch:
+        """
+        Responde muitos pares (start, target) sem imprimir nada: os pares são agrupados
+        por origem e cada origem distinta roda um único Dijkstra, interrompido quando
+        todos os seus destinos foram fixados.
+        """
+        n = len(self.vertices)
+        pairs = [(int(start), int(target)) for start, target in pairs]
+        by_source: Dict[int, set] = {}
+        for start, target in pairs:
+            if not (0 <= start < n and 0 <= target < n):
+                raise ValueError(f"Par inválido: ({start}, {target})")
+            by_source.setdefault(start, set()).add(target)
+        
+        trees = {start: self._dijkstra_tree(start, targets) for start, targets in by_source.items()}
+        costs = array('d', (trees[start][0][target] for start, target in pairs))
+        return RouteBatch(pairs, costs, trees)
+    
+    def bidirectional_dijkstra_all_paths(self, start: int, target: int) -> PathSearchResult:
+        """
+        Dijkstra bidirecional que encontra TODOS os caminhos ótimos entre start e target
+        """
+        if not self._validate_input(start, target):
+            return PathSearchResult([], [])
+        
+        if start == target:
+            return PathSearchResult([[start]], [0.0])
         
-        if self.adjacency_matrix[v1][v2] == 0:
-            print("Aresta não existe.")
-            return False
+        result = self.bidirectional_dijkstra_shortest_paths(start, target)
         
-        self.adjacency_matrix[v1][v2] = new_weight
-        if not self.is_directed:
-            self.adjacency_matrix[v2][v1] = new_weight
+        if not result:
+            self._report(f"Dijkstra Bidirecional: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
         
-        v1_nome = self.vertices[v1]['nome']
-        v2_nome = self.vertices[v2]['nome']
-        print(f"Peso da aresta '{v1_nome}' -> '{v2_nome}' atualizado para {new_weight}")
-        return True
+        all_paths = result.paths()
+        all_costs = [result.cost] * len(all_paths)
+        optimal_indices = list(range(len(all_paths)))
+        
+        self._report_paths("Dijkstra Bidirecional", all_paths, all_costs, optimal_indices, start, target)
+        return PathSearchResult(all_paths, all_costs)
     
-    # ========================================
-    # MÉTODOS DE CONSULTA E INFORMAÇÃO
-    # ========================================
+    def bidirectional_dijkstra_shortest_paths(self, start: int, target: int) -> ShortestPathDAG:
+        """
+        Busca simultânea a partir de start (arestas de saída) e de target (arestas de
+        entrada), sempre avançando a fronteira de menor chave. Para quando a soma das
+        duas chaves mínimas ultrapassa o melhor custo de encontro (mu): nesse ponto
+        todo vértice de um caminho ótimo já foi fixado por pelo menos um dos lados.
+        Os caminhos ótimos são a junção do DAG de predecessores da busca direta com o
+        DAG de sucessores da busca reversa, por meio dos arcos de encontro.
+        """
+        n = len(self.vertices)
+        inf = float('inf')
+        if start == target:
+            return ShortestPathDAG(start, target, 0.0, {start: []})
+        
+        dist = ([inf] * n, [inf] * n)                        # 0 = direta, 1 = reversa
+        links = ({}, {})                                     # predecessores / sucessores
+        settled = (bytearray(n), bytearray(n))
+        expand = (self._neighbors, self._in_neighbors)
+        queues = (self.IndexedMinHeap(n), self.IndexedMinHeap(n))
+        
+        for side, source in ((0, start), (1, target)):
+            dist[side][source] = 0.0
+            queues[side].push(source, 0.0)
+        
+        forward_order = []  # vértices fixados pela busca direta, em ordem
+        mu = inf
+        while not queues[0].is_empty() and not queues[1].is_empty():
+            key_f, key_b = queues[0].peek_key(), queues[1].peek_key()
+            if key_f + key_b > mu and not _same_cost(key_f + key_b, mu):
+                break
+            
+            side = 0 if key_f <= key_b else 1
+            my_dist, other_dist, my_links = dist[side], dist[1 - side], links[side]
+            current_dist, current = queues[side].pop()
+            settled[side][current] = 1
+            if side == 0:
+                forward_order.append(current)
+            
+            for neighbor, weight in expand[side](current):
+                if weight <= 0 or settled[side][neighbor]:
+                    continue
+                distance = current_dist + weight
+                if _same_cost(distance, my_dist[neighbor]):
+                    my_links[neighbor].append(current)
+                elif distance < my_dist[neighbor]:
+                    my_dist[neighbor] = distance
+                    my_links[neighbor] = [current]
+                    queues[side].push_or_decrease(neighbor, distance)
+                
+                if other_dist[neighbor] != inf:
+                    mu = min(mu, distance + other_dist[neighbor])
+        
+        if mu == inf:
+            return ShortestPathDAG(start, target, inf, {})
+        
+        forward_settled, backward_settled = settled
+        dist_f, dist_b = dist
+        preds_f, succ_b = links
+        
+        # Vértices fixados pela busca direta mantêm seus predecessores ótimos
+        predecessors = {v: preds_f.get(v, []) for v in forward_order}
+        
+        # Arcos de encontro u->v: u fixado na direta, v só na reversa, e custo total = mu
+        meeting = []
+        for u in forward_order:
+            for v, weight in self._neighbors(u):
+                if (weight > 0 and not forward_settled[v] and backward_settled[v]
+                        and _same_cost(dist_f[u] + weight + dist_b[v], mu)):
+                    predecessors.setdefault(v, []).append(u)
+                    meeting.append(v)
+        
+        # A partir dos encontros, segue os sucessores ótimos da busca reversa até target
+        seen = set(meeting)
+        frontier = list(seen)
+        while frontier:
+            y = frontier.pop()
+            for z in succ_b.get(y, ()):
+                predecessors.setdefault(z, []).append(y)
+                if z not in seen:
+                    seen.add(z)
+                    frontier.append(z)
+        
+        return ShortestPathDAG(start, target, mu, predecessors)
     
-    def get_vertex_info(self, vertex_index: int) -> Optional[dict]:
-        """Consulta informações de um vértice"""
-        if not (0 <= vertex_index < len(self.vertices)):
-            print("Índice inválido.")
-            return None
+    def astar_all_paths(self, start: int, target: int) -> PathSearchResult:
+        """
+        A* que encontra TODOS os caminhos ótimos, guiado pela distância em linha reta
+        """
+        if not self._validate_input(start, target):
+            return PathSearchResult([], [])
         
-        vertex = self.vertices[vertex_index]
-        print(f"\nInformações do vértice {vertex_index + 1}:")
-        for key, value in vertex.items():
-            print(f"  {key}: {value}")
+        if start == target:
+            return PathSearchResult([[start]], [0.0])
         
-        # Mostrar conexões
-        print(f"  Conexões:")
-        for i, weight in enumerate(self.adjacency_matrix[vertex_index]):
-            if weight > 0:
-                target_name = self.vertices[i]['nome']
-                print(f"    -> {target_name} (peso: {weight})")
+        result = self.astar_shortest_paths(start, target)
         
-        return vertex
-    
-    def get_edge_info(self, v1: int, v2: int) -> Optional[float]:
-        """Consulta informações de uma aresta"""
-        if not (0 <= v1 < len(self.vertices)) or not (0 <= v2 < len(self.vertices)):
-            print("Índices inválidos.")
-            return None
+        if not result:
+            self._report(f"A*: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
         
-        weight = self.adjacency_matrix[v1][v2]
-        if weight == 0:
-            print("Aresta não existe.")
-            return None
+        all_paths = result.paths()
+        all_costs = [result.cost] * len(all_paths)
+        optimal_indices = list(range(len(all_paths)))
         
-        v1_nome = self.vertices[v1]['nome']
-        v2_nome = self.vertices[v2]['nome']
-        print(f"Aresta '{v1_nome}' -> '{v2_nome}': peso {weight}")
-        return weight
+        self._report_paths("A*", all_paths, all_costs, optimal_indices, start, target)
+        return PathSearchResult(all_paths, all_costs)
     
-    def list_graph_info(self):
-        """Lista informações gerais do grafo"""
-        print(f"\n{'='*50}")
-        print(f"INFORMAÇÕES DO GRAFO")
-        print(f"{'='*50}")
-        print(f"Número de vértices: {len(self.vertices)}")
+    @staticmethod
+    def _straight_line(key: str, a, b) -> float:
+        """Distância em linha reta entre duas posições ('coordenadas' ou 'distancia_ua')"""
+        return math.dist(a, b) if key == 'coordenadas' else abs(a - b)
+    
+    def _geometry_scale(self, key: str) -> float:
+        """
+        Fator s que torna s * (distância em linha reta) consistente com os pesos:
+        o menor peso / distância entre os arcos com os dois extremos posicionados.
+        É 0 (A* vira Dijkstra) se algum arco sai de um vértice posicionado para um
+        sem posição, ou liga posições distintas com peso <= 0. Calculado em O(E) e
+        guardado até a próxima alteração do grafo.
+        """
+        if self._geometry is None or self._geometry[0] != self._version:
+            self._geometry = (self._version, {})
+        scales = self._geometry[1]
+        if key in scales:
+            return scales[key]
+        
+        attribute = self.vertices.attribute
+        scale = math.inf
+        for u, v, weight in self._edges:
+            a = attribute(u, key, None)
+            if a is None:
+                continue  # h(u) = 0 nunca passa do custo real
+            b = attribute(v, key, None)
+            if b is None:
+                scale = 0.0
+                break
+            gap = self._straight_line(key, a, b)
+            if gap > 0:
+                if weight <= 0:
+                    scale = 0.0
+                    break
+                scale = min(scale, weight / gap)
+        scales[key] = 0.0 if scale == math.inf else scale
+        return scales[key]
+    
+    def position_heuristic(self, target: int):
+        """
+        Heurística h(v) = s * distância em linha reta de v até target, a partir dos
+        atributos opcionais 'coordenadas' (x, y, z em UA) ou 'distancia_ua' (distância
+        ao Sol: |r_v - r_target| nunca supera a distância real entre os dois).
+        O fator s (_geometry_scale) garante que nenhum arco seja mais curto que a
+        heurística prevê, então h é consistente para quaisquer pesos; vértices sem
+        posição recebem h = 0.
+        """
+        destination = self.vertices[target]
+        for key in ('coordenadas', 'distancia_ua'):
+            target_position = destination.get(key)
+            if target_position is not None:
+                break
+        else:
+            return lambda v: 0.0
+        
+        scale = self._geometry_scale(key)
+        if not scale:
+            return lambda v: 0.0
+        attribute = self.vertices.attribute
+        straight_line = self._straight_line
+        
+        def heuristic(v: int) -> float:
+            position = attribute(v, key, None)
+            return scale * straight_line(key, position, target_position) if position is not None else 0.0
+        return heuristic
+    
+    def astar_shortest_paths(self, start: int, target: int, heuristic=None) -> ShortestPathDAG:
+        """
+        A* com heurística consistente (por padrão, position_heuristic(target)).
+        A fila é ordenada por f = g + h e a busca só termina quando a menor chave
+        passa do custo ótimo, para registrar todos os predecessores empatados.
+        """
+        if heuristic is None:
+            heuristic = self.position_heuristic(target)
         
-        # Contar arestas
-        edge_count = 0
-        for i in range(len(self.vertices)):
-            for j in range(len(self.vertices)):
-                if self.adjacency_matrix[i][j] > 0:
-                    edge_count += 1
+        n = len(self.vertices)
+        inf = float('inf')
+        g = [inf] * n
+        g[start] = 0.0
+        predecessors = {start: []}
+        closed = bytearray(n)
         
-        if not self.is_directed:
-            edge_count //= 2  # Cada aresta é contada duas vezes em grafos não-direcionados
+        pq = self.IndexedMinHeap(n)
+        pq.push(start, heuristic(start))
+        best = inf
         
-        print(f"Número de arestas: {edge_count}")
-        print(f"Tipo: {'Direcionado' if self.is_directed else 'Não-direcionado'}")
-        print(f"Ponderado: {'Sim' if self.is_weighted else 'Não'}")
+        while not pq.is_empty():
+            f = pq.peek_key()
+            if f > best and not _same_cost(f, best):
+                break
+            _, current = pq.pop()
+            closed[current] = 1
+            if current == target:
+                best = g[current]
+                continue  # Não expande o destino; segue só para colher empates
+            
+            for neighbor, weight in self._neighbors(current):
+                if weight <= 0:
+                    continue
+                candidate = g[current] + weight
+                if _same_cost(candidate, g[neighbor]):
+                    # Empate: vale inclusive para vértices já fechados com f igual
+                    predecessors[neighbor].append(current)
+                elif candidate < g[neighbor] and not closed[neighbor]:
+                    g[neighbor] = candidate
+                    predecessors[neighbor] = [current]
+                    pq.push_or_decrease(neighbor, candidate + heuristic(neighbor))
+        
+        return ShortestPathDAG(start, target, g[target], predecessors)
+    
+    def build_landmark_index(self, k: int = 8, seed: Optional[int] = None) -> LandmarkIndex:
+        """
+        Escolhe k landmarks por "ponto mais distante" (cada novo landmark é o vértice
+        mais longe dos já escolhidos) e guarda as distâncias de/para cada um.
+        O índice fica associado ao grafo, é gravado junto com ele por save() e é
+        descartado na primeira alteração.
+        """
+        n = len(self.vertices)
+        inf = float('inf')
+        rng = random.Random(seed)
+        live = [v for v in range(n) if self.is_live(v)]  # Slots removidos nunca viram landmark
+        k = min(k, len(live))
+        
+        landmarks, dist_from, dist_to = [], [], []
+        nearest = [inf] * n  # distância de cada vértice ao landmark mais próximo
+        candidate = rng.choice(live) if live else None
+        
+        for _ in range(k):
+            landmarks.append(candidate)
+            row = array('d', self._dijkstra_row(candidate)[0])
+            dist_from.append(row)
+            if self.is_directed:
+                dist_to.append(array('d', self._dijkstra_row(candidate, reverse=True)[0]))
+            
+            for v in range(n):
+                if row[v] < nearest[v]:
+                    nearest[v] = row[v]
+            chosen = set(landmarks)
+            reachable = [v for v in live if nearest[v] != inf and v not in chosen]
+            if not reachable:
+                # Componente esgotada: recomeça por um vértice ainda não alcançado
+                reachable = [v for v in live if v not in chosen]
+                if not reachable:
+                    break
+                candidate = rng.choice(reachable)
+            else:
+                candidate = max(reachable, key=nearest.__getitem__)
         
-        if self.vertices:
-            print(f"\nVértices:")
-            for i, vertex in enumerate(self.vertices):
-                print(f"  [{i+1:2d}] {vertex['nome']}")
+        self._landmarks = LandmarkIndex(self._version, landmarks, dist_from,
+                                        dist_to if self.is_directed else dist_from)
+        return self._landmarks
     
-    def find_brightest_star(self):
-        """Encontra a estrela mais brilhante (menor magnitude)"""
-        if not self.vertices:
-            print("Grafo vazio.")
-            return
+    def landmark_index(self) -> Optional[LandmarkIndex]:
+        """Índice de landmarks válido para o estado atual do grafo (ou None)"""
+        if self._landmarks is not None and self._landmarks.version != self._version:
+            self._landmarks = None  # Grafo alterado desde a construção
+        return self._landmarks
+    
+    def alt_shortest_paths(self, start: int, target: int) -> ShortestPathDAG:
+        """A* guiado pelos limites dos landmarks (constrói o índice se necessário)"""
+        index = self.landmark_index() or self.build_landmark_index()
+        return self.astar_shortest_paths(start, target, index.heuristic(target))
+    
+    def alt_all_paths(self, start: int, target: int) -> PathSearchResult:
+        """
+        A* com landmarks (ALT) que encontra TODOS os caminhos ótimos
+        """
+        if not self._validate_input(start, target):
+            return PathSearchResult([], [])
         
-        brightest = None
-        min_magnitude = float('inf')
+        if start == target:
+            return PathSearchResult([[start]], [0.0])
         
-        for i, vertex in enumerate(self.vertices):
-            magnitude = vertex.get('magnitude')
-            if magnitude is not None and magnitude < min_magnitude:
-                min_magnitude = magnitude
-                brightest = (i, vertex)
+        result = self.alt_shortest_paths(start, target)
         
-        if brightest:
-            print(f"\nEstrela mais brilhante:")
-            print(f"  [{brightest[0]+1}] {brightest[1]['nome']}")
-            print(f"  Magnitude: {min_magnitude}")
-        else:
-            print("Nenhuma estrela com magnitude definida encontrada.")
-    
-    def count_by_constellation(self):
-        """Conta objetos por constelação"""
-        if not self.vertices:
-            print("Grafo vazio.")
-            return
+        if not result:
+            self._report(f"ALT: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
         
-        constellation_count = {}
-        for vertex in self.vertices:
-            constellation = vertex.get('constelacao', 'Não definido')
-            constellation_count[constellation] = constellation_count.get(constellation, 0) + 1
+        all_paths = result.paths()
+        all_costs = [result.cost] * len(all_paths)
+        optimal_indices = list(range(len(all_paths)))
         
-        print(f"\nContagem por constelação:")
-        for constellation, count in sorted(constellation_count.items()):
-            print(f"  {constellation}: {count} objeto(s)")
+        self._report_paths("ALT (A* com landmarks)", all_paths, all_costs, optimal_indices, start, target)
+        return PathSearchResult(all_paths, all_costs)
     
-    def listar_todas_estrelas(self):
+    def build_contraction_hierarchy(self) -> ContractionHierarchy:
+        """Pré-processa as contraction hierarchies do estado atual do grafo"""
+        self._hierarchy = ContractionHierarchy(self)
+        return self._hierarchy
+    
+    def contraction_hierarchy(self) -> Optional[ContractionHierarchy]:
+        """Hierarquia válida para o estado atual do grafo (ou None)"""
+        if self._hierarchy is not None and self._hierarchy.version != self._version:
+            self._hierarchy = None  # Grafo alterado desde o pré-processamento
+        return self._hierarchy
+    
+    def contraction_hierarchy_shortest_path(self, start: int, target: int) -> PathSearchResult:
         """
-        Lista todas as estrelas/planetas do grafo com informações detalhadas
+        Consulta ponto a ponto por contraction hierarchies. Devolve UM caminho ótimo,
+        não todos os empatados: a busca de testemunhas descarta atalhos com empate
+        e cada atalho guarda um único vértice intermediário.
+        A hierarquia é construída na primeira consulta e reaproveitada até a próxima alteração.
         """
-        if not self.vertices:
-            print("Nenhum vértice encontrado no grafo.")
-            return
-        
-        print(f"\n============================================================")
-        print(f"                    REDE ESTELAR DISPONIVEL")
-        print(f"============================================================")
-        
-        # Listar de forma simples e compatível
-        for i, vertice in enumerate(self.vertices):
-            nome = vertice.get('nome', 'Sem nome')
-            magnitude = vertice.get('magnitude', 'N/A')
-            constelacao = vertice.get('constelacao', 'N/A')
-            print(f"[{i+1:2d}] {nome}")
-            print(f"     Magnitude: {magnitude} | Constelacao: {constelacao}")
+        if not self._validate_input(start, target):
+            return PathSearchResult([], [])
         
-        print(f"============================================================")
-        print(f"Total: {len(self.vertices)} objetos celestes disponíveis")
-        print(f"============================================================\n")
-    
-    def list_most_connected_stars(self):
-        """Lista as estrelas mais conectadas"""
-        if not self.vertices:
-            print("Grafo vazio.")
-            return
+        if start == target:
+            return PathSearchResult([[start]], [0.0])
         
-        connections = []
-        for i in range(len(self.vertices)):
-            count = sum(1 for weight in self.adjacency_matrix[i] if weight > 0)
-            connections.append((count, i, self.vertices[i]['nome']))
+        hierarchy = self.contraction_hierarchy() or self.build_contraction_hierarchy()
+        path, cost = hierarchy.query(start, target)
         
-        connections.sort(reverse=True)
+        if not path:
+            self._report(f"Contraction Hierarchies: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
         
-        print(f"\nEstrelas mais conectadas:")
-        for count, index, name in connections[:5]:
-            print(f"  [{index+1:2d}] {name}: {count} conexões")
-
-    def exibir_matriz_adjacencia(self):
+        self._report_paths("Contraction Hierarchies", [path], [cost], [0], start, target)
+        return PathSearchResult([path], [cost])
+    
+    def floyd_warshall_all_paths(self, start: int, target: int) -> PathSearchResult:
         """
-        Exibe a matriz de adjacência verdadeira (apenas 0s e 1s)
+        Floyd-Warshall que encontra TODOS os caminhos ótimos
         """
-        if not self.vertices:
-            print("Grafo vazio.")
-            return
+        if not self._validate_input(start, target):
+            return PathSearchResult([], [])
         
-        n = len(self.vertices)
+        if start == target:
+            return PathSearchResult([[start]], [0.0])
         
-        print(f"\nMATRIZ DE ADJACENCIA (apenas conectividade)")
-        print("=" * 80)
+        dist, _ = self.all_pairs_shortest_paths()
         
-        # Cabeçalho
-        header = "      "
-        for vertice in self.vertices:
-            nome = vertice['nome']
-            if "Constelacao" in nome or "Constelação" in nome:
-                abbrev = nome.split()[-1][:3]
-            elif "estrela" in nome:
-                abbrev = nome.split()[0][:3]
-            else:
-                abbrev = nome[:3]
-            header += f"{abbrev:>4}"
+        if dist[start][target] == float('inf'):
+            self._report(f"Floyd-Warshall: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
         
-        print(header)
+        # Reconstruir todos os caminhos ótimos
+        all_paths = self._reconstruct_floyd_paths(start, target, dist)
         
-        # Matriz só com 0 e 1
-        for i in range(n):
-            nome = self.vertices[i]['nome']
-            if "Constelacao" in nome or "Constelação" in nome:
-                linha_label = nome.split()[-1][:3]
-            elif "estrela" in nome:
-                linha_label = nome.split()[0][:3]
-            else:
-                linha_label = nome[:3]
-            
-            linha = f"{linha_label:>6}"
-            
-            for j in range(n):
-                # APENAS 0 ou 1 - SEM DECIMAIS
-                if self.adjacency_matrix[i][j] > 0:
-                    linha += "   1"
-                else:
-                    linha += "   0"
-            
-            print(linha)
+        optimal_cost = float(dist[start][target])
+        all_costs = [optimal_cost] * len(all_paths)
+        optimal_indices = list(range(len(all_paths)))
         
-        print("=" * 80)
-        print("1 = CONECTADO | 0 = NAO CONECTADO")
-
-    def carregar_rede_estelar_predefinida(self):
+        self._report_paths("Floyd-Warshall", all_paths, all_costs, optimal_indices, start, target)
+        return PathSearchResult(all_paths, all_costs)
+    
+    def all_pairs_shortest_paths(self):
         """
-        Carrega uma rede estelar predefinida com dados astronômicos reais
+        Retorna (dist, next_hop) de todos os pares, reaproveitando a última tabela
+        calculada enquanto o grafo não for alterado.
         """
-        # Limpar grafo existente
-        self.vertices = []
-        self.adjacency_matrix = []
-        
-        # Definir vértices com informações astronômicas detalhadas
-        vertices_data = [
-            {"nome": "Constelação de Órion", "magnitude": None, "constelacao": "Área do céu"},
-            {"nome": "Betelgeuse (estrela em Órion)", "magnitude": 0.42, "constelacao": "Órion"},
-            {"nome": "Rigel (estrela em Órion)", "magnitude": 0.18, "constelacao": "Órion"},
-            {"nome": "Constelação do Escorpião", "magnitude": None, "constelacao": "Área do céu"},
-            {"nome": "Antares (estrela em Escorpião)", "magnitude": 1.06, "constelacao": "Escorpião"},
-            {"nome": "Shaula (estrela em Escorpião)", "magnitude": 1.62, "constelacao": "Escorpião"},
-            {"nome": "Constelação da Ursa Maior", "magnitude": None, "constelacao": "Área do céu"},
-            {"nome": "Dubhe (estrela na Ursa Maior)", "magnitude": 1.81, "constelacao": "Ursa Maior"},
-            {"nome": "Merak (estrela na Ursa Maior)", "magnitude": 2.34, "constelacao": "Ursa Maior"},
-            {"nome": "Constelação de Pégaso", "magnitude": None, "constelacao": "Área do céu"},
-            {"nome": "Markab (estrela em Pégaso)", "magnitude": 2.49, "constelacao": "Pégaso"},
-            {"nome": "Scheat (estrela em Pégaso)", "magnitude": 2.44, "constelacao": "Pégaso"},
-            {"nome": "Sol", "magnitude": -26.74, "constelacao": "Sistema Solar"},
-            {"nome": "Mercúrio", "magnitude": -1.9, "constelacao": "Sistema Solar"},
-            {"nome": "Vênus", "magnitude": -4.6, "constelacao": "Sistema Solar"},
-            {"nome": "Terra", "magnitude": None, "constelacao": "Sistema Solar"},
-            {"nome": "Marte", "magnitude": -2.94, "constelacao": "Sistema Solar"},
-            {"nome": "Júpiter", "magnitude": -2.7, "constelacao": "Sistema Solar"},
-            {"nome": "Saturno", "magnitude": 0.46, "constelacao": "Sistema Solar"},
-            {"nome": "Urano", "magnitude": 5.68, "constelacao": "Sistema Solar"},
-            {"nome": "Netuno", "magnitude": 7.8, "constelacao": "Sistema Solar"},
-            {"nome": "Plutão", "magnitude": 14.0, "constelacao": "Sistema Solar"}
-        ]
-        
-        # Adicionar todos os vértices
-        for vertex_data in vertices_data:
-            self.add_vertex(vertex_data)
-        
-        # Define as arestas (usando pesos variados para demonstrar algoritmos)
-        edges = [
-            # Constelações -> Estrelas (peso 1.0)
-            (0, 1, 1.0), (0, 2, 1.0),  # Órion -> Betelgeuse, Rigel
-            (3, 4, 1.0), (3, 5, 1.0),  # Escorpião -> Antares, Shaula
-            (6, 7, 1.0), (6, 8, 1.0),  # Ursa Maior -> Dubhe, Merak
-            (9, 10, 1.0), (9, 11, 1.0), # Pégaso -> Markab, Scheat
-            
-            # Sol <-> Planetas (pesos representando distâncias aproximadas em UA)
-            (12, 13, 0.39), (13, 12, 0.39),  # Sol <-> Mercúrio
-            (12, 14, 0.72), (14, 12, 0.72),  # Sol <-> Vênus
-            (12, 15, 1.0), (15, 12, 1.0),    # Sol <-> Terra
-            (12, 16, 1.52), (16, 12, 1.52),  # Sol <-> Marte
-            (12, 17, 5.2), (17, 12, 5.2),    # Sol <-> Júpiter
-            (12, 18, 9.5), (18, 12, 9.5),    # Sol <-> Saturno
-            (12, 19, 19.2), (19, 12, 19.2),  # Sol <-> Urano
-            (12, 20, 30.0), (20, 12, 30.0),  # Sol <-> Netuno
-            (12, 21, 39.5), (21, 12, 39.5),  # Sol <-> Plutão
-            
-            # Vizinhança orbital (pesos representando diferença de distância)
-            (13, 14, 0.33), # Mercúrio -> Vênus
-            (14, 15, 0.28), # Vênus -> Terra
-            (15, 16, 0.52), # Terra -> Marte
-            (16, 17, 3.68), # Marte -> Júpiter
-            (17, 18, 4.3),  # Júpiter -> Saturno
-            (18, 19, 9.7),  # Saturno -> Urano
-            (19, 20, 10.8), # Urano -> Netuno
-            (20, 21, 9.5),  # Netuno -> Plutão
-        ]
-        
-        # Adicionar todas as arestas (serão automaticamente bidirecionais)
-        for origem, destino, peso in edges:
-            if origem < len(self.vertices) and destino < len(self.vertices):
-                self.add_edge(origem, destino, peso)
+        cache = self._apsp_cache
+        if cache is None or cache[0] != self._version:
+            if self._prefers_johnson():
+                dist, next_hop = self.johnson_matrices()
+            else:
+                dist, next_hop = self.floyd_warshall_matrices()
+            cache = self._apsp_cache = (self._version, dist, next_hop)
+        return cache[1], cache[2]
     
-    # ========================================
-    # IMPLEMENTAÇÃO PRÓPRIA DE FILA DE PRIORIDADE (SEM BIBLIOTECAS)
-    # ========================================
-    class MinHeap:
-        """Implementação própria de min-heap para substituir heapq"""
-        def __init__(self):
-            self.heap = []
+    def save(self, path: str) -> None:
+        """Grava o grafo no formato binário compacto (veja save_graph)"""
+        save_graph(self, path)
+    
+    @classmethod
+    def load(cls, path: str, reporter: Optional[ConsoleReporter] = None) -> 'Graph':
+        """Abre um arquivo gravado por save(), com as arestas mapeadas em memória"""
+        return load_graph(path, reporter)
+    
+    @classmethod
+    def from_catalog(cls, catalog_path: str, edges_path: Optional[str] = None, is_directed: bool = False,
+                     is_weighted: bool = True, reporter: Optional[ConsoleReporter] = None) -> 'Graph':
+        """Importa um catálogo CSV/JSON Lines em lote (veja import_catalog)"""
+        return import_catalog(catalog_path, edges_path, is_directed, is_weighted, reporter)
+    
+    def parallel_all_pairs(self, algorithm: str = 'dijkstra', workers: Optional[int] = None):
+        """
+        All-pairs com uma busca de origem única por vértice, distribuídas entre
+        processos (veja parallel_shortest_paths). Com Dijkstra, o resultado vira
+        a tabela em cache usada por floyd_warshall_all_paths.
+        """
+        dist, next_hop = parallel_shortest_paths(self, None, algorithm, workers)
+        if algorithm == 'dijkstra':
+            self._apsp_cache = (self._version, dist, next_hop)
+        return dist, next_hop
+    
+    def _prefers_johnson(self) -> bool:
+        """
+        Johnson vence o Floyd-Warshall puro em grafos esparsos (grau médio < 10).
+        Só é escolhido quando todos os pesos são positivos, para manter a semântica
+        'peso > 0' da tabela, e sem NumPy: o Floyd-Warshall vetorizado empata até
+        alguns milhares de vértices.
+        """
+        n = len(self.vertices)
+        if np is not None or n == 0 or len(self._edges) >= 10 * n:
+            return False
+        return all(weight > 0 for _, _, weight in self._edges)
+    
+    def floyd_warshall_matrices(self, use_numpy: Optional[bool] = None):
+        """
+        Calcula a tabela completa de Floyd-Warshall.
+        Retorna (dist, next_hop): dist[i][j] é o custo mínimo de i até j (inf se inalcançável)
+        e next_hop[i][j] é o primeiro vértice de um caminho ótimo (-1 se não existe).
+        Com NumPy disponível (ou use_numpy=True) cada k é um único 'minimum' vetorizado
+        e as matrizes retornadas são ndarrays; caso contrário são listas de listas.
+        """
+        if use_numpy is None:
+            use_numpy = np is not None
+        if use_numpy:
+            return self._floyd_warshall_numpy()
         
-        def push(self, item):
-            """Insere item (custo, vertice) no heap"""
-            self.heap.append(item)
-            self._heapify_up(len(self.heap) - 1)
+        n = len(self.vertices)
+        inf = float('inf')
+        dist = [[inf] * n for _ in range(n)]
+        next_hop = [[-1] * n for _ in range(n)]
         
-        def pop(self):
-            """Remove e retorna o item com menor custo"""
-            if not self.heap:
-                return None
-            
-            if len(self.heap) == 1:
-                return self.heap.pop()
-            
-            root = self.heap[0]
-            self.heap[0] = self.heap.pop()
-            self._heapify_down(0)
-            return root
+        for i in range(n):
+            for j, weight in self._neighbors(i):
+                if weight > 0:
+                    dist[i][j] = weight
+                    next_hop[i][j] = j
+            dist[i][i] = 0.0
+            next_hop[i][i] = i
         
-        def is_empty(self):
-            return len(self.heap) == 0
+        for k in range(n):
+            dist_k = dist[k]
+            for i in range(n):
+                d_ik = dist[i][k]
+                if d_ik == inf:
+                    continue
+                dist_i = dist[i]
+                next_i = next_hop[i]
+                hop = next_i[k]
+                for j in range(n):
+                    candidate = d_ik + dist_k[j]
+                    if candidate < dist_i[j]:
+                        dist_i[j] = candidate
+                        next_i[j] = hop
         
-        def _heapify_up(self, index):
-            if index == 0:
-                return
-            
-            parent_index = (index - 1) // 2
-            if self.heap[index][0] < self.heap[parent_index][0]:
-                self.heap[index], self.heap[parent_index] = self.heap[parent_index], self.heap[index]
-                self._heapify_up(parent_index)
+        return dist, next_hop
+    
+    def johnson_matrices(self):
+        """
+        All-pairs de Johnson para grafos esparsos, no mesmo formato (dist, next_hop)
+        de floyd_warshall_matrices (listas de listas). Os potenciais h vêm do
+        Bellman-Ford com fila a partir de uma origem virtual; com os pesos
+        reponderados w + h[u] - h[v] >= 0 roda um Dijkstra independente por origem
+        sobre a lista explícita de arestas: O(V·E log V) em vez de O(V³).
+        Aceita pesos zero e negativos; devolve None se houver ciclo negativo.
+        """
+        if self._johnson_reweighting() is None:
+            return None
         
-        def _heapify_down(self, index):
-            left_child = 2 * index + 1
-            right_child = 2 * index + 2
-            smallest = index
-            
-            if (left_child < len(self.heap) and 
-                self.heap[left_child][0] < self.heap[smallest][0]):
-                smallest = left_child
-            
-            if (right_child < len(self.heap) and 
-                self.heap[right_child][0] < self.heap[smallest][0]):
-                smallest = right_child
-            
-            if smallest != index:
-                self.heap[index], self.heap[smallest] = self.heap[smallest], self.heap[index]
-                self._heapify_down(smallest)
+        dist, next_hop = [], []
+        for source in range(len(self.vertices)):
+            row, hops = self._johnson_row(source)
+            dist.append(row)
+            next_hop.append(hops)
+        return dist, next_hop
+    
+    def _johnson_reweighting(self):
+        """
+        (potenciais h, adjacência com pesos w + h[u] - h[v] >= 0), em cache até a
+        próxima alteração do grafo; None se houver ciclo negativo
+        """
+        if self._johnson is None or self._johnson[0] != self._version:
+            potential = self.spfa_distances()
+            reweighting = None
+            if potential is not None:
+                adjacency = [[(v, max(0.0, weight + potential[u] - potential[v])) for v, weight in arcs]
+                             for u, arcs in enumerate(self._edges.adjacency(len(self.vertices)))]
+                reweighting = (potential, adjacency)
+            self._johnson = (self._version, reweighting)
+        return self._johnson[1]
+    
+    def _johnson_row(self, source: int) -> Tuple[List[float], List[int]]:
+        """Uma linha de johnson_matrices: um Dijkstra reponderado a partir de source"""
+        potential, adjacency = self._johnson_reweighting()
+        row, hops = _dijkstra_from(source, adjacency)
+        h_source = potential[source]
+        return [d - h_source + potential[t] if d != float('inf') else d
+                for t, d in enumerate(row)], hops
     
     # ========================================
-    # ALGORITMOS DE BUSCA CORRIGIDOS (SEGUINDO TODAS AS REGRAS)
+    # ALL-PAIRS DINÂMICO (CORREÇÃO INCREMENTAL DA TABELA)
     # ========================================
     
-    def dfs_all_paths(self, start: int, target: int) -> Tuple[List[List[int]], List[float]]:
+    def _edge_changed(self, changes: List[Tuple[int, int, float, float]]) -> None:
         """
-        DFS que encontra TODOS os caminhos possíveis
-        Retorna: (lista_de_caminhos, lista_de_custos)
+        Registra a alteração de arcos (origem, destino, peso_antigo, peso_novo).
+        No modo dynamic_all_pairs, a tabela em cache é corrigida no lugar:
+        inserção ou redução de peso custa O(V²); aumento ou remoção recalcula
+        apenas as linhas das origens cujo caminho mínimo usava o arco.
         """
-        if not self._validate_input(start, target):
-            return [], []
-        
-        if start == target:
-            return [[start]], [0.0]
+        cache = self._apsp_cache
+        patchable = self.dynamic_all_pairs and cache is not None and cache[0] == self._version
+        self._touch()
+        if not patchable:
+            return
         
-        all_paths = []
-        all_costs = []
+        dist, next_hop = cache[1], cache[2]
         
-        def dfs_recursive(current: int, path: List[int], cost: float, visited: set):
-            if current == target:
-                all_paths.append(path.copy())
-                all_costs.append(cost)
-                return
-            
-            for neighbor in range(len(self.vertices)):
-                weight = self.adjacency_matrix[current][neighbor]
-                if weight > 0 and neighbor not in visited:
-                    visited.add(neighbor)
-                    path.append(neighbor)
-                    dfs_recursive(neighbor, path, cost + weight, visited)
-                    path.pop()
-                    visited.remove(neighbor)
-        
-        visited = {start}
-        dfs_recursive(start, [start], 0.0, visited)
+        # Arcos que ficaram mais caros (ou sumiram): só afetam origens que dependiam deles
+        affected = set()
+        for u, v, old, new in changes:
+            if old > 0 and (new <= 0 or new > old):
+                affected.update(self._sources_using_arc(dist, u, v, old))
+        for source in affected:
+            row, hops = self._dijkstra_row(source)
+            dist[source] = row
+            next_hop[source] = hops
         
-        if not all_paths:
-            print(f"DFS: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
-            return [], []
+        # Arcos novos ou mais baratos: relaxamento O(V²) através do arco
+        for u, v, old, new in changes:
+            if new > 0 and (old <= 0 or new < old):
+                self._relax_all_pairs_through(dist, next_hop, u, v, new)
         
-        # Encontrar caminho ótimo (menor custo)
-        min_cost = min(all_costs)
-        optimal_indices = [i for i, cost in enumerate(all_costs) if cost == min_cost]
+        self._apsp_cache = (self._version, dist, next_hop)
+    
+    @staticmethod
+    def _sources_using_arc(dist, u: int, v: int, weight: float) -> List[int]:
+        """Origens i em que u->v (com o peso dado) fazia parte de um caminho mínimo até v"""
+        if np is not None and isinstance(dist, np.ndarray):
+            via_arc = dist[:, u] + weight
+            tight = np.isclose(via_arc, dist[:, v], rtol=COST_EPSILON, atol=0.0) & np.isfinite(via_arc)
+            return np.flatnonzero(tight).tolist()
+        
+        inf = float('inf')
+        return [i for i, row in enumerate(dist)
+                if row[u] != inf and _same_cost(row[u] + weight, row[v])]
+    
+    @staticmethod
+    def _relax_all_pairs_through(dist, next_hop, u: int, v: int, weight: float) -> None:
+        """dist[i][j] = min(dist[i][j], dist[i][u] + weight + dist[v][j]) para todos os pares"""
+        if np is not None and isinstance(dist, np.ndarray):
+            candidate = dist[:, u, None] + weight + dist[None, v, :]
+            improved = candidate < dist
+            hops = next_hop[:, u].copy()
+            hops[u] = v
+            np.minimum(dist, candidate, out=dist)
+            next_hop[improved] = np.broadcast_to(hops[:, None], dist.shape)[improved]
+            return
         
-        self._print_all_paths_results("DFS", all_paths, all_costs, optimal_indices, start, target)
-        return all_paths, all_costs
+        inf = float('inf')
+        dist_v = dist[v]
+        for i, dist_i in enumerate(dist):
+            d_iu = dist_i[u]
+            if d_iu == inf:
+                continue
+            base = d_iu + weight
+            hop = v if i == u else next_hop[i][u]
+            next_i = next_hop[i]
+            for j, d_vj in enumerate(dist_v):
+                if base + d_vj < dist_i[j]:
+                    dist_i[j] = base + d_vj
+                    next_i[j] = hop
     
-    def bfs_all_paths(self, start: int, target: int) -> Tuple[List[List[int]], List[float]]:
+    def _dijkstra_row(self, source: int, reverse: bool = False) -> Tuple[List[float], List[int]]:
         """
-        BFS que encontra TODOS os caminhos com menor número de arestas
+        Dijkstra de uma origem: (distâncias, primeiro vértice de um caminho mínimo).
+        Com reverse=True percorre as arestas de entrada, ou seja, dist[v] = custo de v até source.
         """
-        if not self._validate_input(start, target):
-            return [], []
+        expand = self._in_neighbors if reverse else self._neighbors
+        n = len(self.vertices)
+        dist = [float('inf')] * n
+        first_hop = [-1] * n
+        dist[source] = 0.0
+        first_hop[source] = source
         
-        if start == target:
-            return [[start]], [0.0]
+        pq = self.IndexedMinHeap(n)
+        pq.push(source, 0.0)
         
-        # BFS nivel por nivel para encontrar distância mínima
-        queue = [(start, [start], 0.0)]
-        visited_levels = {}
-        visited_levels[start] = 0
-        min_path_length = float('inf')
+        while not pq.is_empty():
+            current_dist, current = pq.pop()
+            for neighbor, weight in expand(current):
+                if weight > 0 and current_dist + weight < dist[neighbor]:
+                    dist[neighbor] = current_dist + weight
+                    first_hop[neighbor] = neighbor if current == source else first_hop[current]
+                    pq.push_or_decrease(neighbor, dist[neighbor])
         
-        all_paths = []
-        all_costs = []
+        return dist, first_hop
+    
+    def _weight_array(self, n: int):
+        """
+        Matriz de pesos n x n como ndarray, lida direto do armazenamento:
+        o buffer do DenseStorage vira uma visão (sem lista de listas intermediária),
+        o ndarray do backend numpy é copiado e os esparsos são preenchidos por neighbors().
+        """
+        storage = self._storage
+        if isinstance(storage, DenseStorage):
+            cap = storage.capacity
+            if cap == 0:
+                return np.zeros((n, n))
+            return np.frombuffer(storage.data, dtype=np.float64).reshape(cap, cap)[:n, :n].copy()
+        if isinstance(storage, NumpyDenseStorage):
+            return np.array(storage.matrix, dtype=np.float64)
+        weights = np.zeros((n, n))
+        for i in range(n):
+            for j, weight in storage.neighbors(i):
+                weights[i, j] = weight
+        return weights
+    
+    def _floyd_warshall_numpy(self):
+        """Floyd-Warshall vetorizado: uma operação broadcast por vértice intermediário"""
+        if np is None:
+            raise ImportError("Floyd-Warshall vetorizado requer o pacote NumPy instalado.")
         
-        while queue:
-            current, path, cost = queue.pop(0)
-            
-            # Se já encontramos caminhos e este é mais longo, parar
-            if len(path) > min_path_length:
-                continue
-            
-            if current == target:
-                if len(path) < min_path_length:
-                    min_path_length = len(path)
-                    all_paths = [path.copy()]
-                    all_costs = [cost]
-                elif len(path) == min_path_length:
-                    all_paths.append(path.copy())
-                    all_costs.append(cost)
-                continue
-            
-            for neighbor in range(len(self.vertices)):
-                weight = self.adjacency_matrix[current][neighbor]
-                if weight > 0:
-                    new_path = path + [neighbor]
-                    new_cost = cost + weight
-                    
-                    # Evitar ciclos e caminhos muito longos
-                    if (neighbor not in path and 
-                        (neighbor not in visited_levels or visited_levels[neighbor] >= len(new_path))):
-                        visited_levels[neighbor] = len(new_path)
-                        queue.append((neighbor, new_path, new_cost))
+        n = len(self.vertices)
+        weights = self._weight_array(n)
+        has_edge = weights > 0
         
-        if not all_paths:
-            print(f"BFS: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
-            return [], []
+        dist = np.where(has_edge, weights, np.inf)
+        next_hop = np.where(has_edge, np.arange(n), -1)
+        np.fill_diagonal(dist, 0.0)
+        np.fill_diagonal(next_hop, np.arange(n))
         
-        # Para BFS, o ótimo é o de menor custo entre os de menor distância
-        min_cost = min(all_costs)
-        optimal_indices = [i for i, cost in enumerate(all_costs) if cost == min_cost]
+        for k in range(n):
+            candidate = dist[:, k, None] + dist[None, k, :]
+            improved = candidate < dist
+            np.minimum(dist, candidate, out=dist)
+            next_hop = np.where(improved, next_hop[:, k, None], next_hop)
         
-        self._print_all_paths_results("BFS", all_paths, all_costs, optimal_indices, start, target)
-        return all_paths, all_costs
+        return dist, next_hop
     
-    def dijkstra_all_paths(self, start: int, target: int) -> Tuple[List[List[int]], List[float]]:
+    def bellman_ford_all_paths(self, start: int, target: int) -> PathSearchResult:
         """
-        Dijkstra que encontra TODOS os caminhos ótimos (mesmo custo mínimo)
-        SEM usar bibliotecas externas
+        Bellman-Ford que encontra TODOS os caminhos ótimos
         """
         if not self._validate_input(start, target):
-            return [], []
+            return PathSearchResult([], [])
         
         if start == target:
-            return [[start]], [0.0]
+            return PathSearchResult([[start]], [0.0])
         
         n = len(self.vertices)
         distances = [float('inf')] * n
         distances[start] = 0.0
+        # Lista explícita de arcos: pesos zero e negativos também são relaxados
+        arcs = list(self._edges)
         
-        # Armazenar TODOS os caminhos para cada vértice
-        paths_to = {start: [[start]]}
-        costs_to = {start: [0.0]}
-        
-        # Usar nossa implementação própria de heap
-        pq = self.MinHeap()
-        pq.push((0.0, start))
-        visited = set()
-        
-        while not pq.is_empty():
-            current_dist, current = pq.pop()
-            
-            if current in visited:
-                continue
-            
-            visited.add(current)
+        # Relaxamento das arestas (n-1) vezes
+        for _ in range(n - 1):
+            updated = False
+            for i, j, weight in arcs:
+                if distances[i] != float('inf') and distances[i] + weight < distances[j]:
+                    distances[j] = distances[i] + weight
+                    updated = True
             
-            for neighbor in range(n):
-                weight = self.adjacency_matrix[current][neighbor]
-                if weight > 0:
-                    distance = current_dist + weight
-                    
-                    if distance < distances[neighbor]:
-                        # Encontrou caminho melhor
-                        distances[neighbor] = distance
-                        paths_to[neighbor] = []
-                        costs_to[neighbor] = []
-                        
-                        # Adicionar todos os caminhos que chegam ao current
-                        for path in paths_to[current]:
-                            new_path = path + [neighbor]
-                            paths_to[neighbor].append(new_path)
-                            costs_to[neighbor].append(distance)
-                        
-                        pq.push((distance, neighbor))
-                    
-                    elif distance == distances[neighbor]:
-                        # Encontrou caminho alternativo com mesmo custo
-                        for path in paths_to[current]:
-                            new_path = path + [neighbor]
-                            if new_path not in paths_to[neighbor]:
-                                paths_to[neighbor].append(new_path)
-                                costs_to[neighbor].append(distance)
+            if not updated:
+                break
         
-        if target not in paths_to:
-            print(f"Dijkstra: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
-            return [], []
+        # Verificar ciclos negativos
+        for i, j, weight in arcs:
+            if distances[i] != float('inf') and distances[i] + weight < distances[j]:
+                self._report("Bellman-Ford: Ciclo negativo detectado!")
+                return PathSearchResult([], [])
         
-        all_paths = paths_to[target]
-        all_costs = costs_to[target]
+        if distances[target] == float('inf'):
+            self._report(f"Bellman-Ford: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
         
-        # Todos os caminhos já são ótimos (mesmo custo)
+        # Reconstruir todos os caminhos ótimos pelos arcos justos
+        all_paths = self._reconstruct_bellman_paths(start, target, self._tight_predecessors(start, distances))
+        
+        optimal_cost = distances[target]
+        all_costs = [optimal_cost] * len(all_paths)
         optimal_indices = list(range(len(all_paths)))
         
-        self._print_all_paths_results("Dijkstra", all_paths, all_costs, optimal_indices, start, target)
-        return all_paths, all_costs
+        self._report_paths("Bellman-Ford", all_paths, all_costs, optimal_indices, start, target)
+        return PathSearchResult(all_paths, all_costs)
     
-    def floyd_warshall_all_paths(self, start: int, target: int) -> Tuple[List[List[int]], List[float]]:
+    def spfa_distances(self, start: Optional[int] = None) -> Optional[List[float]]:
         """
-        Floyd-Warshall que encontra TODOS os caminhos ótimos
+        Bellman-Ford com fila (SPFA) sobre a lista explícita de arestas: aceita pesos
+        zero e negativos e só reprocessa vértices cuja distância mudou.
+        start=None parte de uma origem virtual ligada a todos os vértices com peso 0.
+        Devolve None se houver ciclo negativo alcançável (algum vértice entrou na
+        fila mais vezes do que o número de vértices).
         """
-        if not self._validate_input(start, target):
-            return [], []
-        
-        if start == target:
-            return [[start]], [0.0]
-        
         n = len(self.vertices)
+        adjacency = self._edges.adjacency(n)
         
-        # Inicializar matrizes de distância
-        dist = [[float('inf')] * n for _ in range(n)]
+        if start is None:
+            distances = [0.0] * n
+            queue = deque(range(n))
+        else:
+            distances = [float('inf')] * n
+            distances[start] = 0.0
+            queue = deque([start])
+        in_queue = bytearray(n)
+        enqueued = [0] * n  # Contador de entradas na fila por vértice
+        for v in queue:
+            in_queue[v] = 1
+            enqueued[v] = 1
         
-        # Armazenar múltiplos próximos vértices para cada par
-        next_vertices = [[[] for _ in range(n)] for _ in range(n)]
+        while queue:
+            u = queue.popleft()
+            in_queue[u] = 0
+            du = distances[u]
+            for v, weight in adjacency[u]:
+                if du + weight < distances[v]:
+                    distances[v] = du + weight
+                    if not in_queue[v]:
+                        enqueued[v] += 1
+                        if enqueued[v] > n:
+                            return None
+                        in_queue[v] = 1
+                        queue.append(v)
+        return distances
+    
+    def spfa_all_paths(self, start: int, target: int) -> PathSearchResult:
+        """
+        Bellman-Ford com fila (SPFA) que encontra todos os caminhos ótimos,
+        inclusive com arestas de peso zero ou negativo
+        """
+        if not self._validate_input(start, target):
+            return PathSearchResult([], [])
         
-        # Inicializar distâncias diretas
-        for i in range(n):
-            dist[i][i] = 0.0
-            for j in range(n):
-                if self.adjacency_matrix[i][j] > 0:
-                    dist[i][j] = self.adjacency_matrix[i][j]
-                    next_vertices[i][j] = [j]
+        distances = self.spfa_distances(start)
+        if distances is None:
+            self._report("Bellman-Ford (SPFA): Ciclo negativo detectado!")
+            return PathSearchResult([], [])
         
-        # Floyd-Warshall principal
-        for k in range(n):
-            for i in range(n):
-                for j in range(n):
-                    if dist[i][k] + dist[k][j] < dist[i][j]:
-                        # Caminho melhor encontrado
-                        dist[i][j] = dist[i][k] + dist[k][j]
-                        next_vertices[i][j] = next_vertices[i][k].copy()
-                    elif dist[i][k] + dist[k][j] == dist[i][j] and next_vertices[i][k]:
-                        # Caminho alternativo com mesmo custo
-                        for next_v in next_vertices[i][k]:
-                            if next_v not in next_vertices[i][j]:
-                                next_vertices[i][j].append(next_v)
+        if start == target:
+            return PathSearchResult([[start]], [0.0])
         
-        if dist[start][target] == float('inf'):
-            print(f"Floyd-Warshall: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
-            return [], []
+        if distances[target] == float('inf'):
+            self._report(f"Bellman-Ford (SPFA): Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
         
-        # Reconstruir todos os caminhos ótimos
-        all_paths = []
-        self._reconstruct_floyd_paths(start, target, next_vertices, [start], all_paths)
+        all_paths = self._reconstruct_bellman_paths(start, target, self._tight_predecessors(start, distances))
         
-        optimal_cost = dist[start][target]
+        optimal_cost = distances[target]
         all_costs = [optimal_cost] * len(all_paths)
         optimal_indices = list(range(len(all_paths)))
         
-        self._print_all_paths_results("Floyd-Warshall", all_paths, all_costs, optimal_indices, start, target)
-        return all_paths, all_costs
+        self._report_paths("Bellman-Ford (SPFA)", all_paths, all_costs, optimal_indices, start, target)
+        return PathSearchResult(all_paths, all_costs)
     
-    def bellman_ford_all_paths(self, start: int, target: int) -> Tuple[List[List[int]], List[float]]:
+    def _tight_predecessors(self, start: int, distances) -> List[List[int]]:
         """
-        Bellman-Ford que encontra TODOS os caminhos ótimos
+        Predecessores pelos arcos justos (dist[u] + peso == dist[v]) da lista explícita.
+        Com ciclos de custo zero eles podem se fechar, mas o percurso só gera caminhos simples.
+        """
+        predecessors = [[] for _ in range(len(self.vertices))]
+        for u, v, weight in self._edges:
+            if v != start and distances[u] != float('inf') and _same_cost(distances[u] + weight, distances[v]):
+                predecessors[v].append(u)
+        return predecessors
+    
+    def johnson_all_paths(self, start: int, target: int) -> PathSearchResult:
+        """
+        Johnson (all-pairs esparso) que encontra todos os caminhos ótimos,
+        inclusive com arestas de peso zero ou negativo
         """
         if not self._validate_input(start, target):
-            return [], []
-        
-        if start == target:
-            return [[start]], [0.0]
-        
-        n = len(self.vertices)
-        distances = [float('inf')] * n
-        distances[start] = 0.0
-        
-        # Armazenar múltiplos predecessores para cada vértice
-        predecessors = [[] for _ in range(n)]
+            return PathSearchResult([], [])
         
-        # Relaxamento das arestas (n-1) vezes
-        for _ in range(n - 1):
-            updated = False
-            for i in range(n):
-                for j in range(n):
-                    weight = self.adjacency_matrix[i][j]
-                    if weight > 0 and distances[i] != float('inf'):
-                        if distances[i] + weight < distances[j]:
-                            distances[j] = distances[i] + weight
-                            predecessors[j] = [i]
-                            updated = True
-                        elif distances[i] + weight == distances[j] and i not in predecessors[j]:
-                            predecessors[j].append(i)
-                            updated = True
-            
-            if not updated:
-                break
+        if self._johnson_reweighting() is None:
+            self._report("Johnson: Ciclo negativo detectado!")
+            return PathSearchResult([], [])
         
-        # Verificar ciclos negativos
-        for i in range(n):
-            for j in range(n):
-                weight = self.adjacency_matrix[i][j]
-                if weight > 0 and distances[i] != float('inf'):
-                    if distances[i] + weight < distances[j]:
-                        print("Bellman-Ford: Ciclo negativo detectado!")
-                        return [], []
+        if start == target:
+            return PathSearchResult([[start]], [0.0])
         
+        distances = self._johnson_row(start)[0]
         if distances[target] == float('inf'):
-            print(f"Bellman-Ford: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
-            return [], []
+            self._report(f"Johnson: Não existe caminho entre {self.vertices[start]['nome']} e {self.vertices[target]['nome']}")
+            return PathSearchResult([], [])
         
-        # Reconstruir todos os caminhos ótimos
-        all_paths = []
-        self._reconstruct_bellman_paths(target, start, predecessors, [target], all_paths)
-        
-        # Reverter caminhos (foram construídos de trás para frente)
-        all_paths = [path[::-1] for path in all_paths]
+        all_paths = self._reconstruct_bellman_paths(start, target, self._tight_predecessors(start, distances))
         
         optimal_cost = distances[target]
         all_costs = [optimal_cost] * len(all_paths)
         optimal_indices = list(range(len(all_paths)))
         
-        self._print_all_paths_results("Bellman-Ford", all_paths, all_costs, optimal_indices, start, target)
-        return all_paths, all_costs
+        self._report_paths("Johnson", all_paths, all_costs, optimal_indices, start, target)
+        return PathSearchResult(all_paths, all_costs)
     
     # ========================================
     # MÉTODOS AUXILIARES
@@ -736,90 +3211,450 @@ class Graph:
     
     def _validate_input(self, start: int, target: int) -> bool:
         """Validação de entrada para todos os algoritmos"""
-        if not self.vertices:
-            print("Erro: Grafo vazio!")
+        if not self.vertex_count:
+            self._report("Erro: Grafo vazio!")
             return False
         
-        if not (0 <= start < len(self.vertices)):
-            print(f"Erro: Vértice de origem {start} inválido!")
+        if not self.is_live(start):
+            self._report(f"Erro: Vértice de origem {start} inválido!")
             return False
         
-        if not (0 <= target < len(self.vertices)):
-            print(f"Erro: Vértice de destino {target} inválido!")
+        if not self.is_live(target):
+            self._report(f"Erro: Vértice de destino {target} inválido!")
             return False
         
         return True
     
-    def _print_all_paths_results(self, algorithm_name: str, all_paths: List[List[int]], 
-                                all_costs: List[float], optimal_indices: List[int], 
-                                start: int, target: int):
-        """Imprime todos os caminhos encontrados e indica o(s) ótimo(s)"""
-        
-        print(f"\n{'='*60}")
-        print(f"{algorithm_name}: {self.vertices[start]['nome']} → {self.vertices[target]['nome']}")
-        print(f"{'='*60}")
-        
-        print(f"Total de caminhos encontrados: {len(all_paths)}")
+    def _report(self, message: str) -> None:
+        """Encaminha uma mensagem ao reporter (sem reporter, a API é silenciosa)"""
+        if self.reporter is not None:
+            self.reporter.message(message)
+    
+    def _report_paths(self, algorithm_name: str, all_paths: List[List[int]],
+                      all_costs: List[float], optimal_indices: List[int],
+                      start: int, target: int) -> None:
+        """Entrega os caminhos encontrados ao reporter; nada é formatado sem reporter"""
+        if self.reporter is not None:
+            self.reporter.paths(self, algorithm_name, all_paths, all_costs, optimal_indices, start, target)
+    
+    def _optimal_next_vertices(self, current: int, target: int, dist) -> List[int]:
+        """Vizinhos de current que estão em algum caminho ótimo até target"""
+        remaining = dist[current][target]
+        return [neighbor for neighbor, weight in self._neighbors(current)
+                if weight > 0 and _same_cost(weight + dist[neighbor][target], remaining)]
+    
+    def _reconstruct_floyd_paths(self, start: int, target: int, dist) -> List[List[int]]:
+        """
+        Reconstrói todos os caminhos do Floyd-Warshall.
+        Os próximos vértices ótimos são derivados da tabela de distâncias,
+        o que dispensa guardar uma lista de sucessores por par (i, j).
+        """
+        def expand(vertex: int):
+            return ((next_vertex, 0.0) for next_vertex in self._optimal_next_vertices(vertex, target, dist))
         
-        if len(all_paths) == 1:
-            print(f"Caminho único:")
+        return [list(path) for path, _ in _walk_paths(start, target, expand)]
+    
+    def _reconstruct_bellman_paths(self, start: int, target: int,
+                                   predecessors: List[List[int]]) -> List[List[int]]:
+        """Reconstrói todos os caminhos do Bellman-Ford a partir dos predecessores"""
+        return list(ShortestPathDAG(start, target, 0.0, predecessors))
+
+
+# ========================================
+# PERSISTÊNCIA BINÁRIA (SNAPSHOT COM MMAP)
+# ========================================
+#
+# Layout do arquivo (ordem de bytes nativa, registrada no cabeçalho):
+#   cabeçalho: magia, versão, flags, número de seções
+#   tabela de seções: (deslocamento, tamanho em bytes) de cada seção, nesta ordem
+#   seções alinhadas em 8 bytes:
+#     name_offsets (q, V+1) + names (UTF-8)          -> pool de nomes
+#     magnitude (d, V), distance (d, V), coords (d, 3V): NaN = ausente
+#     constellation (q, V) -> índice no pool de constelações (-1 = nenhuma, -2 = slot removido)
+#     constellation_offsets (q, K+1) + constellations (UTF-8)
+#     offsets (q, V+1), indices (q, E), weights (d, E) -> arestas em CSR
+#     zero_arcs (q, 2Z): arcos de peso 0, que o CSR não representa
+#     extras: JSON {índice: atributos} com os demais campos dos vértices
+#     landmarks (q, K) + landmark_distances (d, KV ou 2KV): índice ALT válido no
+#       momento da gravação (d(L, v) de cada landmark e, se direcionado, d(v, L));
+#       vazios se não havia índice
+#     vertex_flags (B, V): bits de presença por vértice (_LIVE e _COLUMN_FLAGS), para
+#       que um atributo ausente não volte como None; arquivos sem a seção tratam
+#       nome, magnitude e constelação como presentes
+# Versões antigas são lidas pelas seções que tinham; as ausentes ficam vazias.
+
+SNAPSHOT_MAGIC = b'N2GRAFO\x00'
+SNAPSHOT_VERSION = 3
+SNAPSHOT_SECTIONS = ('name_offsets', 'names', 'magnitude', 'distance', 'coords', 'constellation',
+                     'constellation_offsets', 'constellations', 'offsets', 'indices', 'weights',
+                     'zero_arcs', 'extras', 'landmarks', 'landmark_distances', 'vertex_flags')
+_SNAPSHOT_LAYOUTS = {1: SNAPSHOT_SECTIONS[:13], 2: SNAPSHOT_SECTIONS[:15], 3: SNAPSHOT_SECTIONS}
+_SNAPSHOT_HEADER = struct.Struct('=8sIII')
+_SNAPSHOT_ENTRY = struct.Struct('=qq')
+_FLAG_DIRECTED, _FLAG_WEIGHTED, _FLAG_BIG_ENDIAN = 1, 2, 4
+_NO_CONSTELLATION, _FREE_SLOT = -1, -2
+
+
+def _string_pool(strings: List[str]) -> Tuple[array, bytes]:
+    """Concatena as strings em UTF-8 e devolve (deslocamentos, bytes)"""
+    offsets = array('q', [0])
+    chunks = []
+    for text in strings:
+        data = text.encode('utf-8')
+        chunks.append(data)
+        offsets.append(offsets[-1] + len(data))
+    return offsets, b''.join(chunks)
+
+
+def _as_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def save_graph(graph: 'Graph', path: str) -> None:
+    """Grava vértices e arestas de graph em path (formato descrito acima)"""
+    # As colunas da VertexTable já estão no formato do arquivo: só o nome e a
+    # constelação passam por um laço (lápides e valores fora das colunas)
+    table = graph.vertices
+    names = []
+    constellation = array('q')
+    extras: Dict[int, dict] = {i: dict(values) for i, values in table.extras.items()}
+    has_name, has_group = _COLUMN_FLAGS['nome'], _COLUMN_FLAGS['constelacao']
+    
+    for i, flags in enumerate(table.flags):
+        if not flags & _LIVE:
+            # Lápide: o slot é gravado para preservar os índices dos demais vértices
+            names.append('')
+            constellation.append(_FREE_SLOT)
+            continue
+        names.append(table.names[i] if flags & has_name else '')
+        constellation.append(table.constellation[i] if flags & has_group else _NO_CONSTELLATION)
+    
+    magnitude, constellation_ids = table.magnitude, table.groups
+    distance = table.distance if table.distance is not None else array('d', [math.nan]) * len(table)
+    coords = table.coords if table.coords is not None else array('d', [math.nan]) * (3 * len(table))
+    
+    name_offsets, name_bytes = _string_pool(names)
+    group_offsets, group_bytes = _string_pool(constellation_ids)
+    
+    storage = graph._storage
+    csr = storage if storage.kind == 'csr' else CSRStorage.from_storage(storage)
+    zero_arcs = array('q')
+    for u, v, weight in graph._edges:
+        if weight == 0:
+            zero_arcs.extend((u, v))
+    
+    landmarks, landmark_distances = array('q'), array('d')
+    index = graph.landmark_index()
+    if index is not None:
+        landmarks.extend(index.landmarks)
+        for row in index.dist_from + (index.dist_to if index.dist_to is not index.dist_from else []):
+            landmark_distances.extend(row)
+    
+    sections = {
+        'name_offsets': name_offsets.tobytes(),
+        'names': name_bytes,
+        'magnitude': magnitude.tobytes(),
+        'distance': distance.tobytes(),
+        'coords': coords.tobytes(),
+        'constellation': constellation.tobytes(),
+        'constellation_offsets': group_offsets.tobytes(),
+        'constellations': group_bytes,
+        'offsets': bytes(memoryview(csr.offsets).cast('B')),
+        'indices': bytes(memoryview(csr.indices).cast('B')),
+        'weights': bytes(memoryview(csr.weights).cast('B')),
+        'zero_arcs': zero_arcs.tobytes(),
+        'extras': json.dumps(extras, ensure_ascii=False, default=str).encode('utf-8'),
+        'landmarks': landmarks.tobytes(),
+        'landmark_distances': landmark_distances.tobytes(),
+        'vertex_flags': table.flags.tobytes(),
+    }
+    
+    flags = ((_FLAG_DIRECTED if graph.is_directed else 0) | (_FLAG_WEIGHTED if graph.is_weighted else 0)
+             | (_FLAG_BIG_ENDIAN if sys.byteorder == 'big' else 0))
+    position = _SNAPSHOT_HEADER.size + _SNAPSHOT_ENTRY.size * len(SNAPSHOT_SECTIONS)
+    table = []
+    for name in SNAPSHOT_SECTIONS:
+        position += -position % 8
+        table.append((position, len(sections[name])))
+        position += len(sections[name])
+    
+    with open(path, 'wb') as f:
+        f.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, len(SNAPSHOT_SECTIONS)))
+        for entry in table:
+            f.write(_SNAPSHOT_ENTRY.pack(*entry))
+        for name, (offset, _) in zip(SNAPSHOT_SECTIONS, table):
+            f.write(b'\x00' * (offset - f.tell()))
+            f.write(sections[name])
+
+
+def load_graph(path: str, reporter: Optional[ConsoleReporter] = None) -> 'Graph':
+    """
+    Abre um arquivo de save_graph. As arestas ficam em um CSR cujos vetores são
+    visões diretas do arquivo mapeado (sem cópia); os vértices são remontados
+    a partir da tabela de atributos. A primeira alteração copia o CSR para a
+    lista de adjacência mutável, como um thaw() comum.
+    O grafo devolvido é dono do mapeamento (guardado no CSR): ele não é fechado
+    aqui, e sim liberado quando o CSR mapeado e a lista de arestas ainda não
+    materializada deixam de ser usados (após thaw() ou com o descarte do grafo).
+    """
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    magic, version, flags, count = _SNAPSHOT_HEADER.unpack_from(buffer, 0)
+    layout = _SNAPSHOT_LAYOUTS.get(version) if magic == SNAPSHOT_MAGIC else None
+    if layout is None or count != len(layout):
+        buffer.close()
+        raise ValueError(f"Arquivo de rede inválido ou de versão não suportada: {path}")
+    
+    swap = bool(flags & _FLAG_BIG_ENDIAN) != (sys.byteorder == 'big')
+    view = memoryview(buffer)
+    sections = {name: view[0:0] for name in SNAPSHOT_SECTIONS}
+    for k, name in enumerate(layout):
+        offset, size = _SNAPSHOT_ENTRY.unpack_from(buffer, _SNAPSHOT_HEADER.size + k * _SNAPSHOT_ENTRY.size)
+        sections[name] = view[offset:offset + size]
+    
+    def typed(name: str, typecode: str):
+        """Visão tipada sem cópia; arquivo de outra arquitetura exige cópia invertida"""
+        if not swap:
+            return sections[name].cast(typecode)
+        data = array(typecode, sections[name].tobytes())
+        data.byteswap()
+        return data
+    
+    def strings(offsets, data) -> List[str]:
+        raw = bytes(data)
+        return [raw[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+    
+    names = strings(typed('name_offsets', 'q'), sections['names'])
+    groups = strings(typed('constellation_offsets', 'q'), sections['constellations'])
+    magnitude, distance, coords = typed('magnitude', 'd'), typed('distance', 'd'), typed('coords', 'd')
+    constellation = typed('constellation', 'q')
+    extras = json.loads(bytes(sections['extras']).decode('utf-8'))
+    
+    # As colunas numéricas são copiadas inteiras para a VertexTable (memcpy);
+    # só os bits de presença e as lápides pedem um laço por vértice
+    table = VertexTable()
+    table.names = names
+    table.magnitude, table.distance, table.coords = array('d', magnitude), array('d', distance), array('d', coords)
+    for group in groups:
+        table.group_code(group)
+    
+    saved_flags = sections['vertex_flags']
+    base = _LIVE | _COLUMN_FLAGS['nome'] | _COLUMN_FLAGS['magnitude'] | _COLUMN_FLAGS['constelacao']
+    has_name, has_distance, has_coords = (_COLUMN_FLAGS['nome'], _COLUMN_FLAGS['distancia_ua'],
+                                          _COLUMN_FLAGS['coordenadas'])
+    vertex_flags = array('B', saved_flags) if len(saved_flags) else array('B', bytes(len(names)))
+    codes = array('i', bytes(4 * len(names)))
+    free = []
+    for i, code in enumerate(constellation):
+        if code == _FREE_SLOT:
+            table.names[i] = None
+            codes[i] = -1
+            free.append(i)
+            continue
+        codes[i] = code
+        if not len(saved_flags):
+            # Arquivo sem bits de presença: as três colunas fixas contam como presentes
+            vertex_flags[i] = (base | (has_distance if distance[i] == distance[i] else 0)
+                               | (has_coords if coords[3 * i] == coords[3 * i] else 0))
+        elif not vertex_flags[i] & has_name:
+            table.names[i] = None
+    table.flags, table.constellation = vertex_flags, codes
+    for i, values in extras.items():
+        for key, value in values.items():
+            table.set_attribute(int(i), key, value)
+    
+    graph = Graph(is_directed=bool(flags & _FLAG_DIRECTED), is_weighted=bool(flags & _FLAG_WEIGHTED),
+                  storage='sparse', reporter=reporter)
+    graph.vertices = table
+    graph._free = free
+    graph._rebuild_name_index()
+    csr = CSRStorage(typed('offsets', 'q'), typed('indices', 'q'), typed('weights', 'd'))
+    csr._buffer = buffer  # Mantém o mapeamento vivo enquanto o snapshot for usado
+    graph._storage = csr
+    
+    graph._edges = EdgeList(_csr_arcs(csr, typed('zero_arcs', 'q')))
+    
+    landmarks = typed('landmarks', 'q').tolist()
+    if landmarks:
+        n = len(names)
+        distances = typed('landmark_distances', 'd')
+        rows = []
+        for k in range(len(distances) // n):
+            row = array('d')
+            row.frombytes(distances[k * n:(k + 1) * n].tobytes())  # Cópia: o índice não prende o mapeamento
+            rows.append(row)
+        dist_from = rows[:len(landmarks)]
+        dist_to = rows[len(landmarks):] if graph.is_directed else dist_from
+        graph._landmarks = LandmarkIndex(graph._version, landmarks, dist_from, dist_to)
+    return graph
+
+
+def _csr_arcs(csr: CSRStorage, zero_arcs=()) -> Iterator[Tuple[int, int, float]]:
+    """Arcos de um CSR seguidos dos arcos de peso 0 (pares achatados origem, destino)"""
+    for u in range(len(csr)):
+        for v, weight in csr.neighbors(u):
+            yield u, v, weight
+    for k in range(0, len(zero_arcs), 2):
+        yield zero_arcs[k], zero_arcs[k + 1], 0.0
+
+
+# ========================================
+# IMPORTAÇÃO EM LOTE (CSV / JSON LINES)
+# ========================================
+
+# Nomes de coluna aceitos para cada campo (o primeiro presente vence)
+_CATALOG_COLUMNS = {
+    'nome': ('nome', 'name'),
+    'magnitude': ('magnitude', 'mag'),
+    'constelacao': ('constelacao', 'constellation'),
+    'distancia_ua': ('distancia_ua', 'distance_au'),
+    'coordenadas': ('coordenadas', 'coordinates'),
+    'x': ('x',),
+    'y': ('y',),
+    'z': ('z',),
+}
+_EDGE_COLUMNS = {
+    'origem': ('origem', 'source', 'from'),
+    'destino': ('destino', 'target', 'to'),
+    'peso': ('peso', 'weight'),
+}
+
+
+def _read_records(path: str, columns: Dict[str, Tuple[str, ...]]) -> Iterator[list]:
+    """
+    Lê um registro por vez (CSV com cabeçalho ou JSON Lines) e o devolve como
+    sequência de valores na ordem de columns; campos ausentes vêm como None
+    (JSON) ou '' (CSV). No CSV os apelidos são resolvidos uma única vez, a partir
+    do cabeçalho, e cada linha é recortada por um único itemgetter.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith('.csv'):
+            reader = csv.reader(f)
+            header = [name.strip() for name in next(reader, [])]
+            width = len(header)  # Colunas ausentes apontam para uma célula vazia extra
+            positions = [next((header.index(alias) for alias in aliases if alias in header), width)
+                         for aliases in columns.values()]
+            pick = itemgetter(*positions)
+            for row in reader:
+                if len(row) != width:
+                    row = (row + [''] * width)[:width]
+                row.append('')
+                yield pick(row)
         else:
-            print(f"Todos os caminhos:")
-        
-        for i, (path, cost) in enumerate(zip(all_paths, all_costs)):
-            path_names = [self.vertices[v]['nome'] for v in path]
-            is_optimal = i in optimal_indices
-            status = " ★ ÓTIMO" if is_optimal else ""
-            
-            # Cálculos astronômicos
-            km_total = cost * 150_000_000  # 1 UA = 150 milhões de km
-            
-            # Formatação da distância
-            if km_total >= 1_000_000_000:  # Bilhões
-                km_formatado = f"{km_total/1_000_000_000:.1f} bilhões de km"
-            elif km_total >= 1_000_000:  # Milhões
-                km_formatado = f"{km_total/1_000_000:.0f} milhões de km"
-            else:
-                km_formatado = f"{km_total:,.0f} km"
-            
-            print(f"  [{i+1:2d}] {' → '.join(path_names)}")
-            print(f"       Custo total (Unidade Astronomica): {cost:.2f}")
-            print(f"       Distancia real: {cost:.2f} × 150 milhões km = {km_formatado}{status}")
-        
-        if len(optimal_indices) > 1:
-            print(f"\nCaminhos ótimos: {len(optimal_indices)} (mesmo custo mínimo)")
-        elif len(optimal_indices) == 1:
-            print(f"\nCaminho ótimo: #{optimal_indices[0]+1}")
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                yield [next((record[alias] for alias in aliases
+                             if record.get(alias) is not None and record.get(alias) != ''), None)
+                       for aliases in columns.values()]
+
+
+def _catalog_vertex(name, magnitude, group, distance, position, x, y, z) -> Optional[tuple]:
+    """
+    Converte um registro do catálogo nos argumentos de VertexTable.append_record
+    (nome, magnitude, constelação, distância, coordenadas); None se não tem nome.
+    Coordenadas que não sejam exatamente 3 números geram ValueError.
+    """
+    if not name or not str(name).strip():
+        return None
     
-    def _reconstruct_floyd_paths(self, start: int, target: int, next_vertices: List[List[List[int]]], 
-                                current_path: List[int], all_paths: List[List[int]]):
-        """Reconstrói recursivamente todos os caminhos do Floyd-Warshall"""
-        if start == target:
-            all_paths.append(current_path.copy())
-            return
-        
-        for next_vertex in next_vertices[start][target]:
-            new_path = current_path + [next_vertex]
-            if next_vertex == target:
-                all_paths.append(new_path.copy())
-            else:
-                self._reconstruct_floyd_paths(next_vertex, target, next_vertices, new_path, all_paths)
+    coords = None
+    if isinstance(position, str):
+        position = position.split(',') if position.strip() else None
+    if not position:
+        axes = [c for c in (x, y, z) if c not in (None, '')]
+        position = (x, y, z) if axes else None
+    if position:
+        if len(position) != 3:
+            raise ValueError(f"coordenadas devem ter exatamente 3 valores (recebido {len(position)})")
+        coords = tuple(_as_float(c) for c in position)
+        if None in coords:
+            raise ValueError(f"coordenadas inválidas: {position!r}")
+    return str(name).strip(), _as_float(magnitude), str(group) if group else None, _as_float(distance), coords
+
+
+def import_catalog(catalog_path: str, edges_path: Optional[str] = None, is_directed: bool = False,
+                   is_weighted: bool = True, reporter: Optional[ConsoleReporter] = None) -> 'Graph':
+    """
+    Importa um catálogo de objetos celestes (CSV ou JSON Lines: nome, magnitude,
+    constelação e, opcionalmente, distancia_ua e coordenadas / x, y, z) e uma lista
+    de arestas (origem, destino, peso, referenciando os nomes). Os registros são
+    lidos em fluxo, numa única passada que monta a tabela de vértices, o índice
+    de nomes e a lista de adjacência; no fim o grafo é congelado em CSR.
+    Nomes repetidos (sem diferenciar caixa e acentos), arestas com extremos
+    desconhecidos e arestas repetidas (a primeira vale) são ignorados e contados
+    no relatório. Coordenadas que não tenham 3 valores e, em grafos ponderados,
+    pesos vazios ou não numéricos geram ValueError indicando o registro.
+    """
+    graph = Graph(is_directed=is_directed, is_weighted=is_weighted, storage='sparse', reporter=reporter)
+    vertices = graph.vertices
+    index: Dict[str, int] = {}
+    skipped_vertices = 0
     
-    def _reconstruct_bellman_paths(self, current: int, start: int, predecessors: List[List[int]], 
-                                  current_path: List[int], all_paths: List[List[int]]):
-        """Reconstrói recursivamente todos os caminhos do Bellman-Ford"""
-        if current == start:
-            all_paths.append(current_path.copy())
-            return
-        
-        for pred in predecessors[current]:
-            new_path = [pred] + current_path
-            self._reconstruct_bellman_paths(pred, start, predecessors, new_path, all_paths)
+    for number, record in enumerate(_read_records(catalog_path, _CATALOG_COLUMNS), 1):
+        try:
+            vertex = _catalog_vertex(*record)
+        except ValueError as error:
+            raise ValueError(f"{catalog_path}, registro {number}: {error}") from None
+        key = _normalize_name(vertex[0]) if vertex is not None else None
+        if key is None or key in index:
+            skipped_vertices += 1
+            continue
+        index[key] = len(vertices)
+        vertices.append_record(*vertex)
+    
+    # Só as listas de saída: o CSR final monta a própria transposta quando precisar
+    adjacency: List[Dict[int, float]] = [{} for _ in vertices]
+    zero_arcs = array('q')
+    zero_seen: Set[Tuple[int, int]] = set()
+    edge_count = skipped_edges = duplicate_edges = 0
+    
+    if edges_path is not None:
+        for number, (origin, destination, weight) in enumerate(_read_records(edges_path, _EDGE_COLUMNS), 1):
+            u = index.get(_normalize_name('' if origin is None else origin))
+            v = index.get(_normalize_name('' if destination is None else destination))
+            if u is None or v is None:
+                skipped_edges += 1
+                continue
+            weight = _as_float(weight) if is_weighted else 1.0
+            if weight is None:
+                raise ValueError(f"{edges_path}, aresta {number}: peso vazio ou inválido em grafo ponderado")
+            if v in adjacency[u] or (u, v) in zero_seen:
+                duplicate_edges += 1
+                continue
+            edge_count += 1
+            if weight == 0:
+                zero_arcs.extend((u, v) if is_directed or u == v else (u, v, v, u))
+                zero_seen.add((u, v))
+                if not is_directed:
+                    zero_seen.add((v, u))
+                continue
+            adjacency[u][v] = weight
+            if not is_directed:
+                adjacency[v][u] = weight
+    
+    graph._name_index = index
+    storage = SparseStorage()
+    storage.adj = adjacency
+    csr = CSRStorage.from_storage(storage)
+    graph._storage = csr
+    graph._edges = EdgeList(_csr_arcs(csr, zero_arcs))
+    graph._touch()
+    
+    graph._report(f"Importação concluída: {len(vertices)} objetos celestes e {edge_count} arestas "
+                  f"({skipped_vertices} registros, {skipped_edges} arestas com extremos desconhecidos "
+                  f"e {duplicate_edges} arestas repetidas ignorados).")
+    return graph
 
 
 def main():
     # Criar grafo não-direcionado e ponderado
-    grafo = Graph(is_directed=False, is_weighted=True)
+    grafo = Graph(is_directed=False, is_weighted=True, reporter=ConsoleReporter())
     
     while True:
         print(f"\n{'='*60}")
@@ -850,8 +3685,20 @@ def main():
         print("19 - Algoritmo de Dijkstra")
         print("20 - Algoritmo de Floyd-Warshall")
         print("21 - Algoritmo de Bellman-Ford")
-        
-        print("\n22 - Análise Comparativa de Algoritmos")
+        print("22 - Análise Comparativa de Algoritmos")
+        print("23 - Dijkstra Bidirecional")
+        print("24 - Busca A* (heurística por posição)")
+        print("25 - A* com landmarks (ALT)")
+        print("26 - Contraction Hierarchies")
+        print("27 - Bellman-Ford com fila (SPFA)")
+        print("28 - Johnson (all-pairs esparso)")
+        
+        print("\nARQUIVOS E ÍNDICES:")
+        print("29 - Salvar rede em arquivo")
+        print("30 - Abrir rede de arquivo")
+        print("31 - Importar catálogo (CSV / JSON Lines)")
+        print("32 - Compactar índices (recupera vértices removidos)")
+        print("33 - Astros por faixa de magnitude")
         print("0 - Sair")
         print(f"{'='*60}")
         
@@ -871,32 +3718,38 @@ def main():
                 magnitude = input("Magnitude (ou Enter para nulo): ")
                 magnitude = float(magnitude) if magnitude else None
                 constelacao = input("Constelação: ")
+                distancia = input("Distância ao Sol em UA (ou Enter para pular): ").strip()
+                coordenadas = input("Coordenadas x,y,z em UA (ou Enter para pular): ").strip()
                 
                 vertex_data = {
                     'nome': nome,
                     'magnitude': magnitude,
                     'constelacao': constelacao
                 }
+                if distancia:
+                    vertex_data['distancia_ua'] = float(distancia)
+                if coordenadas:
+                    vertex_data['coordenadas'] = tuple(float(c) for c in coordenadas.split(','))
                 
                 index = grafo.add_vertex(vertex_data)
                 if index != -1:
                     print(f"Vértice '{nome}' adicionado com índice {index + 1}.")
             
             elif opc == '2':  # Remover vértice
-                if not grafo.vertices:
+                if not grafo.vertex_count:
                     print("Grafo vazio.")
                     continue
                 
-                grafo.listar_todas_estrelas()
+                grafo.reporter.star_list(grafo.listar_todas_estrelas())
                 index = int(input("Índice do vértice a remover: ")) - 1
                 grafo.remove_vertex(index)
             
             elif opc == '3':  # Atualizar vértice
-                if not grafo.vertices:
+                if not grafo.vertex_count:
                     print("Grafo vazio.")
                     continue
                 
-                grafo.listar_todas_estrelas()
+                grafo.reporter.star_list(grafo.listar_todas_estrelas())
                 index = int(input("Índice do vértice a atualizar: ")) - 1
                 
                 nome = input("Novo nome (ou Enter para manter): ")
@@ -914,77 +3767,80 @@ def main():
                 grafo.update_vertex(index, new_data)
             
             elif opc == '4':  # Consultar vértice
-                if not grafo.vertices:
+                if not grafo.vertex_count:
                     print("Grafo vazio.")
                     continue
                 
-                grafo.listar_todas_estrelas()
+                grafo.reporter.star_list(grafo.listar_todas_estrelas())
                 index = int(input("Índice do vértice a consultar: ")) - 1
                 grafo.get_vertex_info(index)
             
             elif opc == '5':  # Adicionar aresta
-                if len(grafo.vertices) < 2:
+                if grafo.vertex_count < 2:
                     print("É necessário pelo menos 2 vértices.")
                     continue
                 
-                grafo.listar_todas_estrelas()
+                grafo.reporter.star_list(grafo.listar_todas_estrelas())
                 v1 = int(input("Índice do primeiro vértice: ")) - 1
                 v2 = int(input("Índice do segundo vértice: ")) - 1
                 weight = float(input("Peso da aresta: "))
                 
+                if not grafo.is_live(v1) or not grafo.is_live(v2):
+                    print("Índices inválidos.")
+                    continue
                 grafo.add_edge(v1, v2, weight)
                 v1_nome = grafo.vertices[v1]['nome']
                 v2_nome = grafo.vertices[v2]['nome']
                 print(f"Aresta adicionada entre '{v1_nome}' e '{v2_nome}' com peso {weight}.")
             
             elif opc == '6':  # Remover aresta
-                if not grafo.vertices:
+                if not grafo.vertex_count:
                     print("Grafo vazio.")
                     continue
                 
-                grafo.listar_todas_estrelas()
+                grafo.reporter.star_list(grafo.listar_todas_estrelas())
                 v1 = int(input("Índice do primeiro vértice: ")) - 1
                 v2 = int(input("Índice do segundo vértice: ")) - 1
                 grafo.remove_edge(v1, v2)
             
             elif opc == '7':  # Atualizar aresta
-                if not grafo.vertices:
+                if not grafo.vertex_count:
                     print("Grafo vazio.")
                     continue
                 
-                grafo.listar_todas_estrelas()
+                grafo.reporter.star_list(grafo.listar_todas_estrelas())
                 v1 = int(input("Índice do primeiro vértice: ")) - 1
                 v2 = int(input("Índice do segundo vértice: ")) - 1
                 new_weight = float(input("Novo peso: "))
                 grafo.update_edge(v1, v2, new_weight)
             
             elif opc == '8':  # Consultar aresta
-                if not grafo.vertices:
+                if not grafo.vertex_count:
                     print("Grafo vazio.")
                     continue
                 
-                grafo.listar_todas_estrelas()
+                grafo.reporter.star_list(grafo.listar_todas_estrelas())
                 v1 = int(input("Índice do primeiro vértice: ")) - 1
                 v2 = int(input("Índice do segundo vértice: ")) - 1
                 grafo.get_edge_info(v1, v2)
             
             elif opc == '9':  # Informações do grafo
-                grafo.list_graph_info()
+                grafo.reporter.graph_info(grafo.list_graph_info())
             
             elif opc == '10':  # Estrela mais brilhante
                 grafo.find_brightest_star()
             
             elif opc == '11':  # Contar por constelação
-                grafo.count_by_constellation()
+                grafo.reporter.constellation_counts(grafo.count_by_constellation())
             
             elif opc == '12':  # Listar todas
-                grafo.listar_todas_estrelas()
+                grafo.reporter.star_list(grafo.listar_todas_estrelas())
             
             elif opc == '13':  # Menor estrela/planeta
                 grafo.find_brightest_star()  # Reutiliza a função
             
             elif opc == '14':  # Mais conectadas
-                grafo.list_most_connected_stars()
+                grafo.reporter.most_connected(grafo.list_most_connected_stars())
             
             elif opc == '15':  # Matriz de adjacência
                 grafo.exibir_matriz_adjacencia()
@@ -994,7 +3850,7 @@ def main():
                 
                 # Informações adicionais após carregamento
                 print("\n========== REDE ESTELAR CARREGADA COM SUCESSO! ==========")
-                print(f">>> {len(grafo.vertices)} objetos celestes inseridos")
+                print(f">>> {grafo.vertex_count} objetos celestes inseridos")
                 print(">>> 28 rotas espaciais estabelecidas")
                 print(">>> Grafo configurado como NAO-DIRECIONADO (viagens bidirecionais)")
                 
@@ -1008,12 +3864,12 @@ def main():
                 print(f"   SOL: 1 (centro do sistema)")
                 print(f"============================================================")
             
-            elif opc in ['17', '18', '19', '20', '21']:  # Algoritmos individuais
-                if not grafo.vertices:
+            elif opc in ['17', '18', '19', '20', '21', '23', '24', '25', '26', '27', '28']:  # Algoritmos individuais
+                if not grafo.vertex_count:
                     print("Carregue primeiro uma rede (opção 16).")
                     continue
                 
-                grafo.listar_todas_estrelas()
+                grafo.reporter.star_list(grafo.listar_todas_estrelas())
                 start = int(input("Vértice de origem: ")) - 1
                 target = int(input("Vértice de destino: ")) - 1
                 
@@ -1027,13 +3883,25 @@ def main():
                     paths, costs = grafo.floyd_warshall_all_paths(start, target)
                 elif opc == '21':
                     paths, costs = grafo.bellman_ford_all_paths(start, target)
+                elif opc == '23':
+                    paths, costs = grafo.bidirectional_dijkstra_all_paths(start, target)
+                elif opc == '24':
+                    paths, costs = grafo.astar_all_paths(start, target)
+                elif opc == '25':
+                    paths, costs = grafo.alt_all_paths(start, target)
+                elif opc == '26':
+                    paths, costs = grafo.contraction_hierarchy_shortest_path(start, target)
+                elif opc == '27':
+                    paths, costs = grafo.spfa_all_paths(start, target)
+                elif opc == '28':
+                    paths, costs = grafo.johnson_all_paths(start, target)
             
             elif opc == '22':  # Análise comparativa
-                if not grafo.vertices:
+                if not grafo.vertex_count:
                     print("Carregue primeiro uma rede (opção 16).")
                     continue
                 
-                grafo.listar_todas_estrelas()
+                grafo.reporter.star_list(grafo.listar_todas_estrelas())
                 start = int(input("Vértice de origem: ")) - 1
                 target = int(input("Vértice de destino: ")) - 1
                 
@@ -1042,7 +3910,13 @@ def main():
                     ("BFS", grafo.bfs_all_paths),
                     ("Dijkstra", grafo.dijkstra_all_paths),
                     ("Floyd-Warshall", grafo.floyd_warshall_all_paths),
-                    ("Bellman-Ford", grafo.bellman_ford_all_paths)
+                    ("Bellman-Ford", grafo.bellman_ford_all_paths),
+                    ("Dijkstra Bidirecional", grafo.bidirectional_dijkstra_all_paths),
+                    ("A*", grafo.astar_all_paths),
+                    ("A* com landmarks (ALT)", grafo.alt_all_paths),
+                    ("Contraction Hierarchies", grafo.contraction_hierarchy_shortest_path),
+                    ("Bellman-Ford (SPFA)", grafo.spfa_all_paths),
+                    ("Johnson", grafo.johnson_all_paths)
                 ]
                 
                 print(f"\n{'='*80}")
@@ -1056,6 +3930,38 @@ def main():
                     except Exception as e:
                         print(f"\nErro em {name}: {e}")
             
+            elif opc == '29':  # Salvar em arquivo
+                path = input("Arquivo de destino: ").strip()
+                grafo.save(path)
+                print(f"Rede salva em '{path}' ({grafo.vertex_count} objetos celestes).")
+            
+            elif opc == '30':  # Abrir de arquivo
+                path = input("Arquivo da rede: ").strip()
+                grafo = Graph.load(path, reporter=grafo.reporter)
+                print(f"Rede carregada de '{path}' ({grafo.vertex_count} objetos celestes).")
+            
+            elif opc == '31':  # Importar catálogo
+                catalog_path = input("Arquivo do catálogo: ").strip()
+                edges_path = input("Arquivo de arestas (ou Enter para nenhum): ").strip() or None
+                try:
+                    grafo = Graph.from_catalog(catalog_path, edges_path, grafo.is_directed, grafo.is_weighted,
+                                               reporter=grafo.reporter)
+                except ValueError as e:
+                    print(f"Catálogo rejeitado: {e}")
+            
+            elif opc == '32':  # Compactar índices
+                removed = len(grafo.vertices) - grafo.vertex_count
+                grafo.compact()
+                print(f"Índices compactados: {removed} slot(s) removido(s) recuperado(s).")
+            
+            elif opc == '33':  # Faixa de magnitude
+                low = float(input("Magnitude mínima: "))
+                high = float(input("Magnitude máxima: "))
+                found = grafo.stars_in_magnitude_range(low, high)
+                print(f"\n{len(found)} astro(s) com magnitude entre {low} e {high}:")
+                for v in found:
+                    print(f"  [{v+1}] {grafo.vertices[v]['nome']}: {grafo.vertices[v]['magnitude']}")
+            
             else:
                 print("Opção inválida.")
         
@@ -0,0 +1,259 @@
+"""
+Micro-benchmarks dos algoritmos do N2.py.
+
+Uso:
+    python benchmarks.py            # roda todos
+    python benchmarks.py heaps      # roda apenas o benchmark escolhido
+"""
+import heapq
+import os
+import random
+import sys
+import time
+
+from N2 import Graph
+
+
+def _timed(func, *args):
+    """Executa func(*args) e retorna (resultado, segundos)"""
+    t0 = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t0
+
+
+def _random_adjacency(n: int, degree: int, seed: int = 42):
+    """Lista de adjacência aleatória (vizinho, peso) com grau médio fixo"""
+    rng = random.Random(seed)
+    adjacency = [[] for _ in range(n)]
+    for u in range(n):
+        for _ in range(degree):
+            adjacency[u].append((rng.randrange(n), rng.uniform(1.0, 100.0)))
+    return adjacency
+
+
+# ========================================
+# FILAS DE PRIORIDADE
+# ========================================
+
+def _dijkstra_minheap(adjacency, source):
+    """Dijkstra com o MinHeap original (entradas duplicadas + descarte de obsoletas)"""
+    dist = [float('inf')] * len(adjacency)
+    dist[source] = 0.0
+    pq = Graph.MinHeap()
+    pq.push((0.0, source))
+    visited = set()
+    peak = 1
+    while not pq.is_empty():
+        d, u = pq.pop()
+        if u in visited:
+            continue
+        visited.add(u)
+        for v, w in adjacency[u]:
+            if d + w < dist[v]:
+                dist[v] = d + w
+                pq.push((dist[v], v))
+                peak = max(peak, len(pq.heap))
+    return dist, peak
+
+
+def _dijkstra_heapq(adjacency, source):
+    """Dijkstra com heapq da biblioteca padrão (mesma estratégia de descarte)"""
+    dist = [float('inf')] * len(adjacency)
+    dist[source] = 0.0
+    pq = [(0.0, source)]
+    visited = set()
+    peak = 1
+    while pq:
+        d, u = heapq.heappop(pq)
+        if u in visited:
+            continue
+        visited.add(u)
+        for v, w in adjacency[u]:
+            if d + w < dist[v]:
+                dist[v] = d + w
+                heapq.heappush(pq, (dist[v], v))
+                peak = max(peak, len(pq))
+    return dist, peak
+
+
+def _dijkstra_indexed(adjacency, source):
+    """Dijkstra com o IndexedMinHeap (decrease_key, no máximo V entradas)"""
+    dist = [float('inf')] * len(adjacency)
+    dist[source] = 0.0
+    pq = Graph.IndexedMinHeap(len(adjacency))
+    pq.push(source, 0.0)
+    peak = 1
+    while not pq.is_empty():
+        d, u = pq.pop()
+        for v, w in adjacency[u]:
+            if d + w < dist[v]:
+                dist[v] = d + w
+                pq.push_or_decrease(v, dist[v])
+                peak = max(peak, len(pq))
+    return dist, peak
+
+
+def _push_pop(n: int, seed: int = 7):
+    """Sequência de prioridades para o teste de push/pop puro"""
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(n)]
+
+
+def benchmark_heaps(n: int = 50_000, degree: int = 8) -> None:
+    """Compara MinHeap, heapq e IndexedMinHeap em push/pop puro e dentro do Dijkstra"""
+    print(f"\n=== Filas de prioridade: push/pop de {n} itens ===")
+    keys = _push_pop(n)
+
+    def run_minheap():
+        pq = Graph.MinHeap()
+        for i, k in enumerate(keys):
+            pq.push((k, i))
+        while not pq.is_empty():
+            pq.pop()
+
+    def run_heapq():
+        pq = []
+        for i, k in enumerate(keys):
+            heapq.heappush(pq, (k, i))
+        while pq:
+            heapq.heappop(pq)
+
+    def run_indexed():
+        pq = Graph.IndexedMinHeap(n)
+        for i, k in enumerate(keys):
+            pq.push(i, k)
+        while not pq.is_empty():
+            pq.pop()
+
+    for name, func in (("MinHeap", run_minheap), ("heapq", run_heapq), ("IndexedMinHeap", run_indexed)):
+        _, seconds = _timed(func)
+        print(f"  {name:<15} {seconds * 1000:9.1f} ms")
+
+    print(f"\n=== Dijkstra em grafo aleatório (V={n}, grau médio={degree}) ===")
+    adjacency = _random_adjacency(n, degree)
+    reference = None
+    for name, func in (("MinHeap", _dijkstra_minheap), ("heapq", _dijkstra_heapq),
+                       ("IndexedMinHeap", _dijkstra_indexed)):
+        (dist, peak), seconds = _timed(func, adjacency, 0)
+        if reference is None:
+            reference = dist
+        same = "ok" if dist == reference else "DIVERGENTE"
+        print(f"  {name:<15} {seconds * 1000:9.1f} ms   pico do heap: {peak:7d}   {same}")
+
+
+# ========================================
+# LANDMARKS (ALT)
+# ========================================
+
+def _synthetic_grid(side: int, seed: int = 42) -> Graph:
+    """
+    Grafo em grade side x side, não-direcionado, com pesos aleatórios: parecido
+    com uma malha de rotas, em que a busca cega explora uma área grande.
+    """
+    rng = random.Random(seed)
+    graph = Graph(is_directed=False, is_weighted=True, storage='sparse')
+    for v in range(side * side):
+        graph.add_vertex({'nome': f"V{v}", 'magnitude': None, 'constelacao': "Sintética"})
+    for row in range(side):
+        for col in range(side):
+            v = row * side + col
+            if col + 1 < side:
+                graph.add_edge(v, v + 1, rng.uniform(1.0, 10.0))
+            if row + 1 < side:
+                graph.add_edge(v, v + side, rng.uniform(1.0, 10.0))
+    return graph
+
+
+def benchmark_landmarks(side: int = 317, landmarks: int = 8, queries: int = 10) -> None:
+    """Dijkstra x ALT (A* com landmarks) em consultas ponto a ponto num grafo de ~100k vértices"""
+    print(f"\n=== Landmarks (ALT) em grade {side}x{side} = {side * side} vértices ===")
+    graph, seconds = _timed(_synthetic_grid, side)
+    print(f"  Construção do grafo:       {seconds:8.2f} s")
+    _, seconds = _timed(graph.build_landmark_index, landmarks, 1)
+    print(f"  Pré-processamento (K={landmarks}):  {seconds:8.2f} s")
+
+    rng = random.Random(3)
+    n = len(graph.vertices)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+
+    total_dijkstra = total_alt = 0.0
+    for start, target in pairs:
+        plain, t_plain = _timed(graph.dijkstra_shortest_paths, start, target)
+        guided, t_alt = _timed(graph.alt_shortest_paths, start, target)
+        total_dijkstra += t_plain
+        total_alt += t_alt
+        same = "ok" if abs(plain.cost - guided.cost) <= 1e-9 * max(1.0, plain.cost) else "DIVERGENTE"
+        print(f"  {start:6d} -> {target:6d}  Dijkstra {t_plain * 1000:8.1f} ms   "
+              f"ALT {t_alt * 1000:8.1f} ms   {same}")
+
+    print(f"  Média: Dijkstra {total_dijkstra / queries * 1000:.1f} ms, "
+          f"ALT {total_alt / queries * 1000:.1f} ms "
+          f"(speedup {total_dijkstra / max(total_alt, 1e-9):.1f}x)")
+
+
+# ========================================
+# CONTRACTION HIERARCHIES
+# ========================================
+
+def benchmark_hierarchy(side: int = 100, queries: int = 20) -> None:
+    """Dijkstra x contraction hierarchies: custo do pré-processamento e das consultas"""
+    print(f"\n=== Contraction hierarchies em grade {side}x{side} = {side * side} vértices ===")
+    graph = _synthetic_grid(side)
+    hierarchy, seconds = _timed(graph.build_contraction_hierarchy)
+    print(f"  Pré-processamento:         {seconds:8.2f} s   atalhos: {len(hierarchy.middle)}")
+
+    rng = random.Random(5)
+    n = len(graph.vertices)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+
+    total_dijkstra = total_ch = 0.0
+    divergent = 0
+    for start, target in pairs:
+        plain, t_plain = _timed(graph.dijkstra_shortest_paths, start, target)
+        (_, cost), t_ch = _timed(hierarchy.query, start, target)
+        total_dijkstra += t_plain
+        total_ch += t_ch
+        if abs(plain.cost - cost) > 1e-9 * max(1.0, plain.cost):
+            divergent += 1
+
+    print(f"  Média: Dijkstra {total_dijkstra / queries * 1000:.1f} ms, "
+          f"CH {total_ch / queries * 1000:.2f} ms "
+          f"(speedup {total_dijkstra / max(total_ch, 1e-9):.1f}x, divergências: {divergent})")
+
+
+# ========================================
+# ALL-PAIRS PARALELO
+# ========================================
+
+def benchmark_parallel(side: int = 40) -> None:
+    """All-pairs por Dijkstra em 1 processo x todos os núcleos (memória compartilhada)"""
+    cores = os.cpu_count() or 1
+    graph = _synthetic_grid(side)
+    print(f"\n=== All-pairs paralelo em grade {side}x{side} = {side * side} vértices ({cores} núcleos) ===")
+    (serial, _), t_serial = _timed(graph.parallel_all_pairs, 'dijkstra', 1)
+    print(f"  1 processo:   {t_serial:8.2f} s")
+    if cores > 1:
+        (parallel, _), t_parallel = _timed(graph.parallel_all_pairs, 'dijkstra', cores)
+        same = "ok" if parallel == serial else "DIVERGENTE"
+        print(f"  {cores} processos: {t_parallel:8.2f} s   (speedup {t_serial / t_parallel:.1f}x)   {same}")
+
+
+BENCHMARKS = {
+    'heaps': benchmark_heaps,
+    'landmarks': benchmark_landmarks,
+    'hierarchy': benchmark_hierarchy,
+    'parallel': benchmark_parallel,
+}
+
+
+def main():
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        if name not in BENCHMARKS:
+            print(f"Benchmark desconhecido: {name}. Opções: {', '.join(BENCHMARKS)}")
+            continue
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,148 @@
-from typing import Any, Dict, List, Optional
+from array import array
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Tuple
+
+from N2 import MagnitudeIndex, VertexTable, _normalize_name
+
+
+normalizar_nome = _normalize_name
+
+_NAN = float("nan")
+
+
+class TabelaVertices(VertexTable):
+    """
+    A VertexTable do N2 com os nomes usados no n1. Aqui a magnitude também pode
+    vir em texto ("0.42", guardada nos extras) e entra no MagnitudeIndex do N2.
+    """
+
+    vivo = VertexTable.is_live
+    contar_constelacoes = VertexTable.count_constellations
+
+    def _magnitude_texto(self, i: int) -> float:
+        """Magnitude em texto guardada nos extras, como float; NaN se não há."""
+        try:
+            return float(self.extras[i]["magnitude"])
+        except (KeyError, TypeError, ValueError):
+            return _NAN
+
+    def magnitude_index(self) -> MagnitudeIndex:
+        """O índice do N2 sobre a coluna numérica, mais as magnitudes em texto."""
+        if self._magnitude_index is None:
+            indice = super().magnitude_index()
+            for i in self.extras:
+                mag = self._magnitude_texto(i)
+                if mag == mag:
+                    indice.add(i, mag)
+        return self._magnitude_index
+
+    indice_magnitudes = magnitude_index
+
+    def _reindexar_texto(self, i: int, antes: float) -> None:
+        """Atualiza no índice a magnitude em texto de i, que valia antes."""
+        if self._magnitude_index is None:
+            return
+        if antes == antes:
+            self._magnitude_index.discard(i, antes)
+        depois = self._magnitude_texto(i)
+        if depois == depois:
+            self._magnitude_index.add(i, depois)
+
+    def set_attribute(self, i: int, chave: str, valor: Any) -> None:
+        if chave != "magnitude":
+            return super().set_attribute(i, chave, valor)
+        antes = self._magnitude_texto(i)
+        super().set_attribute(i, chave, valor)
+        self._reindexar_texto(i, antes)
+
+    def delete_attribute(self, i: int, chave: str) -> None:
+        if chave != "magnitude":
+            return super().delete_attribute(i, chave)
+        antes = self._magnitude_texto(i)
+        super().delete_attribute(i, chave)
+        self._reindexar_texto(i, antes)
+
+    def _clear(self, i: int) -> None:
+        antes = self._magnitude_texto(i)
+        super()._clear(i)
+        self._reindexar_texto(i, antes)
+
+    compactar = VertexTable.compact
+
+
+class MatrizAdjacencia:
+    """
+    Matriz de adjacências quadrada num único array('d') contíguo, com capacidade
+    que dobra quando enche: add_vertex custa O(V) amortizado, sem um append em
+    cada linha. Células são lidas e gravadas com matriz[i, j]; matriz[i] devolve
+    uma cópia da linha i em lista. Fora do tamanho lógico, tudo é 0.
+    """
+
+    def __init__(self):
+        self.tamanho = 0
+        self.capacidade = 0
+        self.dados = array('d')
+
+    def __len__(self) -> int:
+        return self.tamanho
+
+    def _posicao(self, i: int, j: int) -> int:
+        if not (0 <= i < self.tamanho and 0 <= j < self.tamanho):
+            raise IndexError("posição fora da matriz")
+        return i * self.capacidade + j
+
+    def __getitem__(self, chave):
+        if isinstance(chave, tuple):
+            return self.dados[self._posicao(*chave)]
+        if not 0 <= chave < self.tamanho:
+            raise IndexError("linha fora da matriz")
+        inicio = chave * self.capacidade
+        return self.dados[inicio:inicio + self.tamanho].tolist()
+
+    def __setitem__(self, chave: Tuple[int, int], valor: float) -> None:
+        self.dados[self._posicao(*chave)] = valor
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __iter__(self):
+        for i in range(self.tamanho):
+            yield self[i]
+
+    def coluna(self, j: int) -> array:
+        """Cópia da coluna j (fatia com passo = capacidade)."""
+        return self.dados[j:self.tamanho * self.capacidade:self.capacidade]
+
+    def adicionar_vertice(self) -> None:
+        if self.tamanho == self.capacidade:
+            self._crescer(max(4, 2 * self.capacidade))
+        self.tamanho += 1
+
+    def _crescer(self, capacidade: int) -> None:
+        dados = array('d', [0.0]) * (capacidade * capacidade)
+        antiga, n = self.capacidade, self.tamanho
+        for i in range(n):
+            dados[i * capacidade:i * capacidade + n] = self.dados[i * antiga:i * antiga + n]
+        self.dados = dados
+        self.capacidade = capacidade
+
+    def zerar_vertice(self, i: int) -> None:
+        """Zera a linha e a coluna i em O(V)."""
+        n, cap = self.tamanho, self.capacidade
+        zeros = array('d', [0.0]) * n
+        self.dados[i * cap:i * cap + n] = zeros
+        self.dados[i:n * cap:cap] = zeros
+
+    def compactar(self, manter: List[int]) -> None:
+        """Mantém só as linhas/colunas de manter, nessa ordem, com capacidade justa."""
+        m, cap = len(manter), self.capacidade
+        dados = array('d', [0.0]) * (m * m)
+        for novo, i in enumerate(manter):
+            linha = self.dados[i * cap:i * cap + self.tamanho]
+            dados[novo * m:(novo + 1) * m] = array('d', [linha[j] for j in manter])
+        self.dados = dados
+        self.tamanho = self.capacidade = m
+
 
 class Graph:
     def __init__(self, is_directed: bool = True, is_weighted: bool = False):
@@ -10,11 +154,19 @@ class Graph:
         self.is_directed = is_directed
         self.is_weighted = is_weighted
         
-        # Lista de vértices (cada vértice = dict com dados, ex. nome, magnitude etc.)
-        self.vertices: List[Dict[str, Any]] = []
+        # Tabela colunar de vértices (vertices[i] funciona como o dict do vértice:
+        # nome, magnitude etc.). Um vértice removido vira None (lápide): os índices
+        # dos demais não mudam.
+        self.vertices = TabelaVertices()
+        self._livres: List[int] = []  # Slots removidos, reaproveitados por add_vertex
         
-        # Matriz de adjacências (lista de listas). Cresce dinamicamente conforme add_vertex é chamado.
-        self.adjacency_matrix: List[List[float]] = []
+        # Matriz de adjacências contígua. Cresce (por dobra da capacidade) conforme add_vertex é chamado.
+        self.adjacency_matrix = MatrizAdjacencia()
+        
+        # Índice nome normalizado -> índice do primeiro vértice com esse nome
+        self._indice_nomes: Dict[str, int] = {}
+        # Só para nomes repetidos: os demais índices com o mesmo nome, em ordem
+        self._nomes_repetidos: Dict[str, List[int]] = {}
 
     # -------------------------------------------------------------------
     # Métodos de Manipulação de Vértice
@@ -23,28 +175,36 @@ class Graph:
     def add_vertex(self, vertex_data: Dict[str, Any]) -> int:
         """
         Adiciona um novo vértice e retorna o índice (0-based interno).
-        A matriz de adjacências é expandida em uma linha e uma coluna.
-        """
+        Reaproveita um slot removido, se houver; senão a matriz de adjacências
+        é expandida em uma linha e uma coluna.
+        """
+        if self._livres:
+            idx = self._livres.pop()  # Linha e coluna já zeradas na remoção
+            self.vertices[idx] = vertex_data
+            self._indexar_nome(vertex_data.get("nome", ""), idx)
+            return idx
+        
+        self._indexar_nome(vertex_data.get("nome", ""), len(self.vertices))
         self.vertices.append(vertex_data)
-        new_size = len(self.vertices)
         
-        # Expande a matriz: uma nova linha e uma nova coluna
-        self.adjacency_matrix.append([0.0]*(new_size - 1))
-        for row in self.adjacency_matrix:
-            row.append(0.0)
+        # Expande a matriz: uma nova linha e uma nova coluna (O(V) amortizado)
+        self.adjacency_matrix.adicionar_vertice()
         
-        return new_size - 1
+        return len(self.vertices) - 1
 
     def remove_vertex(self, vertex_index: int) -> None:
         """
         Remove o vértice (e todas as arestas) do grafo.
-        Aqui, vertex_index é 0-based interno.
-        """
-        if 0 <= vertex_index < len(self.vertices):
-            self.vertices.pop(vertex_index)
-            self.adjacency_matrix.pop(vertex_index)
-            for row in self.adjacency_matrix:
-                row.pop(vertex_index)
+        Aqui, vertex_index é 0-based interno. A linha e a coluna são apenas
+        zeradas (O(V)) e o slot vira lápide: nenhum outro vértice é renumerado.
+        Use compact() para recuperar o espaço dos slots removidos.
+        """
+        if self._vivo(vertex_index):
+            self.adjacency_matrix.zerar_vertice(vertex_index)
+            nome = self.vertices[vertex_index].get("nome", "")
+            self.vertices[vertex_index] = None
+            self._livres.append(vertex_index)
+            self._desindexar_nome(vertex_index, nome)
         else:
             print(f"Índice {vertex_index+1} inválido para remoção de vértice.")
 
@@ -52,17 +212,92 @@ class Graph:
         """
         Atualiza os dados de um vértice específico (0-based interno).
         """
-        if 0 <= vertex_index < len(self.vertices):
+        if self._vivo(vertex_index):
+            nome_antigo = self.vertices[vertex_index].get("nome", "")
             self.vertices[vertex_index].update(new_data)
+            if "nome" in new_data:
+                self._renomear_no_indice(vertex_index, nome_antigo, new_data["nome"])
         else:
             print(f"Vértice {vertex_index+1} não encontrado para atualização.")
 
+    def index_of(self, nome: str) -> int:
+        """
+        Retorna o índice (0-based) do vértice com esse nome, sem diferenciar
+        maiúsculas nem acentos, ou -1 se não existir. O(1) pelo índice de nomes.
+        """
+        return self._indice_nomes.get(normalizar_nome(nome), -1)
+
+    def _indexar_nome(self, nome: str, vertex_index: int) -> None:
+        # O índice aponta para o menor índice com o nome, como a antiga busca linear
+        chave = normalizar_nome(nome)
+        primeiro = self._indice_nomes.get(chave)
+        if primeiro is None:
+            self._indice_nomes[chave] = vertex_index
+            return
+        if vertex_index < primeiro:
+            self._indice_nomes[chave], vertex_index = vertex_index, primeiro
+        insort(self._nomes_repetidos.setdefault(chave, []), vertex_index)
+
+    def _renomear_no_indice(self, vertex_index: int, nome_antigo: str, nome_novo: str) -> None:
+        self._desindexar_nome(vertex_index, nome_antigo)
+        self._indexar_nome(nome_novo, vertex_index)
+
+    def _desindexar_nome(self, vertex_index: int, nome: str) -> None:
+        # O(1) para nomes únicos; com repetição, O(k) nos k vértices de mesmo nome
+        chave = normalizar_nome(nome)
+        outros = self._nomes_repetidos.get(chave)
+        if self._indice_nomes.get(chave) == vertex_index:
+            if outros:
+                self._indice_nomes[chave] = outros.pop(0)  # O próximo herda o nome
+            else:
+                del self._indice_nomes[chave]
+        elif outros:
+            pos = bisect_left(outros, vertex_index)
+            if pos < len(outros) and outros[pos] == vertex_index:
+                del outros[pos]
+        if outros is not None and not outros:
+            del self._nomes_repetidos[chave]
+
+    def _reconstruir_indice_nomes(self) -> None:
+        self._indice_nomes = {}
+        self._nomes_repetidos = {}
+        for i, v in self.vertices_vivos():
+            self._indexar_nome(v.get("nome", ""), i)
+
+    def _vivo(self, vertex_index: int) -> bool:
+        """True se o índice existe e o vértice não foi removido."""
+        return self.vertices.vivo(vertex_index)
+
+    def vertices_vivos(self):
+        """Gera (índice, dados) de cada vértice não removido, em ordem de índice."""
+        for i in range(len(self.vertices)):
+            if self.vertices.vivo(i):
+                yield i, self.vertices[i]
+
+    def compact(self) -> List[int]:
+        """
+        Recupera os slots removidos numa única passada: os vértices vivos são
+        renumerados em ordem e a matriz é remontada só com as linhas/colunas deles.
+        Retorna o mapeamento índice antigo -> novo (-1 para os removidos).
+        """
+        mapa = [-1] * len(self.vertices)
+        manter = []
+        for i, _ in self.vertices_vivos():
+            mapa[i] = len(manter)
+            manter.append(i)
+        
+        self.adjacency_matrix.compactar(manter)
+        self.vertices.compactar(manter)
+        self._livres = []
+        self._reconstruir_indice_nomes()
+        return mapa
+
     def get_vertex(self, vertex_index: int) -> Optional[Dict[str, Any]]:
         """
         Retorna os dados do vértice (0-based interno) ou None se não existir.
         """
         if 0 <= vertex_index < len(self.vertices):
-            return self.vertices[vertex_index]
+            return self.vertices[vertex_index]  # None também para um slot removido
         return None
 
     # -------------------------------------------------------------------
@@ -74,28 +309,28 @@ class Graph:
         Adiciona uma aresta entre v1 e v2 (0-based interno).
         Se is_directed=True, só v1->v2. Se is_directed=False, também v2->v1.
         """
-        if not (0 <= v1 < len(self.vertices)) or not (0 <= v2 < len(self.vertices)):
+        if not self._vivo(v1) or not self._vivo(v2):
             print(f"Índices de vértices inválidos: {v1+1}, {v2+1}.")
             return
         
         val = weight if self.is_weighted else 1.0
-        self.adjacency_matrix[v1][v2] = val
+        self.adjacency_matrix[v1, v2] = val
         
         if not self.is_directed:
-            self.adjacency_matrix[v2][v1] = val
+            self.adjacency_matrix[v2, v1] = val
 
     def remove_edge(self, v1: int, v2: int) -> None:
         """
         Remove a aresta entre v1 e v2 (0-based interno).
         Se não for direcionado, remove ambos os lados.
         """
-        if not (0 <= v1 < len(self.vertices)) or not (0 <= v2 < len(self.vertices)):
+        if not self._vivo(v1) or not self._vivo(v2):
             print(f"Índices de vértices inválidos: {v1+1}, {v2+1}.")
             return
         
-        self.adjacency_matrix[v1][v2] = 0.0
+        self.adjacency_matrix[v1, v2] = 0.0
         if not self.is_directed:
-            self.adjacency_matrix[v2][v1] = 0.0
+            self.adjacency_matrix[v2, v1] = 0.0
 
     def update_edge(self, v1: int, v2: int, new_weight: float) -> None:
         """
@@ -105,22 +340,22 @@ class Graph:
         if not self.is_weighted:
             print("Grafo não é valorado. Não há peso para atualizar.")
             return
-        if not (0 <= v1 < len(self.vertices)) or not (0 <= v2 < len(self.vertices)):
+        if not self._vivo(v1) or not self._vivo(v2):
             print(f"Índices de vértices inválidos: {v1+1}, {v2+1}.")
             return
         
-        self.adjacency_matrix[v1][v2] = new_weight
+        self.adjacency_matrix[v1, v2] = new_weight
         if not self.is_directed:
-            self.adjacency_matrix[v2][v1] = new_weight
+            self.adjacency_matrix[v2, v1] = new_weight
 
     def get_edge(self, v1: int, v2: int) -> float:
         """
         Retorna o valor da aresta (ou 0 se não existir).
         (0-based interno)
         """
-        if not (0 <= v1 < len(self.vertices)) or not (0 <= v2 < len(self.vertices)):
+        if not self._vivo(v1) or not self._vivo(v2):
             return 0.0
-        return self.adjacency_matrix[v1][v2]
+        return self.adjacency_matrix[v1, v2]
 
     # -------------------------------------------------------------------
     # Métodos de Consulta / Visualização
@@ -139,13 +374,13 @@ class Graph:
         print(f"Grafo é {'valorado' if self.is_weighted else 'não-valorado'}.")
         
         # Verificar laços
-        has_loop = any(self.adjacency_matrix[i][i] != 0 for i in range(len(self.vertices)))
+        has_loop = any(self.adjacency_matrix[i, i] != 0 for i in range(len(self.vertices)))
         print(f"Possui laço: {'Sim' if has_loop else 'Não'}\n")
 
-        for i in range(len(self.vertices)):
-            vname = self.vertices[i].get("nome", f"VérticeDesconhecido{i+1}")
+        for i, v in self.vertices_vivos():
+            vname = v.get("nome", f"VérticeDesconhecido{i+1}")
             out_degree = sum(1 for val in self.adjacency_matrix[i] if val != 0)
-            in_degree = sum(1 for row in self.adjacency_matrix if row[i] != 0)
+            in_degree = sum(1 for val in self.adjacency_matrix.coluna(i) if val != 0)
             print(f"[{i+1}] {vname}: grau entrada={in_degree}, grau saída={out_degree}")
 
         print("="*60)
@@ -156,43 +391,37 @@ class Graph:
         """
         if not self.vertices:
             return None
-        
-        brightest_idx = None
-        smallest_magnitude = 99999.0
-        
-        for i, v in enumerate(self.vertices):
-            mag = v.get("magnitude", 99999.0)
-            try:
-                mag_float = float(mag)
-            except:
-                mag_float = 99999.0
-            
-            if mag_float < smallest_magnitude:
-                smallest_magnitude = mag_float
-                brightest_idx = i
-        
-        return brightest_idx
+        mais_brilhante = self.vertices.indice_magnitudes().brightest()
+        return mais_brilhante[0] if mais_brilhante else None
+
+    def brightest_stars(self, k: int) -> List[int]:
+        """
+        Índices (0-based) dos k astros mais brilhantes, do menor para o maior valor de magnitude.
+        """
+        return self.vertices.indice_magnitudes().top(k)
+
+    def stars_in_magnitude_range(self, baixa: float, alta: float) -> List[int]:
+        """
+        Índices (0-based) dos astros com baixa <= magnitude <= alta, do mais brilhante ao mais fraco.
+        """
+        return self.vertices.indice_magnitudes().between(baixa, alta)
 
     def count_stars_by_constellation(self) -> Dict[str, int]:
         """
         Conta quantos vértices há em cada constelação (chave 'constelacao').
         """
-        const_count = {}
-        for v in self.vertices:
-            c = v.get("constelacao", "Desconhecida")
-            const_count[c] = const_count.get(c, 0) + 1
-        return const_count
+        return self.vertices.contar_constelacoes("Desconhecida")
 
     def listar_todas_estrelas(self) -> None:
         """
         Lista todos os vértices, mostrando índice (1-based), nome, magnitude, constelação, etc.
         """
-        if not self.vertices:
+        if len(self.vertices) == len(self._livres):
             print("Não há nenhum vértice no grafo.")
             return
         
         print("\n=== Lista de Vértices (Índice inicia em 1) ===")
-        for i, v in enumerate(self.vertices):
+        for i, v in self.vertices_vivos():
             nome = v.get("nome", f"Vértice{i+1}")
             mag = v.get("magnitude", "N/A")
             const = v.get("constelacao", "N/A")
@@ -204,8 +433,8 @@ class Graph:
         Exibe a matriz de adjacência de forma abreviada (nome[:5]).
         Mostra 0 ou 1 (sem decimais) para facilitar leitura.
         """
-        n = len(self.vertices)
-        if n == 0:
+        vivos = [i for i, _ in self.vertices_vivos()]  # Slots removidos não aparecem
+        if not vivos:
             print("Grafo vazio. Sem vértices para exibir.")
             return
         
@@ -213,17 +442,17 @@ class Graph:
         
         # Cabeçalho
         print("     ", end="")
-        for col in range(n):
+        for col in vivos:
             nome_c = self.vertices[col].get("nome", f"V{col+1}")[:5]
             print(f"{nome_c:>6}", end="")
         print()
 
         # Linhas
-        for lin in range(n):
+        for lin in vivos:
             nome_l = self.vertices[lin].get("nome", f"V{lin+1}")[:5]
             print(f"{nome_l:>5}", end="")
-            for col in range(n):
-                val = self.adjacency_matrix[lin][col]
+            for col in vivos:
+                val = self.adjacency_matrix[lin, col]
                 if val != 0.0:
                     print(f"{1:>6}", end="")  # se houver aresta, imprime 1
                 else:
@@ -237,24 +466,8 @@ class Graph:
         """
         if not self.vertices:
             return None
-        
-        largest_idx = None
-        largest_mag = -99999.0
-        
-        for i, v in enumerate(self.vertices):
-            mag = v.get("magnitude", None)
-            if mag is None:
-                continue
-            try:
-                mag_float = float(mag)
-            except:
-                continue
-            
-            if mag_float > largest_mag:
-                largest_mag = mag_float
-                largest_idx = i
-        
-        return largest_idx
+        mais_fraco = self.vertices.indice_magnitudes().faintest()
+        return mais_fraco[0] if mais_fraco else None
 
     def listar_estrelas_mais_conectadas(self) -> None:
         """
@@ -266,9 +479,9 @@ class Graph:
             return
         
         ranking = []
-        for i in range(n):
+        for i, _ in self.vertices_vivos():
             out_degree = sum(1 for val in self.adjacency_matrix[i] if val != 0)
-            in_degree = sum(1 for row in self.adjacency_matrix if row[i] != 0)
+            in_degree = sum(1 for val in self.adjacency_matrix.coluna(i) if val != 0)
             total = out_degree + in_degree
             ranking.append((i, total))
         
@@ -288,8 +501,11 @@ class Graph:
         Limpa o grafo atual e carrega 23 vértices e as arestas
         (incluindo Netuno e Plutão), com as conexões solicitadas.
         """
-        self.vertices = []
-        self.adjacency_matrix = []
+        self.vertices = TabelaVertices()
+        self._livres = []
+        self.adjacency_matrix = MatrizAdjacencia()
+        self._indice_nomes = {}
+        self._nomes_repetidos = {}
 
         dados_vertices = [
           {"nome":"Constelação de Órion","magnitude":None,"constelacao":"Área do céu"},
@@ -352,15 +568,9 @@ class Graph:
           ("Netuno","Plutão")
         ]
 
-        def indice_por_nome(nome_busca: str) -> int:
-            for i, vt in enumerate(self.vertices):
-                if vt.get("nome","") == nome_busca:
-                    return i
-            return -1
-        
         for (origem, destino) in edges:
-            i1 = indice_por_nome(origem)
-            i2 = indice_por_nome(destino)
+            i1 = self.index_of(origem)
+            i2 = self.index_of(destino)
             if i1 != -1 and i2 != -1:
                 self.add_edge(i1, i2)
 
@@ -392,6 +602,8 @@ def menu_interativo():
         print("14 - Listar estrelas mais conectadas")
         print("15 - Exibir matriz de adjacência")
         print("16 - Carregar Rede Estelar Predefinida")
+        print("17 - Compactar índices (recupera vértices removidos)")
+        print("18 - Astros por faixa de magnitude")
         print("0 - Sair")
 
         opc = input("Escolha uma opção: ")
@@ -551,6 +763,23 @@ def menu_interativo():
         elif opc == '16':
             grafo.carregar_rede_estelar_predefinida()
 
+        elif opc == '17':
+            removidos = len(grafo._livres)
+            grafo.compact()
+            print(f"Índices compactados: {removidos} slot(s) removido(s) recuperado(s).")
+
+        elif opc == '18':
+            try:
+                baixa = float(input("Magnitude mínima: "))
+                alta = float(input("Magnitude máxima: "))
+            except:
+                print("Magnitudes inválidas.")
+                continue
+            encontrados = grafo.stars_in_magnitude_range(baixa, alta)
+            print(f"{len(encontrados)} astro(s) com magnitude entre {baixa} e {alta}:")
+            for i in encontrados:
+                print(f"  [{i+1}] {grafo.get_vertex(i)}")
+
         elif opc == '12':
             idx_maior = grafo.find_largest_star()
             if idx_maior is None:
@@ -0,0 +1,93 @@
+"""Fixtures compartilhadas: grafos aleatórios pequenos e a referência do DFS."""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from N2 import Graph, STORAGE_BACKENDS  # noqa: E402
+
+# Backends mutáveis e o snapshot CSR produzido por freeze()
+BACKENDS = sorted(STORAGE_BACKENDS) + ['csr']
+# Três sementes e um grafo com vértices removidos (lápides)
+VARIANTS = (0, 1, 2, 'remocoes')
+
+
+def random_graph(storage: str, is_directed: bool, seed: int, n: int = 7, m: int = 16) -> Graph:
+    """Grafo pequeno com pesos inteiros (muitos empates) e algumas posições para o A*"""
+    rng = random.Random(seed)
+    graph = Graph(is_directed=is_directed, is_weighted=True,
+                  storage='sparse' if storage == 'csr' else storage)
+    for i in range(n):
+        data = {'nome': f"V{i}"}
+        if rng.random() < 0.5:
+            data['distancia_ua'] = float(rng.randint(0, 6))
+        graph.add_vertex(data)
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph.add_edge(u, v, float(rng.randint(1, 4)))
+    return graph
+
+
+def _dfs_reference(graph: Graph, start: int, target: int):
+    """(custo mínimo, caminhos de custo mínimo, caminhos de menos arestas) pela enumeração do DFS"""
+    result = graph.dfs_all_paths(start, target)
+    if not result.paths:
+        return None, set(), set()
+    best = min(result.costs)
+    fewest = min(len(p) for p in result.paths)
+    optimal = {tuple(p) for p, c in zip(result.paths, result.costs) if c == best}
+    shortest = {tuple(p) for p in result.paths if len(p) == fewest}
+    return best, optimal, shortest
+
+
+def _live_pairs(graph: Graph):
+    live = [v for v, _ in graph.live_vertices()]
+    return [(start, target) for start in live for target in live if start != target]
+
+
+@pytest.fixture(params=[(storage, is_directed, variant) for storage in BACKENDS
+                        for is_directed in (False, True) for variant in VARIANTS],
+                ids=lambda p: '-'.join(map(str, p)))
+def search_graph(request) -> Graph:
+    """Grafo aleatório em cada backend (inclusive CSR congelado), direcionado ou não"""
+    storage, is_directed, variant = request.param
+    if variant == 'remocoes':
+        graph = random_graph(storage, is_directed, seed=11, n=8, m=20)
+        graph.remove_vertex(2)
+        graph.remove_vertex(5)
+    else:
+        graph = random_graph(storage, is_directed, seed=variant)
+    if storage == 'csr':
+        graph.freeze()
+    return graph
+
+
+@pytest.fixture
+def make_graph():
+    return random_graph
+
+
+@pytest.fixture
+def dfs_reference():
+    return _dfs_reference
+
+
+@pytest.fixture
+def assert_optimal_paths():
+    """Confere que graph.<search>(s, t) devolve exatamente os caminhos mínimos do DFS, para todo par"""
+    def check(graph: Graph, search: str) -> None:
+        for start, target in _live_pairs(graph):
+            best, optimal, _ = _dfs_reference(graph, start, target)
+            result = getattr(graph, search)(start, target)
+            assert {tuple(p) for p in result.paths} == optimal, (search, start, target)
+            assert all(c == pytest.approx(best) for c in result.costs), (search, start, target)
+    return check
+
+
+@pytest.fixture
+def live_pairs():
+    return _live_pairs
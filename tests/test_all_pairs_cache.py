@@ -0,0 +1,42 @@
+"""Tabela all-pairs em cache: reaproveitada entre consultas e invalidada a cada alteração."""
+import pytest
+
+import N2
+from N2 import Graph, STORAGE_BACKENDS
+
+
+def _triangle(storage: str) -> Graph:
+    graph = Graph(is_directed=True, is_weighted=True, storage=storage)
+    for name in 'ABC':
+        graph.add_vertex({'nome': name})
+    graph.add_edge(0, 1, 1.0)
+    graph.add_edge(1, 2, 1.0)
+    graph.add_edge(0, 2, 5.0)
+    return graph
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_table_is_reused_until_the_graph_changes(storage, monkeypatch):
+    graph = _triangle(storage)
+    dist, _ = graph.all_pairs_shortest_paths()
+    assert dist[0][2] == 2.0
+
+    monkeypatch.setattr(graph, 'floyd_warshall_matrices', lambda *a, **k: pytest.fail("recalculou"))
+    monkeypatch.setattr(graph, 'johnson_matrices', lambda *a, **k: pytest.fail("recalculou"))
+    assert graph.all_pairs_shortest_paths()[0] is dist
+    assert graph.floyd_warshall_all_paths(0, 2).paths == [[0, 1, 2]]
+    monkeypatch.undo()
+
+    graph.update_edge(0, 2, 1.5)
+    assert graph.all_pairs_shortest_paths()[0][0][2] == 1.5
+    graph.remove_vertex(1)
+    assert graph.floyd_warshall_all_paths(0, 2).paths == [[0, 2]]
+
+
+@pytest.mark.parametrize('storage', ['dense', 'sparse'])
+def test_johnson_and_floyd_tables_agree(storage, monkeypatch):
+    graph = _triangle(storage)
+    monkeypatch.setattr(N2, 'np', None)  # Sem NumPy, grafos esparsos usam Johnson
+    assert graph._prefers_johnson()
+    dist, _ = graph.all_pairs_shortest_paths()
+    assert [list(row) for row in dist] == graph.floyd_warshall_matrices(use_numpy=False)[0]
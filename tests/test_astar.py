@@ -0,0 +1,66 @@
+"""A* guiado por posições: resultados iguais aos do Dijkstra mesmo com arestas não geométricas."""
+import itertools
+
+import pytest
+
+from N2 import Graph
+
+
+def _star_network() -> Graph:
+    graph = Graph(is_directed=False, is_weighted=True)
+    graph.carregar_rede_estelar_predefinida()
+    return graph
+
+
+def _assert_matches_dijkstra(graph: Graph) -> None:
+    live = [v for v, _ in graph.live_vertices()]
+    for start in live:
+        dist = graph._dijkstra_row(start)[0]
+        for target in live:
+            assert graph.astar_shortest_paths(start, target).cost == pytest.approx(dist[target])
+
+
+def test_astar_matches_dijkstra_on_predefined_network():
+    _assert_matches_dijkstra(_star_network())
+
+
+def test_astar_stays_optimal_after_shortcut_edge():
+    graph = _star_network()
+    terra, plutao = graph.index_of('Terra'), graph.index_of('Plutão')
+    graph.add_edge(terra, plutao, 1.0)  # Bem mais curta que a distância em linha reta
+
+    sol = graph.index_of('Sol')
+    assert graph.astar_shortest_paths(sol, plutao).cost == pytest.approx(
+        graph.dijkstra_shortest_paths(sol, plutao).cost)
+    _assert_matches_dijkstra(graph)
+
+
+def test_astar_falls_back_when_edge_leaves_positioned_vertex():
+    graph = Graph(is_directed=True, is_weighted=True)
+    for name, radius in (('A', 0.0), ('B', None), ('C', 10.0)):
+        data = {'nome': name}
+        if radius is not None:
+            data['distancia_ua'] = radius
+        graph.add_vertex(data)
+    graph.add_edge(0, 1, 1.0)
+    graph.add_edge(1, 2, 1.0)
+    graph.add_edge(0, 2, 50.0)
+
+    assert graph.position_heuristic(2)(0) == 0.0
+    assert graph.astar_shortest_paths(0, 2).cost == pytest.approx(2.0)
+
+
+def test_astar_heuristic_follows_position_updates():
+    graph = Graph(is_directed=False, is_weighted=True)
+    for name, radius in zip('ABC', (0.0, 1.0, 2.0)):
+        graph.add_vertex({'nome': name, 'distancia_ua': radius})
+    for u, v in itertools.combinations(range(3), 2):
+        graph.add_edge(u, v, 1.0)
+    _assert_matches_dijkstra(graph)
+
+    graph.update_vertex(2, {'distancia_ua': 40.0})
+    _assert_matches_dijkstra(graph)
+
+
+def test_astar_matches_dfs(search_graph, assert_optimal_paths):
+    assert_optimal_paths(search_graph, 'astar_all_paths')
@@ -0,0 +1,38 @@
+"""BFS nível a nível: todos os caminhos com o menor número de arestas, pelo DAG de pais."""
+from N2 import Graph
+
+
+def test_bfs_matches_fewest_edges(search_graph, dfs_reference, live_pairs):
+    for start, target in live_pairs(search_graph):
+        shortest = dfs_reference(search_graph, start, target)[2]
+        assert {tuple(p) for p in search_graph.bfs_all_paths(start, target).paths} == shortest
+
+
+def test_bfs_dag_counts_hops_and_parents(search_graph, dfs_reference, live_pairs):
+    for start, target in live_pairs(search_graph):
+        shortest = dfs_reference(search_graph, start, target)[2]
+        dag = search_graph.bfs_shortest_paths(start, target)
+        if not shortest:
+            assert not dag and dag.count() == 0
+            continue
+        assert dag.cost == len(next(iter(shortest))) - 1  # Custo do DAG = número de saltos
+        assert dag.count() == len(shortest)
+
+
+def test_long_chain_with_many_parents():
+    # Camadas de 3 vértices totalmente ligadas: 3^(k-1) caminhos de mesmo tamanho
+    layers, width = 12, 3
+    graph = Graph(is_directed=True, is_weighted=True, storage='sparse')
+    graph.add_vertex({'nome': 'origem'})
+    for i in range(layers * width):
+        graph.add_vertex({'nome': f"V{i}"})
+    for v in range(1, width + 1):
+        graph.add_edge(0, v, 1.0)
+    for layer in range(layers - 1):
+        for a in range(width):
+            for b in range(width):
+                graph.add_edge(1 + layer * width + a, 1 + (layer + 1) * width + b, 5.0)
+
+    dag = graph.bfs_shortest_paths(0, layers * width)
+    assert dag.cost == layers
+    assert dag.count() == width ** (layers - 1)
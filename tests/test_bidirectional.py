@@ -0,0 +1,32 @@
+"""Dijkstra bidirecional: mesmo custo e mesmos caminhos ótimos da busca unidirecional."""
+import random
+
+import pytest
+
+from N2 import Graph
+
+
+def test_bidirectional_matches_dfs(search_graph, assert_optimal_paths):
+    assert_optimal_paths(search_graph, 'bidirectional_dijkstra_all_paths')
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_bidirectional_dag_matches_dijkstra_on_larger_graph(is_directed):
+    rng = random.Random(4)
+    n = 300
+    graph = Graph(is_directed=is_directed, is_weighted=True, storage='sparse')
+    for i in range(n):
+        graph.add_vertex({'nome': f"V{i}"})
+    for _ in range(4 * n):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph.add_edge(u, v, float(rng.randint(1, 5)))
+
+    for _ in range(40):
+        start, target = rng.randrange(n), rng.randrange(n)
+        expected = graph.dijkstra_shortest_paths(start, target)
+        result = graph.bidirectional_dijkstra_shortest_paths(start, target)
+        assert result.cost == pytest.approx(expected.cost)
+        assert result.count() == expected.count()
+        if expected.count() <= 200:
+            assert sorted(result.paths()) == sorted(expected.paths())
@@ -0,0 +1,85 @@
+"""Matrizes densas com capacidade que dobra: crescimento amortizado sem perder nem sujar células."""
+import random
+
+import pytest
+
+from N2 import DenseStorage, NumpyDenseStorage
+from n1_grafos import MatrizAdjacencia
+
+
+def _capacity(storage) -> int:
+    return storage.capacity if isinstance(storage, DenseStorage) else storage._buffer.shape[0]
+
+
+def _fill(storage, n: int, rng: random.Random) -> dict:
+    """Cresce até n vértices gravando arcos pelo caminho; devolve o modelo {(i, j): peso}"""
+    model = {}
+    capacities = []
+    for size in range(1, n + 1):
+        storage.add_vertex()
+        capacities.append(_capacity(storage))
+        for _ in range(3):
+            i, j = rng.randrange(size), rng.randrange(size)
+            model[(i, j)] = float(rng.randint(1, 9))
+            storage.set(i, j, model[(i, j)])
+    assert capacities == [max(4, 1 << (k - 1).bit_length()) for k in range(1, n + 1)]
+    return model
+
+
+@pytest.mark.parametrize('backend', [DenseStorage, NumpyDenseStorage])
+def test_capacity_doubles_and_keeps_cells(backend):
+    if backend is NumpyDenseStorage:
+        pytest.importorskip('numpy')
+    storage = backend()
+    model = _fill(storage, 37, random.Random(1))
+    n = len(storage)
+    assert n == 37
+    for i in range(n):
+        for j in range(n):
+            assert storage.get(i, j) == model.get((i, j), 0.0)
+    assert sorted(storage.neighbors(3)) == sorted((j, w) for (i, j), w in model.items() if i == 3)
+    assert sorted(storage.in_neighbors(5)) == sorted((i, w) for (i, j), w in model.items() if j == 5)
+
+
+def test_dense_buffer_outside_logical_size_stays_zero():
+    storage = DenseStorage()
+    for _ in range(5):
+        storage.add_vertex()  # Capacidade 8
+    for i in range(5):
+        storage.set(i, 4, 1.0)
+        storage.set(4, i, 1.0)
+    storage.clear_vertex(4)
+    storage.add_vertex()  # A nova linha/coluna 5 nasce zerada
+    assert storage.capacity == 8
+    assert list(storage.neighbors(5)) == [] and list(storage.in_neighbors(5)) == []
+    assert all(storage.get(i, 4) == 0.0 for i in range(6))
+
+
+def test_matriz_adjacencia_doubles_and_keeps_cells():
+    matriz = MatrizAdjacencia()
+    rng = random.Random(2)
+    model = {}
+    for tamanho in range(1, 30):
+        matriz.adicionar_vertice()
+        assert matriz.capacidade == max(4, 1 << (tamanho - 1).bit_length())
+        i, j = rng.randrange(tamanho), rng.randrange(tamanho)
+        model[(i, j)] = matriz[i, j] = float(rng.randint(1, 9))
+    assert [matriz[i] for i in range(29)] == [[model.get((i, j), 0.0) for j in range(29)] for i in range(29)]
+    assert list(matriz.coluna(7)) == [model.get((i, 7), 0.0) for i in range(29)]
+
+
+def test_matriz_rows_are_copies_that_survive_growth():
+    matriz = MatrizAdjacencia()
+    for _ in range(4):
+        matriz.adicionar_vertice()
+    matriz[0, 3] = 2.5
+    linha = matriz[0]
+    matriz.adicionar_vertice()  # Dobra a capacidade (4 -> 8)
+
+    assert matriz.capacidade == 8
+    assert linha == [0.0, 0.0, 0.0, 2.5]
+    assert matriz[0] == [0.0, 0.0, 0.0, 2.5, 0.0]
+    assert matriz[0, 3] == 2.5
+    assert repr(matriz) == repr([[0.0, 0.0, 0.0, 2.5, 0.0]] + [[0.0] * 5] * 4)
+    with pytest.raises(IndexError):
+        matriz[0, 5] = 1.0
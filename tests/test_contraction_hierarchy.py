@@ -0,0 +1,58 @@
+"""Contraction hierarchies: consultas exatas, atalhos desempacotados e pré-processamento em cache."""
+import random
+
+import pytest
+
+from N2 import Graph
+
+
+def test_query_returns_an_optimal_path(search_graph, dfs_reference, live_pairs):
+    for start, target in live_pairs(search_graph):
+        best, optimal, _ = dfs_reference(search_graph, start, target)
+        path, cost = search_graph.contraction_hierarchy_shortest_path(start, target)
+        if best is None:
+            assert path == []
+        else:
+            assert tuple(path[0]) in optimal and cost[0] == pytest.approx(best)
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_unpacked_paths_use_real_edges(is_directed):
+    rng = random.Random(6)
+    n = 150
+    graph = Graph(is_directed=is_directed, is_weighted=True, storage='sparse')
+    for i in range(n):
+        graph.add_vertex({'nome': f"V{i}"})
+    for _ in range(3 * n):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph.add_edge(u, v, float(rng.randint(1, 9)))
+    hierarchy = graph.build_contraction_hierarchy()
+
+    for start in range(0, n, 10):
+        dist = graph._dijkstra_row(start)[0]
+        for target in range(n):
+            path, cost = hierarchy.query(start, target)
+            assert cost == pytest.approx(dist[target])
+            if path:
+                assert path[0] == start and path[-1] == target
+                assert sum(graph.get_edge_info(a, b) for a, b in zip(path, path[1:])) == pytest.approx(cost)
+
+
+def test_hierarchy_is_rebuilt_after_edits():
+    graph = Graph(is_directed=False, is_weighted=True)
+    for name in 'ABCD':
+        graph.add_vertex({'nome': name})
+    graph.add_edge(0, 1, 1.0)
+    graph.add_edge(1, 2, 1.0)
+    graph.add_edge(2, 3, 1.0)
+
+    assert graph.contraction_hierarchy_shortest_path(0, 3).costs == [3.0]
+    hierarchy = graph.contraction_hierarchy()
+    assert hierarchy is not None
+    graph.contraction_hierarchy_shortest_path(3, 0)
+    assert graph.contraction_hierarchy() is hierarchy
+
+    graph.add_edge(0, 3, 2.0)
+    assert graph.contraction_hierarchy() is None
+    assert graph.contraction_hierarchy_shortest_path(0, 3).paths == [[0, 3]]
@@ -0,0 +1,64 @@
+"""DFS em streaming: caminhos gerados sob demanda, com limites e podas."""
+import itertools
+import sys
+
+import pytest
+
+from N2 import Graph
+
+
+def _complete(n: int) -> Graph:
+    graph = Graph(is_directed=True, is_weighted=True, storage='sparse')
+    for i in range(n):
+        graph.add_vertex({'nome': f"V{i}"})
+    for u, v in itertools.permutations(range(n), 2):
+        graph.add_edge(u, v, 1.0 + (u + v) % 3)
+    return graph
+
+
+def test_generator_is_lazy():
+    graph = _complete(14)  # Bilhões de caminhos simples entre dois vértices
+    paths = graph.iter_dfs_paths(0, 13)
+    first = [next(paths) for _ in range(3)]
+    assert all(p[0] == 0 and p[-1] == 13 for p, _ in first)
+    assert len(list(graph.iter_dfs_paths(0, 13, limit=50))) == 50
+
+
+def test_filters_match_full_enumeration(search_graph, live_pairs):
+    for start, target in live_pairs(search_graph):
+        every = [(tuple(p), c) for p, c in search_graph.iter_dfs_paths(start, target)]
+        result = search_graph.dfs_all_paths(start, target)
+        assert sorted(every) == sorted(zip(map(tuple, result.paths), result.costs))
+
+        assert sorted(tuple(p) for p, _ in search_graph.iter_dfs_paths(start, target, max_depth=2)) == \
+            sorted(p for p, _ in every if len(p) <= 3)
+        assert sorted(tuple(p) for p, _ in search_graph.iter_dfs_paths(start, target, max_cost=4.0)) == \
+            sorted(p for p, c in every if c <= 4.0)
+
+        streamed = list(search_graph.iter_dfs_paths(start, target, optimal_only=True))
+        if every:
+            best = min(c for _, c in every)
+            assert streamed[-1][1] == pytest.approx(best)
+            assert all(a[1] >= b[1] for a, b in zip(streamed, streamed[1:]))
+        else:
+            assert streamed == []
+
+
+def test_yielded_paths_are_independent_copies():
+    graph = _complete(5)
+    paths = [p for p, _ in graph.iter_dfs_paths(0, 4, limit=10)]
+    assert len({tuple(p) for p in paths}) == 10
+
+
+def test_deep_chain_needs_no_recursion():
+    n = 3 * sys.getrecursionlimit()
+    graph = Graph(is_directed=False, is_weighted=True, storage='sparse')
+    for i in range(n):
+        graph.add_vertex({'nome': f"V{i}"})
+    for i in range(n - 1):
+        graph.add_edge(i, i + 1, 1.0)
+
+    result = graph.dfs_all_paths(0, n - 1)
+    assert result.paths == [list(range(n))]
+    assert result.costs == [float(n - 1)]
+    assert graph.dfs_all_paths(n - 1, 0).paths == [list(range(n - 1, -1, -1))]
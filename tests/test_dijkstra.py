@@ -0,0 +1,60 @@
+"""Dijkstra com DAG de predecessores: contagem, enumeração e sorteio dos caminhos ótimos."""
+import random
+
+import pytest
+
+from N2 import Graph
+
+
+def _grid(width: int, height: int) -> Graph:
+    """Grade com pesos unitários: C(w+h-2, w-1) caminhos ótimos de um canto ao outro"""
+    graph = Graph(is_directed=True, is_weighted=True, storage='sparse')
+    for y in range(height):
+        for x in range(width):
+            graph.add_vertex({'nome': f"{x},{y}"})
+    for y in range(height):
+        for x in range(width):
+            v = y * width + x
+            if x + 1 < width:
+                graph.add_edge(v, v + 1, 1.0)
+            if y + 1 < height:
+                graph.add_edge(v, v + width, 1.0)
+    return graph
+
+
+def test_dijkstra_matches_dfs(search_graph, assert_optimal_paths):
+    assert_optimal_paths(search_graph, 'dijkstra_all_paths')
+
+
+def test_dag_counts_paths_without_enumerating():
+    graph = _grid(12, 12)
+    dag = graph.dijkstra_shortest_paths(0, 143)
+    assert dag.cost == 22.0
+    assert dag.count() == 705432  # C(22, 11)
+    assert len(dag.paths(limit=5)) == 5
+
+
+def test_dag_enumerates_and_samples_optimal_paths(search_graph, dfs_reference, live_pairs):
+    rng = random.Random(0)
+    for start, target in live_pairs(search_graph):
+        best, optimal, _ = dfs_reference(search_graph, start, target)
+        dag = search_graph.dijkstra_shortest_paths(start, target)
+        if best is None:
+            assert not dag and dag.count() == 0 and dag.sample() == [] and list(dag) == []
+            continue
+        assert dag.cost == pytest.approx(best)
+        assert dag.count() == len(optimal)
+        assert {tuple(p) for p in dag} == optimal
+        assert tuple(dag.sample(rng)) in optimal
+
+
+def test_sample_is_uniform():
+    graph = _grid(3, 3)  # 6 caminhos ótimos de 0 até 8
+    dag = graph.dijkstra_shortest_paths(0, 8)
+    rng = random.Random(1)
+    seen = {}
+    for _ in range(6000):
+        path = tuple(dag.sample(rng))
+        seen[path] = seen.get(path, 0) + 1
+    assert len(seen) == 6
+    assert all(800 < count < 1200 for count in seen.values())
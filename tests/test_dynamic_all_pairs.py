@@ -0,0 +1,76 @@
+"""All-pairs dinâmico: a tabela em cache é corrigida no lugar a cada inserção ou redução de peso."""
+import random
+
+import pytest
+
+import N2
+from N2 import Graph, STORAGE_BACKENDS
+
+
+def _follow(next_hop, i: int, j: int):
+    path = [i]
+    while path[-1] != j:
+        path.append(int(next_hop[path[-1]][j]))
+        assert len(path) <= len(next_hop)
+    return path
+
+
+def _assert_table_is_exact(graph: Graph) -> None:
+    """A tabela corrigida é a mesma de um recálculo, e next_hop percorre caminhos desse custo"""
+    version, dist, next_hop = graph._apsp_cache
+    assert version == graph._version  # Corrigida no lugar, não descartada
+    fresh = graph.floyd_warshall_matrices(use_numpy=False)[0]
+    assert [list(row) for row in dist] == fresh
+    for i, row in enumerate(fresh):
+        for j, d in enumerate(row):
+            if d != float('inf') and i != j:
+                path = _follow(next_hop, i, j)
+                assert sum(graph.get_edge_info(a, b) for a, b in zip(path, path[1:])) == pytest.approx(d)
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_cached_all_pairs_follow_edge_edits(storage, make_graph, dfs_reference):
+    graph = make_graph(storage, False, seed=7)
+    graph.dynamic_all_pairs = True
+    rng = random.Random(8)
+    for _ in range(10):
+        u, v = rng.sample(range(7), 2)
+        if rng.random() < 0.3:
+            graph.remove_edge(u, v)
+        else:
+            graph.add_edge(u, v, float(rng.randint(1, 4)))
+        start, target = rng.sample(range(7), 2)
+        best, optimal, _ = dfs_reference(graph, start, target)
+        result = graph.floyd_warshall_all_paths(start, target)
+        assert {tuple(p) for p in result.paths} == optimal
+
+
+@pytest.mark.parametrize('storage', ['dense', 'sparse'])
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_pure_list_relaxation_without_numpy(storage, is_directed, make_graph, monkeypatch):
+    monkeypatch.setattr(N2, 'np', None)
+    graph = make_graph(storage, is_directed, seed=3)
+    graph.dynamic_all_pairs = True
+    dist, _ = graph.all_pairs_shortest_paths()
+    assert isinstance(dist, list)
+
+    rng = random.Random(5)
+    for _ in range(12):
+        u, v = rng.sample(range(7), 2)
+        old = graph.get_edge_info(u, v)
+        graph.add_edge(u, v, float(rng.randint(1, 3)) if old is None else max(0.5, old - 1.0))
+        _assert_table_is_exact(graph)
+
+
+def test_relax_all_pairs_through_on_lists(monkeypatch):
+    monkeypatch.setattr(N2, 'np', None)
+    inf = float('inf')
+    # 0 -> 1 (1) e 2 -> 3 (1); o arco novo 1 -> 2 (2) liga as duas metades
+    dist = [[0.0, 1.0, inf, inf], [inf, 0.0, inf, inf], [inf, inf, 0.0, 1.0], [inf, inf, inf, 0.0]]
+    next_hop = [[0, 1, -1, -1], [-1, 1, -1, -1], [-1, -1, 2, 3], [-1, -1, -1, 3]]
+    Graph._relax_all_pairs_through(dist, next_hop, 1, 2, 2.0)
+    assert dist[0] == [0.0, 1.0, 3.0, 4.0]
+    assert dist[1] == [inf, 0.0, 2.0, 3.0]
+    assert next_hop[0] == [0, 1, 1, 1]
+    assert next_hop[1] == [-1, 1, 2, 2]
+    assert dist[2] == [inf, inf, 0.0, 1.0]
@@ -0,0 +1,33 @@
+"""Floyd-Warshall: versão vetorizada (NumPy) e versão em listas dão as mesmas tabelas."""
+import math
+
+import pytest
+
+
+def test_floyd_warshall_matches_dfs(search_graph, assert_optimal_paths):
+    assert_optimal_paths(search_graph, 'floyd_warshall_all_paths')
+
+
+def test_numpy_and_list_tables_agree(search_graph):
+    pytest.importorskip('numpy')
+    dist, next_hop = search_graph.floyd_warshall_matrices(use_numpy=True)
+    list_dist, list_next = search_graph.floyd_warshall_matrices(use_numpy=False)
+    assert dist.tolist() == list_dist
+    for i, row in enumerate(list_dist):
+        for j, d in enumerate(row):
+            if math.isinf(d):
+                assert next_hop[i][j] == -1
+            else:
+                # Empates podem escolher outro primeiro passo, mas sempre por um arco do caminho ótimo
+                hop = int(next_hop[i][j])
+                assert hop == list_next[i][j] or d == pytest.approx(
+                    (search_graph.get_edge_info(i, hop) or 0.0) + list_dist[hop][j])
+
+
+def test_weight_array_reads_storage_directly(search_graph):
+    pytest.importorskip('numpy')
+    n = len(search_graph.vertices)
+    weights = search_graph._weight_array(n)
+    assert weights.tolist() == [list(row) for row in search_graph.adjacency_matrix]
+    weights[0, 0] = 99.0  # Cópia: não altera o grafo
+    assert search_graph.adjacency_matrix[0][0] == 0.0
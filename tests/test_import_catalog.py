@@ -0,0 +1,79 @@
+"""Importação de catálogos CSV / JSON Lines: vértices, arestas e registros rejeitados."""
+import json
+
+import pytest
+
+from N2 import Graph, import_catalog
+
+
+def _write(path, text: str) -> str:
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return _write(tmp_path / 'catalogo.csv',
+                  "nome,magnitude,constelacao,x,y,z\n"
+                  "Sol,-26.7,,0,0,0\n"
+                  "Sírius,-1.46,Cão Maior,1,2,3\n"
+                  "sirius,9.9,Repetida,,,\n"
+                  "Vega,0.03,Lira,,,\n")
+
+
+def test_import_csv_catalog_and_edges(catalog, tmp_path, capsys):
+    edges = _write(tmp_path / 'arestas.csv',
+                   "origem,destino,peso\n"
+                   "Sol,SIRIUS,2.5\n"
+                   "Sírius,Sol,7\n"      # Mesma aresta (não-direcionado): ignorada
+                   "Sol,Vega,0\n"
+                   "Vega,Sol,4\n"        # Repetida também quando a primeira tem peso 0
+                   "Sol,Plutão,1\n")
+    graph = Graph.from_catalog(catalog, edges, reporter=None)
+
+    assert graph.vertex_count == 3
+    assert graph.index_of('sirius') == 1
+    assert graph.vertices[1]['coordenadas'] == (1.0, 2.0, 3.0)
+    assert graph.vertices[2].get('coordenadas') is None
+    assert graph.get_edge_info(0, 1) == 2.5
+    assert graph.get_edge_info(1, 0) == 2.5
+    assert graph.get_edge_info(2, 0) == 0.0
+    assert graph.list_graph_info().edge_count == 2
+
+
+def test_import_reports_duplicates(catalog, tmp_path):
+    class Reporter:
+        def message(self, text):
+            self.text = text
+
+    edges = _write(tmp_path / 'arestas.jsonl', "\n".join(json.dumps(e) for e in [
+        {'source': 'Sol', 'target': 'Vega', 'weight': 1},
+        {'source': 'Vega', 'target': 'Sol', 'weight': 3},
+    ]))
+    reporter = Reporter()
+    graph = import_catalog(catalog, edges, reporter=reporter)
+    assert "1 arestas repetidas" in reporter.text
+    assert graph.list_graph_info().edge_count == 1
+    assert graph.get_edge_info(0, 2) == 1.0
+
+
+def test_blank_weight_rejected_on_weighted_graph(catalog, tmp_path):
+    edges = _write(tmp_path / 'arestas.csv', "origem,destino,peso\nSol,Vega,1\nSol,Sírius,\n")
+    with pytest.raises(ValueError, match='aresta 2'):
+        import_catalog(catalog, edges)
+
+    graph = import_catalog(catalog, edges, is_weighted=False)
+    assert graph.get_edge_info(0, 1) == 1.0
+
+
+@pytest.mark.parametrize('row', ['Sol,1,,1,2,', 'Sol,1,,a,b,c'])
+def test_coordinates_must_have_three_numbers(tmp_path, row):
+    catalog = _write(tmp_path / 'catalogo.csv', f"nome,magnitude,constelacao,x,y,z\nVega,0,,,,\n{row}\n")
+    with pytest.raises(ValueError, match='registro 2'):
+        import_catalog(catalog)
+
+
+def test_coordinates_list_arity_in_json_lines(tmp_path):
+    catalog = _write(tmp_path / 'catalogo.jsonl', json.dumps({'nome': 'Vega', 'coordenadas': [1, 2]}))
+    with pytest.raises(ValueError, match='3 valores'):
+        import_catalog(catalog)
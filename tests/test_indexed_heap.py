@@ -0,0 +1,58 @@
+"""Heap indexado: ordem de saída, decrease_key e invariantes de posição contra um modelo simples."""
+import random
+
+from N2 import Graph
+
+IndexedMinHeap = Graph.IndexedMinHeap
+
+
+def _assert_consistent(heap: IndexedMinHeap) -> None:
+    for index, item in enumerate(heap.heap):
+        assert heap.position[item] == index
+        if index:
+            assert heap.keys[heap.heap[(index - 1) >> 1]] <= heap.keys[item]
+    assert sum(p != -1 for p in heap.position) == len(heap)
+
+
+def test_random_operations_match_model():
+    rng = random.Random(9)
+    n = 200
+    heap = IndexedMinHeap(n)
+    model = {}
+    for _ in range(5000):
+        op = rng.random()
+        item = rng.randrange(n)
+        if op < 0.5:
+            key = rng.uniform(0, 100)
+            heap.push_or_decrease(item, key)
+            if item not in model or key < model[item]:
+                model[item] = key
+        elif model:
+            key, popped = heap.pop()
+            assert key == min(model.values())
+            assert model.pop(popped) == key
+            assert popped not in heap
+        assert len(heap) == len(model)
+        assert heap.peek_key() == (min(model.values()) if model else float('inf'))
+    _assert_consistent(heap)
+
+
+def test_decrease_key_moves_item_to_the_top():
+    heap = IndexedMinHeap(5)
+    for item, key in enumerate([5.0, 3.0, 4.0, 1.0, 2.0]):
+        heap.push(item, key)
+    heap.decrease_key(0, 0.5)
+    heap.push_or_decrease(2, 9.0)  # Prioridade maior: ignorada
+    _assert_consistent(heap)
+    assert [heap.pop() for _ in range(5)] == [(0.5, 0), (1.0, 3), (2.0, 4), (3.0, 1), (4.0, 2)]
+    assert heap.is_empty()
+
+
+def test_clear_reuses_the_vectors():
+    heap = IndexedMinHeap(4)
+    heap.push(1, 2.0)
+    heap.push(3, 1.0)
+    heap.clear()
+    assert heap.is_empty() and 1 not in heap and 3 not in heap
+    heap.push(3, 7.0)
+    assert heap.pop() == (7.0, 3)
@@ -0,0 +1,45 @@
+"""Johnson: potenciais em cache por versão e uma única linha reponderada por consulta."""
+import pytest
+
+from N2 import Graph
+
+
+def _graph() -> Graph:
+    graph = Graph(is_directed=True, is_weighted=True, storage='sparse')
+    for name in 'ABCD':
+        graph.add_vertex({'nome': name})
+    graph.add_edge(0, 1, 2.0)
+    graph.add_edge(1, 2, -1.0)
+    graph.add_edge(0, 2, 3.0)
+    graph.add_edge(2, 3, 1.0)
+    return graph
+
+
+def test_matrices_handle_negative_weights():
+    graph = _graph()
+    dist, next_hop = graph.johnson_matrices()
+    assert dist[0] == [0.0, 2.0, 1.0, 2.0]
+    assert next_hop[0] == [0, 1, 1, 1]
+    assert dist[3] == [float('inf')] * 3 + [0.0]
+
+
+def test_reweighting_is_cached_until_the_graph_changes():
+    graph = _graph()
+    reweighting = graph._johnson_reweighting()
+    graph.johnson_all_paths(0, 3)
+    assert graph._johnson_reweighting() is reweighting
+
+    graph.update_edge(2, 3, 4.0)
+    assert graph._johnson_reweighting() is not reweighting
+    assert graph.johnson_all_paths(0, 3).costs == [pytest.approx(5.0)]
+
+
+def test_negative_cycle_returns_no_paths():
+    graph = _graph()
+    graph.add_edge(2, 0, -5.0)
+    assert graph.johnson_matrices() is None
+    assert graph.johnson_all_paths(0, 3).paths == []
+
+
+def test_johnson_matches_dfs(search_graph, assert_optimal_paths):
+    assert_optimal_paths(search_graph, 'johnson_all_paths')
@@ -0,0 +1,82 @@
+"""Índice de landmarks (ALT): escolha dos landmarks, limites e persistência."""
+import random
+
+import pytest
+
+from N2 import Graph
+
+
+def _path_graph(n: int, is_directed: bool = False) -> Graph:
+    graph = Graph(is_directed=is_directed, is_weighted=True)
+    for i in range(n):
+        graph.add_vertex({'nome': f"V{i}"})
+    for i in range(n - 1):
+        graph.add_edge(i, i + 1, 1.0 + i)
+    return graph
+
+
+def _random_graph(n: int, m: int, is_directed: bool, seed: int) -> Graph:
+    rng = random.Random(seed)
+    graph = Graph(is_directed=is_directed, is_weighted=True)
+    for i in range(n):
+        graph.add_vertex({'nome': f"V{i}"})
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            graph.add_edge(u, v, rng.randint(1, 9))
+    return graph
+
+
+def test_landmarks_skip_removed_slots():
+    graph = _path_graph(6)
+    for v in (3, 4, 5):
+        graph.remove_vertex(v)
+    for seed in range(10):
+        index = graph.build_landmark_index(8, seed)
+        assert set(index.landmarks) == {0, 1, 2}
+
+
+def test_undirected_bound_uses_both_sides_of_landmark():
+    graph = _path_graph(5)
+    index = graph.build_landmark_index(1, 0)
+    landmark = index.landmarks[0]
+    row = index.dist_from[0]
+    h = index.heuristic(landmark)
+    for v in range(5):
+        assert h(v) == pytest.approx(row[v])  # |d(L, L) - d(L, v)| = d(L, v)
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_alt_matches_dijkstra(is_directed):
+    graph = _random_graph(40, 120, is_directed, seed=3)
+    index = graph.build_landmark_index(4, 1)
+    for target in range(0, 40, 7):
+        h = index.heuristic(target)
+        dist = graph._dijkstra_row(target, reverse=True)[0]
+        for v in range(40):
+            assert h(v) <= dist[v] + 1e-9
+    for start in range(0, 40, 5):
+        dist = graph._dijkstra_row(start)[0]
+        for target in range(40):
+            assert graph.alt_shortest_paths(start, target).cost == pytest.approx(dist[target])
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_landmark_index_is_saved_with_graph(tmp_path, is_directed):
+    graph = _random_graph(20, 50, is_directed, seed=5)
+    index = graph.build_landmark_index(3, 2)
+    path = str(tmp_path / 'rede.n2')
+    graph.save(path)
+
+    loaded = Graph.load(path)
+    restored = loaded.landmark_index()
+    assert restored.landmarks == index.landmarks
+    assert [list(r) for r in restored.dist_from] == [list(r) for r in index.dist_from]
+    assert [list(r) for r in restored.dist_to] == [list(r) for r in index.dist_to]
+
+    loaded.add_edge(0, 1, 0.5)
+    assert loaded.landmark_index() is None
+
+
+def test_alt_all_paths_match_dfs(search_graph, assert_optimal_paths):
+    assert_optimal_paths(search_graph, 'alt_all_paths')
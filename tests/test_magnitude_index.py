@@ -0,0 +1,96 @@
+"""Índice ordenado de magnitudes (N2 e n1) conferido contra uma ordenação por força bruta."""
+import random
+from array import array
+
+from N2 import Graph, MagnitudeIndex
+from n1_grafos import Graph as N1Graph
+
+
+def _expected(graph: Graph):
+    column = graph.vertices.magnitude
+    return sorted((column[i], i) for i, _ in graph.live_vertices() if column[i] == column[i])
+
+
+def test_index_follows_vertex_edits():
+    rng = random.Random(1)
+    graph = Graph(is_directed=False, is_weighted=True, storage='sparse')
+
+    def magnitude():
+        return rng.choice([None, 'x', round(rng.uniform(-2, 6), 1)])
+
+    for i in range(150):
+        graph.add_vertex({'nome': f"S{i}", 'magnitude': magnitude()})
+    graph.find_brightest_star()  # Monta o índice; daqui em diante ele é mantido a cada escrita
+
+    for step in range(800):
+        live = [v for v, _ in graph.live_vertices()]
+        op = rng.random()
+        if op < 0.3 or not live:
+            graph.add_vertex({'nome': f"N{step}", 'magnitude': magnitude()})
+        elif op < 0.5:
+            graph.remove_vertex(rng.choice(live))
+        elif op < 0.85:
+            graph.update_vertex(rng.choice(live), {'magnitude': magnitude()})
+        elif op < 0.95:
+            graph.vertices[rng.choice(live)].pop('magnitude', None)
+        else:
+            graph.compact()
+
+        pairs = _expected(graph)
+        index = graph.vertices.magnitude_index()
+        assert graph.brightest_stars(len(pairs) + 3) == [v for _, v in pairs], step
+        if pairs:
+            assert graph.find_brightest_star() == (pairs[0][1], pairs[0][0])
+            faintest = pairs[-1][0]
+            assert index.faintest() == (min(v for m, v in pairs if m == faintest), faintest)
+            low, high = sorted(rng.uniform(-3, 7) for _ in range(2))
+            assert graph.stars_in_magnitude_range(low, high) == [v for m, v in pairs if low <= m <= high]
+        else:
+            assert index.brightest() is None and index.faintest() is None
+
+
+def test_ties_are_ordered_by_index():
+    index = MagnitudeIndex(array('d', [2.0, 1.0, 2.0, float('nan'), 1.0]))
+    assert index.top(5) == [1, 4, 0, 2]
+    index.discard(4, 1.0)
+    index.add(3, 1.0)
+    assert index.between(1.0, 1.0) == [1, 3]
+    assert index.faintest() == (0, 2.0)
+
+
+def test_n1_queries_match_linear_scan():
+    rng = random.Random(2)
+    graph = N1Graph(is_directed=True, is_weighted=False)
+
+    def magnitude():
+        return rng.choice([None, "x", "0.5", round(rng.uniform(-2, 6), 1)])
+
+    def expected():
+        pairs = []
+        for i, v in graph.vertices_vivos():
+            try:
+                pairs.append((float(v.get("magnitude")), i))
+            except (TypeError, ValueError):
+                pass
+        return sorted(pairs)
+
+    for i in range(60):
+        graph.add_vertex({"nome": f"S{i}", "magnitude": magnitude()})
+    for step in range(600):
+        live = [i for i, _ in graph.vertices_vivos()]
+        op = rng.random()
+        if op < 0.3 or not live:
+            graph.add_vertex({"nome": f"N{step}", "magnitude": magnitude()})
+        elif op < 0.45:
+            graph.remove_vertex(rng.choice(live))
+        elif op < 0.9:
+            graph.update_vertex(rng.choice(live), {"magnitude": magnitude()})
+        else:
+            graph.compact()
+        pairs = expected()
+        assert graph.brightest_stars(len(pairs) + 1) == [i for _, i in pairs]
+        if pairs:
+            assert graph.find_brightest_star() == pairs[0][1]
+            faintest = pairs[-1][0]
+            assert graph.find_largest_star() == min(i for m, i in pairs if m == faintest)
+            assert graph.stars_in_magnitude_range(0.0, 2.0) == [i for m, i in pairs if 0.0 <= m <= 2.0]
@@ -0,0 +1,54 @@
+"""n1_grafos: índice de nomes conferido contra uma varredura linear."""
+import contextlib
+import io
+import random
+
+import pytest
+
+from n1_grafos import Graph, normalizar_nome
+
+
+@pytest.fixture
+def quiet():
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def _linear_index_of(graph: Graph, nome: str) -> int:
+    chave = normalizar_nome(nome)
+    for i, v in graph.vertices_vivos():
+        if normalizar_nome(v.get("nome", "")) == chave:
+            return i
+    return -1
+
+
+def test_index_of_with_repeated_names(quiet):
+    rng = random.Random(4)
+    graph = Graph(is_directed=True, is_weighted=False)
+    names = ["Vênus", "venus", "Marte", "MARTE ", "Sol", "Terra"]
+    for step in range(1500):
+        live = [i for i, _ in graph.vertices_vivos()]
+        op = rng.random()
+        if op < 0.4 or not live:
+            graph.add_vertex({"nome": rng.choice(names), "magnitude": None})
+        elif op < 0.7:
+            graph.remove_vertex(rng.choice(live))
+        elif op < 0.95:
+            graph.update_vertex(rng.choice(live), {"nome": rng.choice(names)})
+        else:
+            graph.compact()
+        for nome in names + ["Plutão"]:
+            assert graph.index_of(nome) == _linear_index_of(graph, nome), step
+
+
+def test_index_stays_incremental_with_repeated_names(quiet, monkeypatch):
+    graph = Graph(is_directed=True, is_weighted=False)
+    for _ in range(3):
+        graph.add_vertex({"nome": "Sol"})
+    monkeypatch.setattr(graph, "_reconstruir_indice_nomes", lambda: pytest.fail("reconstrução completa"))
+    graph.remove_vertex(0)
+    assert graph.index_of("sol") == 1
+    graph.update_vertex(1, {"nome": "Lua"})
+    assert (graph.index_of("sol"), graph.index_of("lua")) == (2, 1)
+
+
@@ -0,0 +1,81 @@
+"""Arestas de peso zero e negativo: presença pela lista explícita e Bellman-Ford/SPFA."""
+import pytest
+
+from N2 import Graph, STORAGE_BACKENDS
+
+
+def _graph(storage: str) -> Graph:
+    graph = Graph(is_directed=True, is_weighted=True, storage=storage)
+    for name in 'ABCD':
+        graph.add_vertex({'nome': name})
+    return graph
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_zero_and_negative_edges_exist(storage):
+    graph = _graph(storage)
+    graph.add_edge(0, 1, 0.0)
+    graph.add_edge(1, 2, -1.5)
+
+    assert graph.get_edge_info(0, 1) == 0.0
+    assert graph.get_edge_info(1, 2) == -1.5
+    assert graph.get_edge_info(2, 3) is None
+    assert graph.update_edge(0, 1, 0.0)
+    assert sorted(graph._out_arcs(0)) == [(1, 0.0)]
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_bellman_ford_and_spfa_agree_with_negative_weights(storage):
+    graph = _graph(storage)
+    graph.add_edge(0, 1, 0.0)
+    graph.add_edge(1, 2, -1.0)
+    graph.add_edge(0, 2, -1.0)
+    graph.add_edge(2, 3, 2.0)
+
+    for search in (graph.bellman_ford_all_paths, graph.spfa_all_paths, graph.johnson_all_paths):
+        result = search(0, 3)
+        assert sorted(result.paths) == [[0, 1, 2, 3], [0, 2, 3]]
+        assert result.costs == [1.0, 1.0]
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_negative_cycle_is_detected(storage):
+    graph = _graph(storage)
+    graph.add_edge(0, 1, 1.0)
+    graph.add_edge(1, 2, -1.0)
+    graph.add_edge(2, 1, 0.5)
+
+    assert graph.bellman_ford_all_paths(0, 2).paths == []
+    assert graph.spfa_all_paths(0, 2).paths == []
+
+    graph.update_edge(2, 1, 1.0)  # Ciclo passa a custar 0
+    assert graph.bellman_ford_all_paths(0, 2).paths == [[0, 1, 2]]
+    assert graph.spfa_all_paths(0, 2).paths == [[0, 1, 2]]
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_zero_arcs_indexed_by_source(storage):
+    graph = _graph(storage)
+    graph.add_edge(0, 1, 0.0)
+    graph.add_edge(0, 2, 0.0)
+    graph.add_edge(3, 1, 0.0)
+    graph.add_edge(0, 3, 1.0)
+
+    assert sorted(graph._out_arcs(0)) == [(1, 0.0), (2, 0.0), (3, 1.0)]
+    assert sorted(graph._out_arcs(3)) == [(1, 0.0)]
+    assert list(graph._out_arcs(1)) == []
+
+    graph.update_edge(0, 2, 2.0)
+    graph.remove_vertex(1)
+    assert sorted(graph._out_arcs(0)) == [(2, 2.0), (3, 1.0)]
+    assert list(graph._out_arcs(3)) == []
+    assert graph._edges._zero == {}
+
+    graph.add_edge(3, 2, 0.0)
+    graph.compact()
+    assert sorted(graph._out_arcs(2)) == [(1, 0.0)]
+
+
+@pytest.mark.parametrize('search', ['bellman_ford_all_paths', 'spfa_all_paths'])
+def test_bellman_ford_family_matches_dfs(search_graph, assert_optimal_paths, search):
+    assert_optimal_paths(search_graph, search)
@@ -0,0 +1,46 @@
+"""Buscas de origem única distribuídas entre processos: mesmas tabelas da execução sequencial."""
+import pytest
+
+from N2 import parallel_shortest_paths
+
+
+@pytest.fixture
+def graph(make_graph):
+    graph = make_graph('sparse', True, seed=5, n=12, m=40)
+    graph.remove_vertex(4)
+    return graph
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_dijkstra_rows_match_sequential(graph, workers):
+    dist, next_hop = parallel_shortest_paths(graph, workers=workers)
+    for source in range(len(graph.vertices)):
+        expected = graph._dijkstra_row(source)[0]
+        assert dist[source] == expected
+        for target, d in enumerate(expected):
+            if d == float('inf'):
+                assert next_hop[source][target] == -1
+
+
+def test_bfs_rows_count_hops(graph):
+    sources = [0, 3, 7]
+    dist, _ = parallel_shortest_paths(graph, sources, algorithm='bfs', workers=2)
+    assert len(dist) == len(sources)
+    for row, source in zip(dist, sources):
+        for target in range(len(graph.vertices)):
+            if target != 4:
+                assert row[target] == graph.bfs_shortest_paths(source, target).cost
+
+
+def test_parallel_all_pairs_fills_the_cache(graph):
+    dist, next_hop = graph.parallel_all_pairs(workers=2)
+    assert graph._apsp_cache == (graph._version, dist, next_hop)
+    fresh = graph.floyd_warshall_matrices(use_numpy=False)[0]
+    assert dist == fresh
+    path = graph.floyd_warshall_all_paths(0, 11)
+    assert all(c == pytest.approx(fresh[0][11]) for c in path.costs)
+
+
+def test_unknown_algorithm_is_rejected(graph):
+    with pytest.raises(ValueError):
+        parallel_shortest_paths(graph, algorithm='astar')
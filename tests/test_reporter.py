@@ -0,0 +1,51 @@
+"""Modo silencioso: o Graph devolve resultados tipados e só o ConsoleReporter imprime."""
+from N2 import ConsoleReporter, Graph, GraphInfo
+
+
+def _network() -> Graph:
+    graph = Graph(is_directed=False, is_weighted=True)
+    graph.add_vertex({'nome': 'Sol', 'magnitude': -26.74, 'constelacao': 'Sistema Solar'})
+    graph.add_vertex({'nome': 'Terra', 'constelacao': 'Sistema Solar'})
+    graph.add_vertex({'nome': 'Rigel', 'magnitude': 0.12, 'constelacao': 'Órion'})
+    graph.add_vertex({'nome': 'Sem grupo'})
+    graph.add_edge(0, 1, 1.0)
+    graph.add_edge(0, 2, 5.0)
+    graph.add_edge(1, 3, 0.0)
+    return graph
+
+
+def test_quiet_graph_prints_nothing(capsys):
+    graph = _network()
+    graph.list_graph_info()
+    graph.count_by_constellation()
+    graph.listar_todas_estrelas()
+    graph.list_most_connected_stars()
+    graph.dijkstra_all_paths(0, 2)
+    assert capsys.readouterr().out == ''
+
+
+def test_typed_results():
+    graph = _network()
+    graph.remove_vertex(2)
+
+    assert graph.list_graph_info() == GraphInfo(3, 2, False, True, [(0, 'Sol'), (1, 'Terra'), (3, 'Sem grupo')])
+    assert graph.count_by_constellation() == {'Não definido': 1, 'Sistema Solar': 2}
+    assert graph.listar_todas_estrelas() == [(0, 'Sol', -26.74, 'Sistema Solar'),
+                                             (1, 'Terra', None, 'Sistema Solar'),
+                                             (3, 'Sem grupo', None, None)]
+    assert graph.list_most_connected_stars() == [(2, 1, 'Terra'), (1, 3, 'Sem grupo'), (1, 0, 'Sol')]
+
+    paths, costs = graph.dijkstra_all_paths(0, 1)
+    assert (paths, costs) == ([[0, 1]], [1.0])
+
+
+def test_console_reporter_formats_results(capsys):
+    graph = _network()
+    reporter = ConsoleReporter()
+    reporter.constellation_counts(graph.count_by_constellation())
+    reporter.most_connected(graph.list_most_connected_stars(), limit=1)
+    reporter.star_list([])
+    out = capsys.readouterr().out
+    assert "  Sistema Solar: 2 objeto(s)" in out
+    assert "[ 2] Terra: 2 conexões" in out
+    assert "Nenhum vértice encontrado no grafo." in out
@@ -0,0 +1,35 @@
+"""Consultas em lote: uma árvore por origem distinta, custos e caminhos iguais aos do DFS."""
+import pytest
+
+
+def test_batch_matches_dfs(search_graph, dfs_reference, live_pairs):
+    pairs = live_pairs(search_graph)
+    batch = search_graph.route_batch(pairs)
+    assert len(batch) == len(pairs)
+    assert batch.searches == len({start for start, _ in pairs})
+
+    for i, (start, target) in enumerate(pairs):
+        best, optimal, _ = dfs_reference(search_graph, start, target)
+        if best is None:
+            assert batch.cost(i) == float('inf')
+            assert batch.path(i) == [] and batch.paths(i).count() == 0
+            continue
+        assert batch.cost(i) == pytest.approx(best)
+        assert {tuple(p) for p in batch.paths(i)} == optimal
+        assert tuple(batch.path(i)) in optimal
+
+
+def test_repeated_pairs_share_one_search(make_graph):
+    graph = make_graph('sparse', False, seed=2)
+    pairs = [(0, 3), (0, 5), (0, 3), (4, 1), (4, 4)]
+    batch = graph.route_batch(pairs)
+    assert batch.searches == 2
+    assert batch.pairs == pairs
+    assert batch.cost(0) == batch.cost(2)
+    assert batch.cost(4) == 0.0 and batch.path(4) == [4]
+
+
+def test_invalid_pair_is_rejected(make_graph):
+    graph = make_graph('dense', True, seed=0)
+    with pytest.raises(ValueError):
+        graph.route_batch([(0, 1), (0, 7)])
@@ -0,0 +1,50 @@
+"""Snapshot binário: save/load devolve os mesmos vértices, arestas e lápides."""
+import pytest
+
+from N2 import Graph, STORAGE_BACKENDS
+
+
+def _sample_graph(storage: str, is_directed: bool) -> Graph:
+    graph = Graph(is_directed=is_directed, is_weighted=True, storage=storage)
+    graph.add_vertex({'nome': 'Sol', 'magnitude': -26.74, 'constelacao': 'Sistema Solar',
+                      'distancia_ua': 0.0, 'coordenadas': (0.0, 0.0, 0.0)})
+    graph.add_vertex({'nome': 'b'})
+    graph.add_vertex({'nome': 'Vênus', 'magnitude': None, 'constelacao': None, 'tipo': 'planeta'})
+    graph.add_vertex({'nome': 'Removido', 'magnitude': 3.0})
+    graph.add_vertex({'nome': 'Texto', 'magnitude': '0.42', 'distancia_ua': 1.0})
+    graph.add_edge(0, 1, 2.5)
+    graph.add_edge(1, 2, 0.0)
+    graph.add_edge(2, 4, -1.0)
+    graph.add_edge(3, 0, 1.0)
+    graph.remove_vertex(3)
+    return graph
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_round_trip_preserves_vertices_and_edges(tmp_path, storage, is_directed):
+    graph = _sample_graph(storage, is_directed)
+    path = str(tmp_path / 'rede.n2')
+    graph.save(path)
+    loaded = Graph.load(path)
+
+    assert [None if v is None else dict(v) for v in loaded.vertices] == \
+        [None if v is None else dict(v) for v in graph.vertices]
+    assert dict(loaded.vertices[1]) == {'nome': 'b'}
+    assert sorted(loaded._edges) == sorted(graph._edges)
+    assert loaded._free == graph._free
+    assert loaded.is_directed == is_directed
+    assert loaded.index_of('venus') == 2
+    assert loaded.get_edge_info(1, 2) == 0.0
+
+
+def test_loaded_graph_accepts_edits(tmp_path):
+    graph = _sample_graph('sparse', False)
+    path = str(tmp_path / 'rede.n2')
+    graph.save(path)
+    loaded = Graph.load(path)
+
+    assert loaded.add_vertex({'nome': 'Novo'}) == 3  # Reaproveita a lápide
+    loaded.add_edge(3, 0, 4.0)
+    assert loaded.get_edge_info(0, 3) == 4.0
+    assert loaded.dijkstra_shortest_paths(3, 1).cost == pytest.approx(6.5)
@@ -0,0 +1,55 @@
+"""Backends de armazenamento: congelar em CSR e voltar mantém o backend e as arestas."""
+import pytest
+
+from N2 import Graph, STORAGE_BACKENDS
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_thaw_restores_original_backend(storage):
+    graph = Graph(is_directed=True, is_weighted=True, storage=storage)
+    for i in range(5):
+        graph.add_vertex({'nome': f"V{i}"})
+    graph.add_edge(0, 1, 2.0)
+    graph.add_edge(1, 2, 0.5)
+    graph.add_edge(3, 4, 0.0)
+    graph.remove_vertex(4)
+
+    graph.freeze()
+    assert graph._storage.kind == 'csr'
+    graph.add_edge(2, 3, 1.5)  # Qualquer alteração descongela
+
+    assert isinstance(graph._storage, STORAGE_BACKENDS[storage])
+    assert graph.storage_kind == storage
+    assert sorted(graph._neighbors(0)) == [(1, 2.0)]
+    assert sorted(graph._neighbors(1)) == [(2, 0.5)]
+    assert sorted(graph._neighbors(2)) == [(3, 1.5)]
+    assert graph.dijkstra_shortest_paths(0, 3).cost == pytest.approx(4.0)
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_adjacency_matrix_is_read_only_snapshot(storage):
+    graph = Graph(is_directed=True, is_weighted=True, storage=storage)
+    for i in range(3):
+        graph.add_vertex({'nome': f"V{i}"})
+    graph.add_edge(0, 1, 2.0)
+
+    matrix = graph.adjacency_matrix
+    assert matrix == ((0.0, 2.0, 0.0), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+    with pytest.raises(TypeError):
+        matrix[1][2] = 5.0
+
+    graph.update_edge(0, 1, 3.0)
+    assert matrix[0][1] == 2.0
+    assert graph.adjacency_matrix[0][1] == 3.0
+
+
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_backends_store_the_same_arcs(make_graph, is_directed):
+    dense = make_graph('dense', is_directed, seed=4)
+    for storage in ['csr'] + sorted(STORAGE_BACKENDS):
+        graph = make_graph(storage, is_directed, seed=4)
+        if storage == 'csr':
+            graph.freeze()
+        for v in range(7):
+            assert sorted(graph._neighbors(v)) == sorted(dense._neighbors(v)), (storage, v)
+            assert sorted(graph._in_neighbors(v)) == sorted(dense._in_neighbors(v)), (storage, v)
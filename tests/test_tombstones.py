@@ -0,0 +1,84 @@
+"""Lápides e compact(): índices estáveis na remoção e renumeração consistente depois."""
+import pytest
+
+from N2 import Graph, STORAGE_BACKENDS
+
+
+def _chain(storage: str, n: int = 6) -> Graph:
+    graph = Graph(is_directed=True, is_weighted=True, storage=storage)
+    for i in range(n):
+        graph.add_vertex({'nome': f"V{i}", 'magnitude': float(i)})
+    for i in range(n - 1):
+        graph.add_edge(i, i + 1, 1.0)
+    graph.add_edge(0, 5, 0.0)
+    return graph
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_remove_keeps_other_indices(storage):
+    graph = _chain(storage)
+    assert graph.remove_vertex(2)
+
+    assert graph.vertices[2] is None
+    assert not graph.is_live(2) and graph.is_live(3)
+    assert not graph.is_live(-1) and not graph.is_live(6)
+    assert graph.vertex_count == 5
+    assert graph.vertices[3]['nome'] == 'V3'
+    assert graph.index_of('V3') == 3 and graph.index_of('V2') == -1
+    assert graph.get_edge_info(1, 2) is None and graph.get_edge_info(3, 4) == 1.0
+    assert graph.get_edge_info(0, 5) == 0.0
+    assert not graph.remove_vertex(2)  # Lápide não é removida duas vezes
+    assert not graph.add_edge(1, 2, 1.0)
+    assert graph.dijkstra_all_paths(0, 4).paths == []
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_add_vertex_reuses_free_slot(storage):
+    graph = _chain(storage)
+    graph.remove_vertex(4)
+    assert graph.add_vertex({'nome': 'Novo'}) == 4
+    assert graph.get_edge_info(3, 4) is None  # O slot volta sem as arestas antigas
+    assert graph.index_of('novo') == 4
+    assert len(graph.vertices) == 6
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+def test_compact_renumbers_vertices_and_edges(storage):
+    graph = _chain(storage)
+    graph.add_edge(1, 3, 5.0)
+    graph.remove_vertex(2)
+    graph.remove_vertex(4)
+
+    mapping = graph.compact()
+
+    assert mapping == [0, 1, -1, 2, -1, 3]
+    assert len(graph.vertices) == graph.vertex_count == 4
+    assert [v['nome'] for _, v in graph.live_vertices()] == ['V0', 'V1', 'V3', 'V5']
+    assert [graph.index_of(f"V{i}") for i in (0, 1, 3, 5)] == [0, 1, 2, 3]
+    assert sorted(graph._edges) == [(0, 1, 1.0), (0, 3, 0.0), (1, 2, 5.0)]
+    assert graph.dijkstra_shortest_paths(0, 2).cost == pytest.approx(6.0)
+    assert graph.find_brightest_star() == (0, 0.0)
+    assert graph.stars_in_magnitude_range(2.5, 9.0) == [2, 3]
+    assert graph.add_vertex({'nome': 'Novo'}) == 4  # Sem lápides: cresce no fim
+
+
+def test_compact_without_tombstones_is_identity():
+    graph = _chain('sparse')
+    version = graph._version
+    assert graph.compact() == list(range(6))
+    assert graph._version == version
+
+
+@pytest.mark.parametrize('storage', sorted(STORAGE_BACKENDS))
+@pytest.mark.parametrize('is_directed', [False, True])
+def test_compact_preserves_search_results(storage, is_directed, make_graph, dfs_reference, live_pairs):
+    graph = make_graph(storage, is_directed, seed=11, n=8, m=20)
+    graph.remove_vertex(2)
+    graph.remove_vertex(5)
+    before = {pair: dfs_reference(graph, *pair)[:2] for pair in live_pairs(graph)}
+
+    mapping = graph.compact()
+    for (start, target), (best, optimal) in before.items():
+        result = graph.dijkstra_all_paths(mapping[start], mapping[target])
+        assert {tuple(mapping.index(v) for v in p) for p in result.paths} == optimal
+        assert all(c == pytest.approx(best) for c in result.costs)
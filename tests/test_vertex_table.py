@@ -0,0 +1,72 @@
+"""Tabela colunar de vértices: visões dict-like, colunas opcionais, extras e lápides."""
+import pytest
+
+from N2 import VertexTable
+from n1_grafos import TabelaVertices
+
+
+def _table() -> VertexTable:
+    table = VertexTable()
+    table.append({'nome': 'Sol', 'magnitude': -26.7, 'constelacao': None})
+    table.append({'nome': 'Sírius', 'magnitude': -1.46, 'constelacao': 'Cão Maior', 'tipo': 'estrela'})
+    table.append({'nome': 'Vega', 'magnitude': 0.03, 'constelacao': 'Lira'})
+    return table
+
+
+def test_views_read_and_write_columns():
+    table = _table()
+    sirius = table[1]
+    assert dict(sirius) == {'nome': 'Sírius', 'magnitude': -1.46, 'constelacao': 'Cão Maior',
+                            'tipo': 'estrela'}
+    assert table[0]['constelacao'] is None
+    sirius.update({'magnitude': -1.5, 'constelacao': 'Lira'})
+    assert table.magnitude[1] == -1.5
+    assert table.constellation[1] == table.constellation[2]  # Mesmo código de constelação
+    with pytest.raises(KeyError):
+        table[0]['tipo']
+    assert table[0].get('tipo', 'N/A') == 'N/A'
+
+
+def test_values_outside_the_column_types_go_to_extras():
+    table = _table()
+    table[2]['magnitude'] = '0.42'
+    assert table[2]['magnitude'] == '0.42'
+    assert table.magnitude[2] != table.magnitude[2]  # Coluna volta para NaN
+    table[2]['magnitude'] = 0.5
+    assert 2 not in table.extras and table[2]['magnitude'] == 0.5
+    del table[1]['tipo']
+    assert 1 not in table.extras
+
+
+def test_optional_columns_are_allocated_on_first_use():
+    table = _table()
+    assert table.distance is None and table.coords is None
+    table[1]['coordenadas'] = (1.0, 2.0, 3.0)
+    table[2]['distancia_ua'] = 4.0
+    assert len(table.coords) == 3 * len(table) and len(table.distance) == len(table)
+    assert table[1]['coordenadas'] == (1.0, 2.0, 3.0)
+    assert table[0].get('coordenadas') is None and 'coordenadas' not in table[0]
+    table[0]['coordenadas'] = (1.0, 2.0)  # Não cabe na coluna: fica nos extras
+    assert table[0]['coordenadas'] == (1.0, 2.0)
+
+
+def test_tombstones_and_compact():
+    table = _table()
+    table[1] = None
+    assert table[1] is None and not table.is_live(1)
+    assert table == [{'nome': 'Sol', 'magnitude': -26.7, 'constelacao': None}, None,
+                     {'nome': 'Vega', 'magnitude': 0.03, 'constelacao': 'Lira'}]
+    assert table.count_constellations('Desconhecida') == {'Desconhecida': 1, 'Lira': 1}
+    table.compact([0, 2])
+    assert len(table) == 2 and table[1]['nome'] == 'Vega' and table.extras == {}
+
+
+def test_n1_table_keeps_portuguese_names():
+    tabela = TabelaVertices()
+    tabela.append({'nome': 'Sol', 'magnitude': -26.7})
+    tabela.append({'nome': 'Lua', 'constelacao': 'Nenhuma'})
+    tabela[0] = None
+    assert not tabela.vivo(0) and tabela.vivo(1)
+    assert tabela.contar_constelacoes('Desconhecida') == {'Nenhuma': 1}
+    tabela.compactar([1])
+    assert tabela[0]['nome'] == 'Lua'